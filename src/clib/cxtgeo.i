@@ -1,9 +1,16 @@
-%module cxtgeo
+%module(threads="1") cxtgeo
 %{
 #define SWIG_FILE_WITH_INIT
 #include <libxtg.h>
 %}
 
+/* Keep the GIL by default; release it only for routines that are thread safe and
+   work on input arrays only, so they can run in a Python thread pool */
+%nothread;
+%thread grd3d_get_randomline;
+%thread cube_get_randomline;
+%thread surf_get_zv_from_xyv;
+
 typedef uint8_t mbool;
 
 %include typemaps.i
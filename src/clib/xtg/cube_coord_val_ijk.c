@@ -60,7 +60,7 @@ cube_coord_val_ijk(int i,
 
     /* locals */
     int ier1, ier2;
-    static double xcoord = 0.0, ycoord = 0.0;
+    static XTG_THREAD_LOCAL double xcoord = 0.0, ycoord = 0.0;
 
     /* find coordinates: */
 
@@ -65,10 +65,10 @@ cube_ijk_from_xyz(int *i,
                   int flag)
 {
     /* locals */
-    static int ii = 0, jj = 0, ier = 0;
+    static XTG_THREAD_LOCAL int ii = 0, jj = 0, ier = 0;
     int kk;
     double pz, usex, usey, usez;
-    static double rrx = 0.0, rry = 0.0;
+    static XTG_THREAD_LOCAL double rrx = 0.0, rry = 0.0;
 
     usex = x;
     usey = y;
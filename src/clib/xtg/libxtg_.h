@@ -8,6 +8,13 @@
 
 #define FORTRANRECLEN 4000 /* Max record length of Fortran files */
 
+/* for function static state that must be private to each thread */
+#if defined(_MSC_VER)
+#define XTG_THREAD_LOCAL __declspec(thread)
+#else
+#define XTG_THREAD_LOCAL _Thread_local
+#endif
+
 void
 x_fgets(char *, int, FILE *);
 
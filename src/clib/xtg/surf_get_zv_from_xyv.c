@@ -55,7 +55,7 @@ surf_get_zv_from_xyv(double *xv,
                      long nn,
                      int option)
 {
-    int i;
+    long i;
 
     nn = nx * ny;
 
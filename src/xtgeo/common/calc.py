@@ -281,3 +281,66 @@ def vectorpair_angle3d(p0, p1, p2, degrees=True, birdview=False):
         return None
 
     return angle
+
+
+def ijkrange_to_box(ncol, nrow, nlay, ijkrange, zerobased=False):
+    """Convert an ijkrange to zero based start indices and new dimensions.
+
+    Args:
+        ncol, nrow, nlay (int): Dimensions of the full grid or cube
+        ijkrange (list-like): (i1, i2, j1, j2, k1, k2), inclusive for both ends, where
+            "min" and "max" may be used for existing boundaries.
+        zerobased (bool): If True, ijkrange is zero based, otherwise one based.
+
+    Returns:
+        Tuple (i1, j1, k1, ncol2, nrow2, nlay2) where i1, j1, k1 are zero based.
+
+    Raises:
+        ValueError: The ijkrange list must have 6 elements
+        ValueError: The ijkrange spesification exceeds boundaries.
+    """
+    if len(ijkrange) != 6:
+        raise ValueError("The ijkrange list must have 6 elements")
+
+    i1, i2, j1, j2, k1, k2 = ijkrange
+
+    if i1 == "min":
+        i1 = 0 if zerobased else 1
+    if j1 == "min":
+        j1 = 0 if zerobased else 1
+    if k1 == "min":
+        k1 = 0 if zerobased else 1
+
+    if i2 == "max":
+        i2 = ncol - 1 if zerobased else ncol
+    if j2 == "max":
+        j2 = nrow - 1 if zerobased else nrow
+    if k2 == "max":
+        k2 = nlay - 1 if zerobased else nlay
+
+    if not zerobased:
+        i1 -= 1
+        i2 -= 1
+        j1 -= 1
+        j2 -= 1
+        k1 -= 1
+        k2 -= 1
+
+    ncol2 = i2 - i1 + 1
+    nrow2 = j2 - j1 + 1
+    nlay2 = k2 - k1 + 1
+
+    if (
+        i1 < 0
+        or j1 < 0
+        or k1 < 0
+        or ncol2 < 1
+        or i2 >= ncol
+        or nrow2 < 1
+        or j2 >= nrow
+        or nlay2 < 1
+        or k2 >= nlay
+    ):
+        raise ValueError("The ijkrange spesification exceeds boundaries.")
+
+    return i1, j1, k1, ncol2, nrow2, nlay2
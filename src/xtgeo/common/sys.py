@@ -24,6 +24,9 @@ xtg = XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
 
+# max number of bytes of an array that are hashed in one block
+HASH_BLOCK_BYTES = 16 * 1024 * 1024
+
 SUPPORTED_FORMATS = {
     "rmswell": ["rmswell", "rmsw", "w"],
     "roff_binary": ["roff_binary", "roff", "roff_bin", "roff-bin", "roffbin", "roff.*"],
@@ -45,12 +48,16 @@ SUPPORTED_FORMATS = {
 VALID_FILE_ALIASES = ["$fmu-v1", "$md5sum", "$random"]
 
 
-def npfromfile(fname, dtype=np.float32, count=1, offset=0, mmap=False):
-    """Wrapper round np.fromfile to be compatible with older np versions."""
+def npfromfile(fname, dtype=np.float32, count=1, offset=0, mmap=False, mmapmode="r"):
+    """Wrapper round np.fromfile to be compatible with older np versions.
+
+    If mmap is True, a np.memmap is returned, where mmapmode is "r" (read only) or
+    "c" (copy-on-write, i.e. changes are kept in memory and never written to file).
+    """
     try:
         if mmap:
             vals = np.memmap(
-                fname, dtype=dtype, shape=(count,), mode="r", offset=offset
+                fname, dtype=dtype, shape=(count,), mode=mmapmode, offset=offset
             )
         else:
             vals = np.fromfile(fname, dtype=dtype, count=count, offset=offset)
@@ -81,7 +88,8 @@ def generic_hash(gid, hashmethod="md5"):
     Args:
         gid (str): Any string as signature, e.g. cumulative attributes of an instance.
         hashmethod (str or function): Supported methods are "md5", "sha256", "blake2b"
-            or use a full function signature e.g. hashlib.sha128.
+            and "xxhash" (requires the xxhash package) or use a full function
+            signature e.g. hashlib.sha128.
 
     Returns:
         Hash signature.
@@ -91,6 +99,46 @@ def generic_hash(gid, hashmethod="md5"):
 
     .. versionadded:: 2.14
     """
+    mhash = _get_hash_object(hashmethod)
+    mhash.update(gid.encode())
+    return mhash.hexdigest()
+
+
+def generic_hash_arrays(scalars, arrays, hashmethod="md5"):
+    """Return a unique hash ID from scalar attributes and numpy arrays.
+
+    The arrays are hashed from their raw buffers (C order), streamed in blocks
+    through the hash function, together with their dtype and shape. For masked
+    arrays, the mask is hashed and masked entries count as 0.
+
+    Args:
+        scalars (tuple): Scalar attributes, hashed from their repr()
+        arrays (tuple): Numpy arrays (masked or not), or None
+        hashmethod (str or function): As for :func:`generic_hash`
+
+    Returns:
+        Hash signature.
+
+    .. versionadded:: 2.15
+    """
+    mhash = _get_hash_object(hashmethod)
+    mhash.update(repr(tuple(scalars)).encode())
+    for arr in arrays:
+        _update_hash_array(mhash, arr)
+    return mhash.hexdigest()
+
+
+def _get_hash_object(hashmethod):
+    """Return a new hash object for a hashmethod, see generic_hash."""
+    if hashmethod == "xxhash":
+        try:
+            import xxhash  # pylint: disable=import-outside-toplevel
+        except ImportError as err:
+            raise ImportError(
+                "The hashmethod 'xxhash' requires the xxhash package"
+            ) from err
+        return xxhash.xxh3_128()
+
     validmethods = {
         "md5": hashlib.md5,
         "sha256": hashlib.sha256,
@@ -103,8 +151,29 @@ def generic_hash(gid, hashmethod="md5"):
     elif isinstance(hashmethod, BuiltinFunctionType):
         mhash = hashmethod()
 
-    mhash.update(gid.encode())
-    return mhash.hexdigest()
+    return mhash
+
+
+def _update_hash_array(mhash, arr):
+    """Stream the raw buffer of an array through a hash object, in blocks."""
+    if arr is None:
+        mhash.update(b"None")
+        return
+
+    masked = np.ma.isMaskedArray(arr)
+    mhash.update(f"{masked}{arr.dtype.str}{arr.shape}".encode())
+
+    # a view if C contiguous (also for memory mapped arrays), otherwise a copy
+    flat = arr.reshape(-1) if arr.flags.c_contiguous else arr.ravel(order="C")
+
+    step = max(1, HASH_BLOCK_BYTES // max(1, flat.itemsize))
+    for start in range(0, flat.size, step):
+        block = flat[start : start + step]
+        if masked:
+            mask = np.ma.getmaskarray(block)
+            mhash.update(memoryview(np.ascontiguousarray(mask)).cast("B"))
+            block = np.ma.filled(block, fill_value=0)
+        mhash.update(memoryview(np.ascontiguousarray(block)).cast("B"))
 
 
 class _XTGeoFile(object):
@@ -231,6 +300,12 @@ class _XTGeoFile(object):
 
         newname = stem
         if stem == "$md5sum":
+            # the name shall follow the data being written, also after in place
+            # edits not seen by a memoized hash (see Grid.generate_hash); the
+            # hashing is cheap compared with the export itself
+            tmp = getattr(obj, "_tmp", None)
+            if isinstance(tmp, dict):
+                tmp.pop("hash", None)
             newname = obj.generate_hash()
         elif stem == "$random":
             newname = uuid.uuid4().hex  # random name
@@ -520,7 +595,12 @@ class _XTGeoFile(object):
             provider = ""
             if details:
                 with h5py.File(self.file, "r") as hstream:
-                    for xtgtype in ["RegularSurface", "Well", "CornerPointGrid"]:
+                    for xtgtype in [
+                        "RegularSurface",
+                        "RegularCube",
+                        "Well",
+                        "CornerPointGrid",
+                    ]:
                         if xtgtype in hstream.keys():
                             fmt = xtgtype
                             grp = hstream.require_group(xtgtype)
@@ -2,3 +2,4 @@
 """The XTGeo cube package."""
 
 from xtgeo.cube.cube1 import Cube  # type: ignore # noqa # pylint: disable=undefined-variable
+from xtgeo.cube._cube_segyindex import SegyTraceIndex  # noqa
@@ -4,6 +4,8 @@ import struct
 import json
 import numpy as np
 
+import h5py
+import hdf5plugin
 import segyio
 
 import xtgeo
@@ -220,3 +222,81 @@ def export_xtgregcube(self, mfile):
         fout.write(jmeta)
 
     logger.info("Export as xtgregcube... done")
+
+
+# target uncompressed size of one hdf5 chunk, and max number of samples per chunk trace
+HDF5_CHUNK_BYTES = 1024 * 1024
+HDF5_CHUNK_MAXNSMP = 256
+
+
+def _hdf5_cube_chunks(ncol, nrow, nlay, itemsize=4):
+    """Chunk shape for the cube values, tuned for both trace and inline access.
+
+    A chunk keeps (up to) HDF5_CHUNK_MAXNSMP samples along the trace, and a square
+    footprint in the lateral directions, so that reading a trace touches few chunks
+    and reading an inline (or a sub-volume around a window) does not read much more
+    than needed.
+    """
+    cnlay = min(nlay, HDF5_CHUNK_MAXNSMP)
+    nside = max(1, int(np.sqrt(HDF5_CHUNK_BYTES / (itemsize * cnlay))))
+    return (min(ncol, nside), min(nrow, nside), cnlay)
+
+
+def export_hdf5_cube(self, mfile, compression="blosc", chunks=True, dtype="float32"):
+    """Export to experimental hdf5 format, with chunked (and compressed) values.
+
+    Args:
+        self (Cube): The instance
+        mfile (_XTGeoFile): File object
+        compression (str): None, "lzf" or "blosc" (default)
+        chunks (bool or tuple): If True (default) use a chunk shape tuned for both
+            trace and inline access; a 3 element tuple gives a custom chunk shape.
+        dtype (str): "float32" (default) or "float64"
+    """
+    logger.info("Export to hdf5 format...")
+
+    self.metadata.required = self
+
+    meta = self.metadata.get_metadata()
+    jmeta = json.dumps(meta).encode()
+
+    if compression and compression == "blosc":
+        compression = hdf5plugin.Blosc(
+            cname="blosclz", clevel=9, shuffle=hdf5plugin.Blosc.SHUFFLE
+        )
+
+    if dtype not in ("float32", "float64", np.float32, np.float64):
+        raise ValueError("Wrong dtype input, must be 'float32' or 'float64'")
+
+    if chunks is True:
+        chunks = _hdf5_cube_chunks(
+            self.ncol, self.nrow, self.nlay, itemsize=np.dtype(dtype).itemsize
+        )
+    elif not chunks:
+        chunks = None
+
+    with h5py.File(mfile.name, "w") as fh5:
+        grp = fh5.create_group("RegularCube")
+        dset = grp.create_dataset(
+            "values",
+            shape=self.dimensions,
+            dtype=dtype,
+            compression=compression,
+            chunks=chunks,
+        )
+        # write per inline slab so that e.g. a memory mapped cube is never fully
+        # loaded into memory
+        ichunk = chunks[0] if chunks else self.ncol
+        for icol in range(0, self.ncol, ichunk):
+            dset[icol : icol + ichunk, :, :] = self.values[icol : icol + ichunk, :, :]
+
+        grp.create_dataset("ilines", data=np.asarray(self.ilines, dtype=np.int32))
+        grp.create_dataset("xlines", data=np.asarray(self.xlines, dtype=np.int32))
+        grp.create_dataset(
+            "traceidcodes", data=np.asarray(self.traceidcodes, dtype=np.int32)
+        )
+        grp.attrs["metadata"] = jmeta
+        grp.attrs["provider"] = "xtgeo"
+        grp.attrs["format-idcode"] = 1201
+
+    logger.info("Export to hdf5 format... done!")
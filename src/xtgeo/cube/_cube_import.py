@@ -1,10 +1,12 @@
 """Import Cube data via SegyIO library or XTGeo CLIB."""
 from struct import unpack
 import json
+import tempfile
 from collections import OrderedDict
 
 import numpy as np
 
+import h5py
 import segyio
 import xtgeo
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
@@ -12,27 +14,87 @@ import xtgeo.common.calc as xcalc
 import xtgeo.common.sys as xsys
 from xtgeo.common import XTGeoDialog
 
+from ._cube_segyindex import SegyTraceIndex, get_segy_index
+
 xtg = XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
 
-def import_segy(self, sfile, engine="segyio"):
+def import_segy(
+    self,
+    sfile,
+    engine="segyio",
+    mmap=False,
+    traceindex=False,
+    ilines=None,
+    xlines=None,
+    zrange=None,
+):
     """Import SEGY."""
+    subvolume = ilines is not None or xlines is not None or zrange is not None
+    if engine != "segyio" and subvolume:
+        raise ValueError("Reading a SEGY sub volume requires engine 'segyio'")
+
     if engine == "segyio":
-        _import_segy_io(self, sfile)
+        if subvolume or (traceindex is not False and traceindex is not None):
+            _import_segy_index(
+                self,
+                sfile,
+                mmap=mmap,
+                traceindex=traceindex,
+                ilines=ilines,
+                xlines=xlines,
+                zrange=zrange,
+            )
+        else:
+            _import_segy_io(self, sfile, mmap=mmap)
     else:
         pass
         # _import_segy_xtgeo()
 
 
-def _import_segy_io(self, sfile):
+def _segy_values_to_memmap(segyfile):
+    """Copy SEGY trace data to a native float32 memory mapped scratch file.
+
+    This is a full copy, not a lazy view of the SEGY file: SEGY samples are big
+    endian (or IBM floats) and interleaved with the trace headers, while the cube
+    and the C routines need a contiguous native float32 array. The traces are
+    copied in chunks of lines, so memory usage is bounded. The
+    scratch file is anonymous (removed when the memory map is released), and the
+    array has the same shape as :func:`segyio.tools.cube` would return.
+    """
+    ilsort = segyfile.sorting == segyio.TraceSortingFormat.INLINE_SORTING
+    fast = len(segyfile.ilines) if ilsort else len(segyfile.xlines)
+    slow = len(segyfile.xlines) if ilsort else len(segyfile.ilines)
+    nsmp = len(segyfile.samples)
+
+    values = np.memmap(
+        tempfile.TemporaryFile(prefix="xtgeo_cube_"),
+        dtype=np.float32,
+        mode="w+",
+        shape=(fast, slow, nsmp),
+    )
+
+    traces = values.reshape(-1, nsmp)
+    for line in range(fast):
+        start = line * slow
+        chunk = segyfile.trace.raw[start : start + slow]
+        if np.isnan(np.sum(chunk)):
+            raise ValueError("The input contains NaN values which is trouble!")
+        traces[start : start + slow, :] = chunk
+
+    values.flush()
+    return values
+
+
+def _import_segy_io(self, sfile, mmap=False):
     """Import SEGY via Statoils FOSS SegyIO library.
 
     Args:
         self (Cube): Cube object
         sfile (str): File name of SEGY file
-        undef (float): If None, dead traces (undef) are read as is, but
-            if a a value, than dead traces get this value.
+        mmap (bool): If True, the values are read into a memory mapped scratch
+            file instead of memory (not lazy, all traces are read).
     """
     # pylint: disable=too-many-statements
     # pylint: disable=too-many-locals
@@ -42,18 +104,23 @@ def _import_segy_io(self, sfile):
     with segyio.open(sfile, "r") as segyfile:
         segyfile.mmap()
 
-        values = segyio.tools.cube(segyfile)
+        if mmap:
+            values = _segy_values_to_memmap(segyfile)
+        else:
+            values = segyio.tools.cube(segyfile)
 
-        logger.info(values.dtype)
-        if values.dtype != np.float32:
-            xtg.warnuser(
-                "Values are converted from {} to {}".format(values.dtype, "float32")
-            )
+            logger.info(values.dtype)
+            if values.dtype != np.float32:
+                xtg.warnuser(
+                    "Values are converted from {} to {}".format(
+                        values.dtype, "float32"
+                    )
+                )
 
-            values = values.astype(np.float32)
+                values = values.astype(np.float32)
 
-        if np.isnan(np.sum(values)):
-            raise ValueError("The input contains NaN values which is trouble!")
+            if np.isnan(np.sum(values)):
+                raise ValueError("The input contains NaN values which is trouble!")
 
         ilines = segyfile.ilines
         xlines = segyfile.xlines
@@ -65,29 +132,19 @@ def _import_segy_io(self, sfile):
 
         logger.info("NRCL  %s %s %s", ncol, nrow, nlay)
 
-        # need positions for all 4 corners
+        # need positions for 3 of the corners
         c1v = xcalc.ijk_to_ib(1, 1, 1, ncol, nrow, 1, forder=False)
         c2v = xcalc.ijk_to_ib(ncol, 1, 1, ncol, nrow, 1, forder=False)
         c3v = xcalc.ijk_to_ib(1, nrow, 1, ncol, nrow, 1, forder=False)
-        c4v = xcalc.ijk_to_ib(ncol, nrow, 1, ncol, nrow, 1, forder=False)
-
-        clist = [c1v, c2v, c3v, c4v]
-
-        xori = yori = zori = 0.999
-        xvv = rotation = 0.999
-        xinc = yinc = zinc = 0.999
-        yflip = 1
 
-        for inum, cox in enumerate(clist):
-            logger.debug(inum)
+        corners = []
+        for cox in (c1v, c2v, c3v):
             origin = segyfile.header[cox][
                 segyio.su.cdpx,
                 segyio.su.cdpy,
                 segyio.su.scalco,
                 segyio.su.delrt,
                 segyio.su.dt,
-                segyio.su.iline,
-                segyio.su.xline,
             ]
             # get the data on SU (seismic unix) format
             cdpx = origin[segyio.su.cdpx]
@@ -99,30 +156,15 @@ def _import_segy_io(self, sfile):
             else:
                 cdpx = cdpx * scaler
                 cdpy = cdpy * scaler
+            corners.append((cdpx, cdpy))
 
-            if inum == 0:
-                xori = cdpx
-                yori = cdpy
+            if cox == c1v:
                 zori = origin[segyio.su.delrt]
                 zinc = origin[segyio.su.dt] / 1000.0
 
-            if inum == 1:
-                slen, _, rot1 = xcalc.vectorinfo2(xori, cdpx, yori, cdpy)
-                xinc = slen / (ncol - 1)
-
-                rotation = rot1
-                xvv = (cdpx - xori, cdpy - yori, 0)
-
-            if inum == 2:
-                slen, _, _ = xcalc.vectorinfo2(xori, cdpx, yori, cdpy)
-                yinc = slen / (nrow - 1)
-
-                # find YFLIP by cross products
-                yvv = (cdpx - xori, cdpy - yori, 0)
-
-                yflip = xcalc.find_flip(xvv, yvv)
-
-        logger.debug("XTGeo rotation is %s", rotation)
+        xori, yori, xinc, yinc, rotation, yflip = _segy_xy_geometry(
+            corners, ncol, nrow
+        )
 
     # attributes to update
     self._ilines = ilines
@@ -143,6 +185,211 @@ def _import_segy_io(self, sfile):
     self._traceidcodes = traceidcodes
 
 
+def _segy_xy_geometry(corners, ncol, nrow):
+    """Map origin, increments, rotation and yflip from 3 corner trace positions.
+
+    The corners are (x, y) for cube positions (1, 1), (ncol, 1) and (1, nrow).
+    """
+    (xori, yori), (cdpx2, cdpy2), (cdpx3, cdpy3) = corners
+
+    slen, _, rotation = xcalc.vectorinfo2(xori, cdpx2, yori, cdpy2)
+    xinc = slen / (ncol - 1)
+    xvv = (cdpx2 - xori, cdpy2 - yori, 0)
+
+    slen, _, _ = xcalc.vectorinfo2(xori, cdpx3, yori, cdpy3)
+    yinc = slen / (nrow - 1)
+
+    # find YFLIP by cross products
+    yvv = (cdpx3 - xori, cdpy3 - yori, 0)
+    yflip = xcalc.find_flip(xvv, yvv)
+
+    logger.debug("XTGeo rotation is %s", rotation)
+    return xori, yori, xinc, yinc, rotation, yflip
+
+
+def _import_segy_index(
+    self, sfile, mmap=False, traceindex=True, ilines=None, xlines=None, zrange=None
+):  # pylint: disable=too-many-locals, too-many-statements
+    """Import SEGY via SegyIO, using a trace index for geometry and trace layout.
+
+    The file is opened without letting SegyIO infer the geometry, and all header
+    information is taken from the index, which is read from its sidecar file if
+    present and valid (see _cube_segyindex.get_segy_index). The traces are then
+    read in file order, in chunks of at most one line.
+
+    If ilines, xlines or zrange are given, only the traces inside the inline and
+    crossline ranges are read, and only the samples inside the z range are kept.
+
+    Args:
+        self (Cube): Cube object
+        sfile (str): File name of SEGY file
+        mmap (bool): If True, the values are read into a memory mapped scratch
+            file instead of memory.
+        traceindex (bool or SegyTraceIndex): True to use (or make) the sidecar
+            index, False to scan the headers without a sidecar, or an index
+            instance.
+        ilines (tuple): Inline number range (first, last), inclusive, or None
+        xlines (tuple): Crossline number range (first, last), inclusive, or None
+        zrange (tuple): Z range (zmin, zmax), inclusive, or None
+    """
+    if isinstance(traceindex, SegyTraceIndex):
+        index = traceindex
+        if not index.is_valid_for(sfile):
+            raise ValueError(
+                f"The trace index is not made for (this version of) {sfile}"
+            )
+    else:
+        index = get_segy_index(sfile, sidecar=bool(traceindex))
+
+    geom = index.geometry
+    ncolfull, nrowfull = geom["shape"]
+    position = geom["position"]
+
+    # the cube axes are (inline, crossline) if inline sorted, otherwise swapped
+    ilslice = _segy_line_range(geom["ilines"], ilines, "ilines")
+    xlslice = _segy_line_range(geom["xlines"], xlines, "xlines")
+    colslice, rowslice = (
+        (ilslice, xlslice) if geom["ilsort"] else (xlslice, ilslice)
+    )
+    zslice = _segy_sample_range(index.zori, index.zinc, index.nsamples, zrange)
+
+    ncol = colslice.stop - colslice.start
+    nrow = rowslice.stop - rowslice.start
+    nlay = zslice.stop - zslice.start
+
+    # new cube position of each trace, -1 for traces outside the sub volume
+    icol = position // nrowfull - colslice.start
+    jrow = position % nrowfull - rowslice.start
+    inside = (icol >= 0) & (icol < ncol) & (jrow >= 0) & (jrow < nrow)
+    newposition = np.where(inside, icol * nrow + jrow, -1)
+    tracenums = np.flatnonzero(inside)
+
+    logger.info(
+        "Read %s of %s traces, %s of %s samples",
+        tracenums.size,
+        index.ntraces,
+        nlay,
+        index.nsamples,
+    )
+
+    if mmap:
+        values = np.memmap(
+            tempfile.TemporaryFile(prefix="xtgeo_cube_"),
+            dtype=np.float32,
+            mode="w+",
+            shape=(ncol, nrow, nlay),
+        )
+    else:
+        values = np.empty((ncol, nrow, nlay), dtype=np.float32)
+
+    traces = values.reshape(-1, nlay)
+
+    # runs of consecutive traces in file, read in chunks of at most one line
+    runs = np.split(tracenums, np.flatnonzero(np.diff(tracenums) != 1) + 1)
+    chunksize = nrowfull
+
+    with segyio.open(sfile, "r", ignore_geometry=True) as segyfile:
+        segyfile.mmap()
+
+        for run in runs:
+            for start in range(run[0], run[-1] + 1, chunksize):
+                stop = min(start + chunksize, run[-1] + 1)
+                chunk = segyfile.trace.raw[start:stop][:, zslice]
+                if np.isnan(np.sum(chunk)):
+                    raise ValueError(
+                        "The input contains NaN values which is trouble!"
+                    )
+                newpos = newposition[start:stop]
+                if np.all(np.diff(newpos) == 1):
+                    traces[newpos[0] : newpos[-1] + 1, :] = chunk
+                else:
+                    traces[newpos, :] = chunk
+
+    if mmap:
+        values.flush()
+
+    traceidcodes = np.empty(ncol * nrow, dtype=np.int32)
+    traceidcodes[newposition[tracenums]] = index["traceid"][tracenums]
+
+    # rotation, increments and yflip from the full cube, origin from first trace
+    tracenum = np.empty(position.size, dtype=np.int64)
+    tracenum[position] = np.arange(position.size)
+
+    corners = []
+    for ifull, jfull in ((1, 1), (ncolfull, 1), (1, nrowfull)):
+        itrace = tracenum[
+            xcalc.ijk_to_ib(ifull, jfull, 1, ncolfull, nrowfull, 1, forder=False)
+        ]
+        corners.append((index["cdpx"][itrace], index["cdpy"][itrace]))
+
+    _, _, xinc, yinc, rotation, yflip = _segy_xy_geometry(
+        corners, ncolfull, nrowfull
+    )
+
+    itrace = tracenum[colslice.start * nrowfull + rowslice.start]
+    xori = index["cdpx"][itrace]
+    yori = index["cdpy"][itrace]
+
+    self._ilines = geom["ilines"][ilslice].copy()
+    self._xlines = geom["xlines"][xlslice].copy()
+    self._ncol = ncol
+    self._nrow = nrow
+    self._nlay = nlay
+    self._xori = xori
+    self._xinc = xinc
+    self._yori = yori
+    self._yinc = yinc
+    self._zori = index.zori + zslice.start * index.zinc
+    self._zinc = index.zinc
+    self._rotation = rotation
+    self.values = values
+    self._yflip = yflip
+    self._segyfile = sfile
+    self._traceidcodes = traceidcodes.reshape(ncol, nrow)
+
+
+def _segy_line_range(linenumbers, linerange, name):
+    """Return the slice of line numbers (in file order) inside an inclusive range."""
+    if linerange is None:
+        return slice(0, linenumbers.size)
+
+    if len(linerange) != 2:
+        raise ValueError(f"The {name} range must be given as (first, last)")
+
+    first, last = sorted(linerange)
+    selected = np.flatnonzero((linenumbers >= first) & (linenumbers <= last))
+    if selected.size == 0:
+        raise ValueError(
+            f"No {name} in range {linerange}, the cube has {name} "
+            f"{linenumbers.min()} - {linenumbers.max()}"
+        )
+    if selected[-1] - selected[0] != selected.size - 1:
+        raise ValueError(f"The {name} in range {linerange} are not contiguous")
+
+    return slice(selected[0], selected[-1] + 1)
+
+
+def _segy_sample_range(zori, zinc, nsamples, zrange):
+    """Return the slice of samples inside an inclusive z range."""
+    if zrange is None:
+        return slice(0, nsamples)
+
+    if len(zrange) != 2:
+        raise ValueError("The zrange must be given as (zmin, zmax)")
+
+    zmin, zmax = sorted(zrange)
+    eps = 1.0e-6 * zinc
+    first = max(0, int(np.ceil((zmin - zori) / zinc - eps)))
+    last = min(nsamples - 1, int(np.floor((zmax - zori) / zinc + eps)))
+    if last < first:
+        raise ValueError(
+            f"No samples in zrange {zrange}, the cube has z "
+            f"{zori} - {zori + (nsamples - 1) * zinc}"
+        )
+
+    return slice(first, last + 1)
+
+
 def _import_segy_xtgeo(sfile, scanheadermode=False, scantracemode=False, outfile=None):
     """Import SEGY via XTGeo's C library. OLD NOT UPDATED!!
 
@@ -430,8 +677,12 @@ def import_stormcube(self, sfile):  # pylint: disable=too-many-statements
     self._traceidcodes = np.ones((ncol, nrow), dtype=np.int32)
 
 
-def import_xtgregcube(self, mfile, values=True):
-    """Using pure python for experimental cube import, xtgregsurf format."""
+def import_xtgregcube(self, mfile, values=True, mmap=False):
+    """Using pure python for experimental cube import, xtgregsurf format.
+
+    If mmap is True, the values will be a copy-on-write memory map of the file, so
+    only the parts of the cube that are accessed are read.
+    """
     logger.info("Importing cube on xtgregcube format...")
 
     offset = 36
@@ -450,7 +701,14 @@ def import_xtgregcube(self, mfile, values=True):
     narr = ncol * nrow * nlay
 
     if values:
-        vals = xsys.npfromfile(mfile.file, dtype=dtype, count=narr, offset=offset)
+        vals = xsys.npfromfile(
+            mfile.file,
+            dtype=dtype,
+            count=narr,
+            offset=offset,
+            mmap=mmap,
+            mmapmode="c",
+        )
 
     # read metadata which will be at position offet + nfloat*narr +13
     pos = offset + nfloat * narr + 13
@@ -476,3 +734,89 @@ def import_xtgregcube(self, mfile, values=True):
 
     self._metadata.required = self
     logger.info("Importing cube on xtgregcube format... done.")
+
+
+def import_hdf5_cube(self, mfile, values=True, ijkrange=None, zerobased=False):
+    """Importing h5/hdf5 storage, optionally a sub volume given by ijkrange.
+
+    Only the chunks that overlap the ijkrange are read (and decompressed).
+    """
+    reqattrs = xtgeo.MetaDataRegularCube.REQUIRED
+
+    invalues = None
+    with h5py.File(mfile.name, "r") as h5h:
+
+        grp = h5h["RegularCube"]
+        idcode = grp.attrs["format-idcode"]
+        provider = grp.attrs["provider"]
+        if idcode != 1201:
+            raise ValueError(f"Wrong id code: {idcode}")
+        logger.info("Provider is %s", provider)
+
+        jmeta = grp.attrs["metadata"]
+        meta = json.loads(jmeta, object_pairs_hook=OrderedDict)
+
+        req = meta["_required_"]
+
+        isl, jsl, ksl = _ijkrange_to_slices(req, ijkrange, zerobased)
+
+        if values:
+            invalues = grp["values"][isl, jsl, ksl].astype(np.float32)
+        ilines = grp["ilines"][isl]
+        xlines = grp["xlines"][jsl]
+        traceidcodes = grp["traceidcodes"][isl, jsl]
+
+    for myattr in reqattrs:
+        setattr(self, "_" + myattr, req[myattr])
+
+    if ijkrange is not None:
+        # new origin; 1 + .. since the routine has 1 as base for i j
+        ier, xori, yori = _cxtgeo.cube_xy_from_ij(
+            1 + isl.start,
+            1 + jsl.start,
+            self._xori,
+            self._xinc,
+            self._yori,
+            self._yinc,
+            self._ncol,
+            self._nrow,
+            self._yflip,
+            self._rotation,
+            0,
+        )
+        if ier != 0:
+            raise RuntimeError("Unexpected error, code is {}".format(ier))
+
+        self._xori = xori
+        self._yori = yori
+        self._zori += ksl.start * self._zinc
+        self._ncol = isl.stop - isl.start
+        self._nrow = jsl.stop - jsl.start
+        self._nlay = ksl.stop - ksl.start
+
+    self._ilines = ilines
+    self._xlines = xlines
+    self._traceidcodes = traceidcodes
+
+    if values:
+        self.values = invalues
+    else:
+        self._values = None
+
+    self._metadata.required = self
+
+
+def _ijkrange_to_slices(req, ijkrange, zerobased):
+    """Convert a (i1, i2, j1, j2, k1, k2) range to zero based slices.
+
+    As for grids (see :func:`xtgeo.common.calc.ijkrange_to_box`), the ranges are
+    inclusive, 1 based unless zerobased is True, and "min" and "max" can be used
+    for the outer bounds.
+    """
+    if ijkrange is None:
+        return slice(0, req["ncol"]), slice(0, req["nrow"]), slice(0, req["nlay"])
+
+    i1, j1, k1, ncol, nrow, nlay = xcalc.ijkrange_to_box(
+        req["ncol"], req["nrow"], req["nlay"], ijkrange, zerobased=zerobased
+    )
+    return slice(i1, i1 + ncol), slice(j1, j1 + nrow), slice(k1, k1 + nlay)
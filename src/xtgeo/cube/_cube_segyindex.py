@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""Persistent trace header index for SEGY files."""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import segyio
+
+from xtgeo.common import XTGeoDialog
+
+xtg = XTGeoDialog()
+logger = xtg.functionlogger(__name__)
+
+# sidecar file, stored next to the SEGY file
+SIDECAR_SUFFIX = ".xtgtrcindex.npz"
+
+# bytes per sample for SEGY data sample format codes
+_SAMPLEBYTES = {1: 4, 2: 4, 3: 2, 5: 4, 6: 8, 8: 1, 9: 8, 10: 4, 11: 2, 12: 8, 16: 1}
+
+
+class SegyTraceIndex:
+    """Index of the trace headers in a SEGY file.
+
+    The index holds, per trace in file order, the inline and crossline number, the
+    (scaled) CDP X and Y, the byte offset of the trace header and the trace
+    identification code, where code 2 marks dead traces. The index is tied to the
+    file through its size and modification time, and can be stored as a compact
+    numpy (npz) sidecar file, so the headers of large files are scanned only once.
+
+    Use :meth:`Cube.scan_segy_index` to get (and by default persist) an index, and
+    ``Cube.from_file(..., traceindex=True)`` to import using it.
+
+    .. versionadded:: 2.15
+    """
+
+    FORMAT_VERSION = 1
+    ARRAYS = ("iline", "xline", "cdpx", "cdpy", "offset", "traceid")
+
+    def __init__(self, signature, header, arrays):
+        """Instantiate from ready made components; normally use from_segy()."""
+        self._signature = tuple(signature)
+        self._header = dict(header)
+        self._arrays = arrays
+        self._geometry = None
+
+    def __repr__(self):
+        """The __repr__ method."""
+        return (
+            f"{self.__class__.__name__} (ntraces={self.ntraces}, "
+            f"nsamples={self.nsamples}), ID=<{id(self)}>"
+        )
+
+    @property
+    def ntraces(self):
+        """Number of traces (read only)."""
+        return self._arrays["iline"].size
+
+    @property
+    def nsamples(self):
+        """Number of samples per trace (read only)."""
+        return self._header["nsamples"]
+
+    @property
+    def zori(self):
+        """Z (time or depth) of first sample, from first trace (read only)."""
+        return self._header["zori"]
+
+    @property
+    def zinc(self):
+        """Z sample increment, from first trace (read only)."""
+        return self._header["zinc"]
+
+    @property
+    def dead(self):
+        """Boolean array, True for dead traces (read only)."""
+        return self._arrays["traceid"] == 2
+
+    @property
+    def geometry(self):
+        """Regular layout of the traces, as dict (read only, made once).
+
+        The keys are "ilines" and "xlines" (line numbers in file order), "ilsort"
+        (True if inline sorted), "shape" (the 2D shape of the cube as from
+        :func:`segyio.tools.cube`) and "position" (the flat 2D cube position of
+        each trace).
+        """
+        if self._geometry is None:
+            self._geometry = _trace_geometry(
+                self._arrays["iline"], self._arrays["xline"]
+            )
+        return self._geometry
+
+    def __getitem__(self, name):
+        """Get one of the per trace arrays, e.g. index["cdpx"]."""
+        return self._arrays[name]
+
+    def get_dataframe(self):
+        """Return the index as a pandas dataframe with one row per trace."""
+        dfr = pd.DataFrame({name: self._arrays[name] for name in self.ARRAYS})
+        dfr["dead"] = self.dead
+        return dfr
+
+    def is_valid_for(self, sfile):
+        """Return True if the index is made for the (current) version of sfile."""
+        return self._signature == _file_signature(sfile)
+
+    @classmethod
+    def from_segy(cls, sfile):
+        """Make the index by scanning the trace headers of a SEGY file."""
+        signature = _file_signature(sfile)
+
+        with segyio.open(sfile, "r", ignore_geometry=True) as segyfile:
+            segyfile.mmap()
+            ntraces = segyfile.tracecount
+            nsamples = len(segyfile.samples)
+            sformat = int(segyfile.bin[segyio.BinField.Format])
+
+            fields = {
+                "iline": segyio.su.iline,
+                "xline": segyio.su.xline,
+                "cdpx": segyio.su.cdpx,
+                "cdpy": segyio.su.cdpy,
+                "scalco": segyio.su.scalco,
+                "traceid": segyio.TraceField.TraceIdentificationCode,
+            }
+            raw = {
+                name: np.asarray(segyfile.attributes(field)[:])
+                for name, field in fields.items()
+            }
+
+            header = {
+                "nsamples": nsamples,
+                "format": sformat,
+                "zori": float(segyfile.header[0][segyio.su.delrt]),
+                "zinc": segyfile.header[0][segyio.su.dt] / 1000.0,
+            }
+
+            # byte offset of each trace header
+            tracebytes = 240 + nsamples * _SAMPLEBYTES.get(sformat, 4)
+            start = 3600 + 3200 * segyfile.ext_headers
+
+        # same scaling of coordinates as in _cube_import._import_segy_io
+        scaler = raw["scalco"].astype(np.float64)
+        cdps = {}
+        for name in ("cdpx", "cdpy"):
+            cdp = raw[name].astype(np.float64)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cdps[name] = np.where(scaler < 0, -1 * cdp / scaler, cdp * scaler)
+
+        arrays = {
+            "iline": raw["iline"].astype(np.int32),
+            "xline": raw["xline"].astype(np.int32),
+            "cdpx": cdps["cdpx"],
+            "cdpy": cdps["cdpy"],
+            "offset": start + tracebytes * np.arange(ntraces, dtype=np.int64),
+            "traceid": raw["traceid"].astype(np.int16),
+        }
+        logger.info("Scanned %s trace headers in %s", ntraces, sfile)
+        return cls(signature, header, arrays)
+
+    def to_file(self, fname):
+        """Save the index to file, as a compressed numpy (npz) archive.
+
+        Args:
+            fname (str or Path): Name of file, e.g. next to the SEGY file as
+                "mycube.segy.xtgtrcindex.npz"
+        """
+        meta = {
+            "provider": "xtgeo",
+            "version": self.FORMAT_VERSION,
+            "signature": list(self._signature),
+            "header": self._header,
+        }
+        with open(fname, "wb") as fhandle:
+            np.savez_compressed(fhandle, meta=json.dumps(meta), **self._arrays)
+
+    @classmethod
+    def from_file(cls, fname):
+        """Load an index from file, as made by :meth:`to_file`."""
+        with np.load(fname, allow_pickle=False) as npz:
+            meta = json.loads(str(npz["meta"]))
+            if meta.get("version") != cls.FORMAT_VERSION:
+                raise ValueError(f"Not a valid SEGY trace index file: {fname}")
+            arrays = {name: npz[name] for name in cls.ARRAYS}
+        return cls(meta["signature"], meta["header"], arrays)
+
+
+def get_segy_index(sfile, sidecar=True):
+    """Return the trace index of a SEGY file, from the sidecar file if valid.
+
+    If the sidecar file is missing or outdated, the trace headers are scanned, and
+    if sidecar is True, the index is (re)written next to the SEGY file.
+    """
+    sfile = str(sfile)
+    indexfile = sfile + SIDECAR_SUFFIX
+
+    if os.path.isfile(indexfile):
+        try:
+            index = SegyTraceIndex.from_file(indexfile)
+        except (OSError, ValueError, KeyError) as err:
+            logger.warning("Cannot read trace index file %s: %s", indexfile, err)
+        else:
+            if index.is_valid_for(sfile):
+                logger.info("Use trace index file %s", indexfile)
+                return index
+            logger.info("Trace index file %s is outdated, not used", indexfile)
+
+    index = SegyTraceIndex.from_segy(sfile)
+    if sidecar:
+        try:
+            index.to_file(indexfile)
+        except OSError as err:
+            logger.warning("Cannot write trace index file %s: %s", indexfile, err)
+    return index
+
+
+def _file_signature(sfile):
+    """Return (size, mtime_ns) of a file."""
+    stat = os.stat(sfile)
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def _ordered_unique(values):
+    """Return unique values in order of first appearance, and position of each."""
+    uniq, first, inverse = np.unique(values, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    return uniq[order], rank[inverse.ravel()]
+
+
+def _trace_geometry(iline, xline):
+    """Find the regular 2D layout of traces, as segyio.tools.cube would make it."""
+    ilines, ilpos = _ordered_unique(iline)
+    xlines, xlpos = _ordered_unique(xline)
+
+    if ilines.size * xlines.size != iline.size:
+        raise ValueError(
+            f"The SEGY traces ({iline.size}) do not make a regular grid of "
+            f"{ilines.size} inlines and {xlines.size} crosslines"
+        )
+
+    # inline sorted when the inline number changes less often than the crossline
+    ilsort = np.count_nonzero(np.diff(iline)) <= np.count_nonzero(np.diff(xline))
+
+    if ilsort:
+        shape = (ilines.size, xlines.size)
+        position = ilpos * xlines.size + xlpos
+    else:
+        shape = (xlines.size, ilines.size)
+        position = xlpos * ilines.size + ilpos
+
+    return {
+        "ilines": ilines,
+        "xlines": xlines,
+        "ilsort": bool(ilsort),
+        "shape": shape,
+        "position": position,
+    }
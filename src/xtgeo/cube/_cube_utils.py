@@ -1,4 +1,5 @@
 """Cube utilities (basic low level)"""
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import warnings
 
@@ -7,6 +8,7 @@ import numpy as np
 import xtgeo
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.common import XTGeoDialog
+from xtgeo.xyz import _xyz_oper
 
 xtg = XTGeoDialog()
 
@@ -142,14 +144,19 @@ def cropping(self, icols, jrows, klays):
     jrow1, jrow2 = jrows
     klay1, klay2 = klays
 
-    val = self.values.copy()
     ncol = self.ncol
     nrow = self.nrow
     nlay = self.nlay
 
-    val = val[
-        0 + icol1 : ncol - icol2, 0 + jrow1 : nrow - jrow2, 0 + klay1 : nlay - klay2
-    ]
+    # copy only the cropped part (a memory mapped cube will read needed traces only)
+    val = np.array(
+        self.values[
+            0 + icol1 : ncol - icol2,
+            0 + jrow1 : nrow - jrow2,
+            0 + klay1 : nlay - klay2,
+        ],
+        order="C",
+    )
 
     self._ncol = val.shape[0]
     self._nrow = val.shape[1]
@@ -295,6 +302,50 @@ def get_randomline(
         fencespec = _get_randomline_fence(self, fencespec, hincrement, atleast, nextend)
         logger.info("Estimate hincrement from Polygons instance... DONE")
 
+    return _randomline_from_fence(
+        self, fencespec, self._values.reshape(-1), zmin, zmax, zincrement, sampling
+    )
+
+
+def get_randomlines(
+    self,
+    fencespecs,
+    zmin=None,
+    zmax=None,
+    zincrement=None,
+    hincrement=None,
+    atleast=5,
+    nextend=2,
+    sampling="nearest",
+    nthreads=None,
+):
+    """Get several random lines, running the fences in a pool of threads.
+
+    The C routine releases the GIL, and all fences share the same cube values.
+    """
+    fences = []
+    for fspec, polyid in _xyz_oper.split_fencespecs(fencespecs):
+        if isinstance(fspec, xtgeo.Polygons):
+            fspec = _get_randomline_fence(
+                self, fspec, hincrement, atleast, nextend, polyid=polyid
+            )
+        fences.append(fspec)
+
+    values1d = self._values.reshape(-1)
+
+    def _one(fence):
+        return _randomline_from_fence(
+            self, fence, values1d, zmin, zmax, zincrement, sampling
+        )
+
+    with ThreadPoolExecutor(max_workers=nthreads) as executor:
+        result = list(executor.map(_one, fences))
+
+    return result
+
+
+def _randomline_from_fence(self, fencespec, values1d, zmin, zmax, zincrement, sampling):
+    """Run the C routine for one fence (2D numpy)."""
     if not len(fencespec.shape) == 2:
         raise ValueError("Fence is not a 2D numpy")
 
@@ -341,7 +392,7 @@ def get_randomline(
         self._ncol,
         self._nrow,
         self._nlay,
-        self._values.reshape(-1),
+        values1d,
         nsamples,
         option,
     )
@@ -352,7 +403,7 @@ def get_randomline(
     return (hcoords[0], hcoords[-1], zmin, zmax, arr)
 
 
-def _get_randomline_fence(self, fencespec, hincrement, atleast, nextend):
+def _get_randomline_fence(self, fencespec, hincrement, atleast, nextend, polyid=None):
     """Compute a resampled fence from a Polygons instance"""
 
     if hincrement is None:
@@ -363,7 +414,11 @@ def _get_randomline_fence(self, fencespec, hincrement, atleast, nextend):
 
     logger.info("Getting fence from a Polygons instance...")
     fspec = fencespec.get_fence(
-        distance=distance, atleast=atleast, nextend=nextend, asnumpy=True
+        distance=distance,
+        atleast=atleast,
+        nextend=nextend,
+        asnumpy=True,
+        polyid=polyid,
     )
     logger.info("Getting fence from a Polygons instance... DONE")
     return fspec
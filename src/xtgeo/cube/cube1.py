@@ -17,6 +17,7 @@ from xtgeo.cube import _cube_import
 from xtgeo.cube import _cube_export
 from xtgeo.cube import _cube_utils
 from xtgeo.cube import _cube_roxapi
+from xtgeo.cube import _cube_segyindex
 
 
 xtg = XTGeoDialog()
@@ -45,21 +46,51 @@ logger = xtg.functionlogger(__name__)
 # ======================================================================================
 
 
-def cube_from_file(mfile, fformat="guess"):
+def cube_from_file(
+    mfile,
+    fformat="guess",
+    mmap=False,
+    ijkrange=None,
+    zerobased=False,
+    traceindex=False,
+    ilines=None,
+    xlines=None,
+    zrange=None,
+):
     """This makes an instance of a Cube directly from file import.
 
     Args:
         mfile (str): Name of file
         fformat (str): See :meth:`Cube.from_file`
+        mmap (bool): Use memory mapped values, see :meth:`Cube.from_file`
+        ijkrange (list-like): Sub volume to read, see :meth:`Cube.from_file`
+        zerobased (bool): If ijkrange is zero based, see :meth:`Cube.from_file`
+        traceindex (bool): Use a SEGY trace index, see :meth:`Cube.from_file`
+        ilines (tuple): SEGY inline range to read, see :meth:`Cube.from_file`
+        xlines (tuple): SEGY crossline range to read, see :meth:`Cube.from_file`
+        zrange (tuple): SEGY z range to read, see :meth:`Cube.from_file`
 
     Example::
 
         import xtgeo
         mycube = xtgeo.cube_from_file('some_cube.segy')
+
+    .. versionchanged:: 2.15 Added ``mmap``, ``ijkrange``, ``zerobased``,
+       ``traceindex``, ``ilines``, ``xlines`` and ``zrange``
     """
     obj = Cube()
 
-    obj.from_file(mfile, fformat=fformat)
+    obj.from_file(
+        mfile,
+        fformat=fformat,
+        mmap=mmap,
+        ijkrange=ijkrange,
+        zerobased=zerobased,
+        traceindex=traceindex,
+        ilines=ilines,
+        xlines=xlines,
+        zrange=zrange,
+    )
 
     return obj
 
@@ -357,9 +388,11 @@ class Cube:  # pylint: disable=too-many-public-methods
     def generate_hash(self, hashmethod="md5"):
         """Return a unique hash ID for current instance.
 
-        See :meth:`~xtgeo.common.sys.generic_hash()` for documentation.
+        The arrays are hashed from their raw data. See
+        :meth:`~xtgeo.common.sys.generic_hash()` for documentation of hashmethod.
 
         .. versionadded:: 2.14
+        .. versionchanged:: 2.15 Hash the full array data
         """
         required = (
             "ncol",
@@ -374,17 +407,11 @@ class Cube:  # pylint: disable=too-many-public-methods
             "yflip",
             "zflip",
             "rotation",
-            "values",
-            "ilines",
-            "xlines",
-            "traceidcodes",
         )
+        scalars = tuple(getattr(self, "_" + req) for req in required)
+        arrays = (self._values, self._ilines, self._xlines, self._traceidcodes)
 
-        gid = ""
-        for req in required:
-            gid += f"{getattr(self, '_' + req)}"
-
-        return xtgeosys.generic_hash(gid, hashmethod=hashmethod)
+        return xtgeosys.generic_hash_arrays(scalars, arrays, hashmethod=hashmethod)
 
     def describe(self, flush=True):
         """Describe an instance by printing to stdout or return.
@@ -516,6 +543,10 @@ class Cube:  # pylint: disable=too-many-public-methods
         Note that input boundary checking is currently lacking, and this
         is a currently a user responsibility!
 
+        Only the cropped part of the values is copied, hence cropping a memory
+        mapped cube (see :meth:`from_file`) reads only the needed traces, and the
+        result is an ordinary in-memory cube.
+
         The 'mode' is used to determine to different 'approaches' on
         cropping. Examples for icols and mode 'edges':
         Here the tuple (N, M) will cut N first rows and M last rows.
@@ -691,24 +722,126 @@ class Cube:  # pylint: disable=too-many-public-methods
         logger.info("Getting randomline... DONE")
         return res
 
+    def get_randomlines(
+        self,
+        fencespecs,
+        zmin=None,
+        zmax=None,
+        zincrement=None,
+        hincrement=None,
+        atleast=5,
+        nextend=2,
+        sampling="nearest",
+        nthreads=None,
+    ):
+        """Get several randomlines in one call.
+
+        This is as :meth:`get_randomline`, but for a list of fence specifications,
+        or a Polygons instance with several polylines (one fence per POLY_ID). The
+        cube values are shared and the fences are sampled in a pool of threads.
+
+        Args:
+            fencespecs (list or :class:`~xtgeo.xyz.polygons.Polygons`): A list of
+                2D numpy arrays and/or Polygons instances, or a single Polygons
+                instance with one or more polylines.
+            zmin (float): Minimum Z (default is Cube Z minima/origin)
+            zmax (float): Maximum Z (default is Cube Z maximum)
+            zincrement (float): Sampling vertically, default is Cube ZINC/2
+            hincrement (float): Resampling horizontally of Polygons. If None
+                (default), the distance will be deduced automatically.
+            atleast (int): Minimum number of horizontal samples (Polygons only)
+            nextend (int): Extend with nextend * hincrement in both ends
+                (Polygons only)
+            sampling (str): Algorithm, 'nearest' or 'trilinear'
+            nthreads (int): Number of threads; default (None) is decided by Python's
+                ThreadPoolExecutor.
+
+        Returns:
+            A list of tuples (hmin, hmax, vmin, vmax, ndarray2d), in the same order
+            as the fences.
+
+        .. versionadded:: 2.15
+        """
+        logger.info("Getting randomlines...")
+        res = _cube_utils.get_randomlines(
+            self,
+            fencespecs,
+            zmin=zmin,
+            zmax=zmax,
+            zincrement=zincrement,
+            hincrement=hincrement,
+            atleast=atleast,
+            nextend=nextend,
+            sampling=sampling,
+            nthreads=nthreads,
+        )
+        logger.info("Getting randomlines... DONE")
+        return res
+
     # =========================================================================
     # Import and export
     # =========================================================================
 
-    def from_file(self, sfile, fformat="guess", engine="segyio"):
+    def from_file(
+        self,
+        sfile,
+        fformat="guess",
+        engine="segyio",
+        mmap=False,
+        ijkrange=None,
+        zerobased=False,
+        traceindex=False,
+        ilines=None,
+        xlines=None,
+        zrange=None,
+    ):
         """Import cube data from file.
 
         If fformat is not provided, the file type will be guessed based
         on file extension (e.g. segy og sgy for SEGY format)
 
+        With ``mmap=True`` the cube values are kept as a memory mapped numpy array
+        (:class:`numpy.memmap`) instead of being held in memory, so memory usage is
+        bounded. Operations such as :meth:`get_randomline`, :meth:`do_cropping`,
+        :meth:`~xtgeo.surface.RegularSurface.slice_cube` and
+        :meth:`~xtgeo.surface.RegularSurface.slice_cube_window` will then only
+        page in the traces they touch. For the xtgregcube format the file itself is
+        mapped (copy-on-write, so in-place edits are never written back), so the
+        import is lazy. For SEGY the import is not lazy: all traces are read once
+        up front, line by line, into a native float32 scratch file in the temporary
+        directory, which is mapped and removed when the cube is deleted. This needs
+        free disk space for a full copy of the values. To read only a part of a
+        large SEGY file, use ``ilines``, ``xlines`` and ``zrange`` instead.
+
         Args:
             sfile (str): Filename (as string or pathlib.Path instance).
-            fformat (str): file format guess/segy/rms_regular/xtgregcube
-                where 'guess' is default. Regard 'xtgrecube' format as experimental.
+            fformat (str): file format guess/segy/rms_regular/xtgregcube/hdf
+                where 'guess' is default. Regard 'xtgrecube' and 'hdf' formats as
+                experimental.
             engine (str): For the SEGY reader, 'xtgeo' is builtin
                 while 'segyio' uses the SEGYIO library (default).
             deadtraces (float): Set 'dead' trace values to this value (SEGY
                 only). Default is UNDEF value (a very large number).
+            mmap (bool): If True, use memory mapped values (segy and xtgregcube
+                formats only). Default is False.
+            ijkrange (list-like): Read only a sub volume given as
+                (i1, i2, j1, j2, k1, k2), inclusive, where "min" and "max" can be
+                used for the outer bounds (hdf format only). Only the hdf chunks
+                overlapping the range are read.
+            zerobased (bool): If True, the ijkrange is zero based, default is False
+                (one based).
+            traceindex (bool or SegyTraceIndex): If True, the SEGY geometry is
+                taken from a trace header index, which is read from a sidecar file
+                next to the SEGY file if present and up to date, and otherwise
+                made and stored, see :meth:`scan_segy_index`. An index instance
+                may also be given. Default is False (segyio engine only).
+            ilines (tuple): Read only a sub volume of a SEGY file, for inline
+                numbers (first, last), inclusive. The trace index is then used
+                (but only stored as sidecar file if ``traceindex=True``), and only
+                the traces inside the range(s) are read.
+            xlines (tuple): As ``ilines``, for crossline numbers (first, last).
+            zrange (tuple): Keep only SEGY samples inside (zmin, zmax), inclusive,
+                as time or depth.
 
         Raises:
             OSError: if the file cannot be read (e.g. not found)
@@ -719,6 +852,20 @@ class Cube:  # pylint: disable=too-many-public-methods
             >>> zz = Cube()
             >>> zz.from_file('some.segy')
 
+            >>> big = xtgeo.cube_from_file('huge.segy', mmap=True)
+            >>> big.do_cropping((100, 200), (50, 80), (0, 0))  # now in memory
+
+            >>> sub = xtgeo.cube_from_file(
+            ...     'big.h5', ijkrange=(10, 60, 20, 80, 1, "max")
+            ... )
+
+            >>> prospect = xtgeo.cube_from_file(
+            ...     'huge.segy', ilines=(1200, 1280), xlines=(400, 480),
+            ...     zrange=(1500, 2000)
+            ... )
+
+        .. versionchanged:: 2.15 Added ``mmap``, ``ijkrange``, ``zerobased``,
+           ``traceindex``, ``ilines``, ``xlines``, ``zrange`` and the hdf format
 
         """
         fobj = xtgeosys._XTGeoFile(sfile)
@@ -732,34 +879,75 @@ class Cube:  # pylint: disable=too-many-public-methods
 
             fformat = fext.lower()
 
+        if ijkrange is not None and fformat not in ("hdf", "hdf5", "h5"):
+            raise ValueError("The ijkrange option is only supported for hdf format")
+
+        subvolume = ilines is not None or xlines is not None or zrange is not None
+        if subvolume and fformat not in ("segy", "sgy"):
+            raise ValueError(
+                "The ilines, xlines and zrange options are only supported for SEGY"
+            )
+
         if "rms" in fformat:
             _cube_import.import_rmsregular(self, fobj.name)
         elif fformat in ("segy", "sgy"):
-            _cube_import.import_segy(self, fobj.name, engine=engine)
+            _cube_import.import_segy(
+                self,
+                fobj.name,
+                engine=engine,
+                mmap=mmap,
+                traceindex=traceindex,
+                ilines=ilines,
+                xlines=xlines,
+                zrange=zrange,
+            )
         elif fformat == "storm":
             _cube_import.import_stormcube(self, fobj.name)
         elif fformat == "xtgregcube":
             # experimental format
-            _cube_import.import_xtgregcube(self, fobj)
+            _cube_import.import_xtgregcube(self, fobj, mmap=mmap)
+        elif fformat in ("hdf", "hdf5", "h5"):
+            _cube_import.import_hdf5_cube(
+                self, fobj, ijkrange=ijkrange, zerobased=zerobased
+            )
         else:
             raise ValueError(f"File format fformat={fformat} is not supported")
 
         self._filesrc = fobj.name
         self._metadata.required = self
 
-    def to_file(self, sfile, fformat="segy", pristine=False, engine="xtgeo"):
+    def to_file(
+        self,
+        sfile,
+        fformat="segy",
+        pristine=False,
+        engine="xtgeo",
+        compression="blosc",
+        chunks=True,
+    ):
         """Export cube data to file.
 
+        The experimental 'hdf' format stores the values in chunks, by default
+        tuned for both trace and inline access, so that a sub volume can be
+        read efficiently with ``from_file(..., ijkrange=...)``.
+
         Args:
             sfile (str): Filename
-            fformat (str, optional): file format 'segy' (default) or
-                'rms_regular'
+            fformat (str, optional): file format 'segy' (default),
+                'rms_regular', 'xtgregcube' or 'hdf'
             pristine (bool): If True, make SEGY from scratch.
             engine (str): Which "engine" to use.
+            compression (str): Compression for hdf format: None, "lzf" or
+                "blosc" (default).
+            chunks (bool or tuple): Chunking for hdf format; True (default) for a
+                chunk shape tuned for trace and inline access, or a tuple of 3.
 
         Example::
             >>> zz = Cube('some.segy')
             >>> zz.to_file('some.rmsreg')
+            >>> zz.to_file('some.h5', fformat="hdf")
+
+        .. versionchanged:: 2.15 Added hdf format, ``compression`` and ``chunks``
         """
         fobj = xtgeosys._XTGeoFile(sfile, mode="wb")
 
@@ -771,6 +959,10 @@ class Cube:  # pylint: disable=too-many-public-methods
             _cube_export.export_rmsreg(self, fobj.name)
         elif fformat == "xtgregcube":
             _cube_export.export_xtgregcube(self, fobj.name)
+        elif fformat in ("hdf", "hdf5", "h5"):
+            _cube_export.export_hdf5_cube(
+                self, fobj, compression=compression, chunks=chunks
+            )
         else:
             raise ValueError(f"File format fformat={fformat} is not supported")
 
@@ -863,6 +1055,31 @@ class Cube:  # pylint: disable=too-many-public-methods
                     print(line.rstrip("\r\n"))
             os.remove(outfile)
 
+    @staticmethod
+    def scan_segy_index(sfile, sidecar=True):
+        """Return a trace header index of a SEGY file.
+
+        The trace headers are scanned once; with ``sidecar=True`` the index is
+        stored as a numpy (npz) file next to the SEGY file (with suffix
+        ".xtgtrcindex.npz") and reused as long as the SEGY file is unchanged.
+
+        Args:
+            sfile (str): Name of SEGY file
+            sidecar (bool): If True (default), read or store the sidecar file.
+
+        Returns:
+            A :class:`~xtgeo.cube.SegyTraceIndex` instance.
+
+        Example::
+
+            >>> index = xtgeo.Cube.scan_segy_index('huge.segy')
+            >>> dfr = index.get_dataframe()
+            >>> cube = xtgeo.cube_from_file('huge.segy', traceindex=True)
+
+        .. versionadded:: 2.15
+        """
+        return _cube_segyindex.get_segy_index(sfile, sidecar=sidecar)
+
     @staticmethod
     def scan_segy_header(sfile, outfile=None):
         """Scan a SEGY file header and print info to screen or file.
@@ -12,3 +12,4 @@ from xtgeo.common.exceptions import (
 from .grid import Grid
 from .grid_property import GridProperty
 from .grid_properties import GridProperties
+from ._grid3d_fence import GridFenceIndex
@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 
 """Some grid utilities, file scanning etc."""
+from concurrent.futures import ThreadPoolExecutor
+import json
+
 import numpy as np
 
 import xtgeo
 from xtgeo.grid3d import _gridprop_lowlevel as gl
 from xtgeo.surface import _regsurf_lowlevel as rl
+from xtgeo.xyz import _xyz_oper
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 
 xtg = xtgeo.common.XTGeoDialog()
@@ -31,7 +35,7 @@ def get_randomline(
 
     logger.info("Enter get_randomline from Grid...")
 
-    _update_tmpvars(self)
+    fidx = _update_tmpvars(self)
 
     if hincrement is None and isinstance(fencespec, xtgeo.Polygons):
         logger.info("Estimate hincrement from Polygons instance...")
@@ -42,14 +46,74 @@ def get_randomline(
     if isinstance(prop, str):
         prop = self.get_prop_by_name(prop)
 
+    pvalues = gl.update_carray(prop, dtype=np.float64)
+
+    res = _randomline_from_fence(self, fidx, fencespec, pvalues, zmin, zmax, zincrement)
+    logger.info("Getting randomline... DONE")
+    return res
+
+
+def get_randomlines(
+    self,
+    fencespecs,
+    prop,
+    zmin=None,
+    zmax=None,
+    zincrement=1.0,
+    hincrement=None,
+    atleast=5,
+    nextend=2,
+    nthreads=None,
+):
+    """Extract several randomlines from a 3D grid, sharing one fence index.
+
+    The fence index and the property array are prepared once, and the C routine
+    (which releases the GIL) is run for each fence in a pool of threads.
+    """
+    self._xtgformat1()
+
+    logger.info("Enter get_randomlines from Grid...")
+
+    # the C arrays are made before the index is shared by the threads
+    fidx = _update_tmpvars(self).prepare()
+
+    fences = []
+    for fspec, polyid in _xyz_oper.split_fencespecs(fencespecs):
+        if isinstance(fspec, xtgeo.Polygons):
+            fspec = _get_randomline_fence(
+                self, fspec, hincrement, atleast, nextend, polyid=polyid
+            )
+        fences.append(fspec)
+
+    if isinstance(prop, str):
+        prop = self.get_prop_by_name(prop)
+    pvalues = gl.update_carray(prop, dtype=np.float64)
+
+    def _one(fence):
+        return _randomline_from_fence(
+            self, fidx, fence, pvalues, zmin, zmax, zincrement
+        )
+
+    with ThreadPoolExecutor(max_workers=nthreads) as executor:
+        result = list(executor.map(_one, fences))
+
+    logger.info("Getting randomlines... DONE")
+    return result
+
+
+def _randomline_from_fence(self, fidx, fencespec, pvalues, zmin, zmax, zincrement):
+    """Run the C routine for one fence (2D numpy) with a prepared fence index."""
+    if not len(fencespec.shape) == 2:
+        raise ValueError("Fence is not a 2D numpy")
+
     xcoords = fencespec[:, 0]
     ycoords = fencespec[:, 1]
     hcoords = fencespec[:, 3]
 
     if zmin is None:
-        zmin = self._tmp["topd"].values.min()
+        zmin = fidx.topd.values.min()
     if zmax is None:
-        zmax = self._tmp["basd"].values.max()
+        zmax = fidx.basd.values.max()
 
     nzsam = int((zmax - zmin) / float(zincrement)) + 1
     nsamples = xcoords.shape[0] * nzsam
@@ -61,27 +125,27 @@ def get_randomline(
         zmin,
         zmax,
         nzsam,
-        self._tmp["topd"].ncol,
-        self._tmp["topd"].nrow,
-        self._tmp["topd"].xori,
-        self._tmp["topd"].yori,
-        self._tmp["topd"].xinc,
-        self._tmp["topd"].yinc,
-        self._tmp["topd"].rotation,
-        self._tmp["topd"].yflip,
-        self._tmp["topi_carr"],
-        self._tmp["topj_carr"],
-        self._tmp["basi_carr"],
-        self._tmp["basj_carr"],
+        fidx.topd.ncol,
+        fidx.topd.nrow,
+        fidx.topd.xori,
+        fidx.topd.yori,
+        fidx.topd.xinc,
+        fidx.topd.yinc,
+        fidx.topd.rotation,
+        fidx.topd.yflip,
+        fidx.carrays["topi_carr"],
+        fidx.carrays["topj_carr"],
+        fidx.carrays["basi_carr"],
+        fidx.carrays["basj_carr"],
         self.ncol,
         self.nrow,
         self.nlay,
         self._coordsv,
         self._zcornsv,
         self._actnumsv,
-        gl.update_carray(prop, dtype=np.float64),
-        self._tmp["onegrid"]._zcornsv,
-        self._tmp["onegrid"]._actnumsv,
+        pvalues,
+        fidx.onezcornsv,
+        fidx.oneactnumsv,
         nsamples,
     )
 
@@ -90,48 +154,209 @@ def get_randomline(
     values[values > xtgeo.UNDEF_LIMIT] = np.nan
     arr = values.reshape((xcoords.shape[0], nzsam)).T
 
-    logger.info("Getting randomline... DONE")
     return (hcoords[0], hcoords[-1], zmin, zmax, arr)
 
 
-def _update_tmpvars(self, force=False):
-    """The self._tmp variables are needed to speed up calculations.
+class GridFenceIndex:
+    """Lookup structure for fast fence (randomline) and point-in-cell queries.
+
+    The index is a one-layer version of the grid and top/base maps of depth and
+    I, J cell locations, which are used by :meth:`Grid.get_randomline` and
+    :meth:`Grid.get_ijk_from_points`. It is relatively costly to make for large
+    grids, hence it can be stored to file and attached to a grid later, see
+    :meth:`Grid.get_fence_index` and :meth:`Grid.set_fence_index`.
 
-    If they are already created, the no need to recreate
+    The index is tied to the grid geometry through the grid hash
+    (see :meth:`Grid.generate_hash`), and will be rejected for any other grid.
+
+    .. versionadded:: 2.15
     """
-    if "onegrid" not in self._tmp or force:
+
+    # name of the RegularSurface items in the index (and in the grid _tmp dict)
+    SURFACES = ("topd", "topi", "topj", "basd", "basi", "basj")
+    FORMAT_VERSION = 1
+
+    def __init__(self, gridhash, onezcornsv, oneactnumsv, surfaces):
+        """Instantiate from ready made components; normally use from_grid()."""
+        self._gridhash = gridhash
+        self._onezcornsv = onezcornsv
+        self._oneactnumsv = oneactnumsv
+        self._surfaces = surfaces
+        self._carrays = None
+
+    def __repr__(self):
+        """The __repr__ method."""
+        return (
+            f"{self.__class__.__name__} (gridhash={self._gridhash!r}, "
+            f"ncol={self.topd.ncol}, nrow={self.topd.nrow}), ID=<{id(self)}>"
+        )
+
+    @property
+    def gridhash(self):
+        """The hash of the grid geometry this index is made for (read only)."""
+        return self._gridhash
+
+    @property
+    def onezcornsv(self):
+        """Z corners of the one-layer grid, xtgformat=1 (read only)."""
+        return self._onezcornsv
+
+    @property
+    def oneactnumsv(self):
+        """Active cells of the one-layer grid, xtgformat=1 (read only)."""
+        return self._oneactnumsv
+
+    @property
+    def topd(self):
+        """Top depth map (read only)."""
+        return self._surfaces["topd"]
+
+    @property
+    def basd(self):
+        """Base depth map (read only)."""
+        return self._surfaces["basd"]
+
+    @property
+    def carrays(self):
+        """The I J maps as C arrays, as needed by the C routines (made once)."""
+        self.prepare()
+        return self._carrays
+
+    def prepare(self):
+        """Make the C arrays for the I J maps, if not made already.
+
+        Call this before the index is shared between threads, so the C arrays are
+        made once and not concurrently. Returns the instance.
+        """
+        if self._carrays is None:
+            self._carrays = {
+                name + "_carr": rl.get_carr_double(self._surfaces[name])
+                for name in ("topi", "topj", "basi", "basj")
+            }
+        return self
+
+    @classmethod
+    def from_grid(cls, grid, rfactor=4):
+        """Make the index from a Grid instance."""
+        grid._xtgformat1()
+        gridhash = grid.generate_hash()
+
         logger.info("Make a tmp onegrid instance...")
-        self._tmp["onegrid"] = self.copy()
-        self._tmp["onegrid"].reduce_to_one_layer()
-        one = self._tmp["onegrid"]
+        one = grid.copy()
+        one.reduce_to_one_layer()
         logger.info("Make a tmp onegrid instance... DONE")
+
         logger.info("Make a set of tmp surfaces for I J locations + depth...")
-        self._tmp["topd"] = xtgeo.RegularSurface()
-        self._tmp["topi"], self._tmp["topj"] = self._tmp["topd"].from_grid3d(
-            one, where="top", rfactor=4
+        surfs = {}
+        surfs["topd"] = xtgeo.RegularSurface()
+        surfs["topi"], surfs["topj"] = surfs["topd"].from_grid3d(
+            one, where="top", rfactor=rfactor
         )
 
-        self._tmp["basd"] = xtgeo.RegularSurface()
-        self._tmp["basi"], self._tmp["basj"] = self._tmp["basd"].from_grid3d(
-            one, where="base", rfactor=4
+        surfs["basd"] = xtgeo.RegularSurface()
+        surfs["basi"], surfs["basj"] = surfs["basd"].from_grid3d(
+            one, where="base", rfactor=rfactor
         )
 
-        self._tmp["topi"].fill()
-        self._tmp["topj"].fill()
-        self._tmp["basi"].fill()
-        self._tmp["basj"].fill()
+        for name in ("topi", "topj", "basi", "basj"):
+            surfs[name].fill()
+        logger.info("Make a set of tmp surfaces for I J locations + depth... DONE")
+
+        return cls(gridhash, one._zcornsv, one._actnumsv, surfs)
 
-        self._tmp["topi_carr"] = rl.get_carr_double(self._tmp["topi"])
-        self._tmp["topj_carr"] = rl.get_carr_double(self._tmp["topj"])
-        self._tmp["basi_carr"] = rl.get_carr_double(self._tmp["basi"])
-        self._tmp["basj_carr"] = rl.get_carr_double(self._tmp["basj"])
+    def is_valid_for(self, grid):
+        """Return True if the index is made for the (current) geometry of grid."""
+        grid._xtgformat1()
+        return self._gridhash == grid.generate_hash()
 
-        logger.info("Make a set of tmp surfaces for I J locations + depth... DONE")
+    def to_file(self, fname):
+        """Save the index to file, as a compressed numpy (npz) archive.
+
+        Args:
+            fname (str or Path): Name of file, e.g. next to the grid file as
+                "mygrid.fenceindex.npz"
+        """
+        arrays = {
+            "onezcornsv": self._onezcornsv,
+            "oneactnumsv": self._oneactnumsv,
+        }
+        geometry = {}
+        for name in self.SURFACES:
+            srf = self._surfaces[name]
+            arrays[name] = np.ma.filled(srf.values, fill_value=xtgeo.UNDEF)
+            geometry[name] = [
+                srf.xori,
+                srf.yori,
+                srf.xinc,
+                srf.yinc,
+                srf.rotation,
+                srf.yflip,
+            ]
+
+        meta = {
+            "provider": "xtgeo",
+            "version": self.FORMAT_VERSION,
+            "gridhash": self._gridhash,
+            "geometry": geometry,
+        }
+        with open(fname, "wb") as fhandle:
+            np.savez_compressed(fhandle, meta=json.dumps(meta), **arrays)
+
+    @classmethod
+    def from_file(cls, fname):
+        """Load an index from file, as made by :meth:`to_file`."""
+        with np.load(fname, allow_pickle=False) as npz:
+            meta = json.loads(str(npz["meta"]))
+            if meta.get("version") != cls.FORMAT_VERSION:
+                raise ValueError(f"Not a valid fence index file: {fname}")
+
+            surfs = {}
+            for name in cls.SURFACES:
+                xori, yori, xinc, yinc, rotation, yflip = meta["geometry"][name]
+                values = npz[name]
+                surfs[name] = xtgeo.RegularSurface(
+                    ncol=values.shape[0],
+                    nrow=values.shape[1],
+                    xori=xori,
+                    yori=yori,
+                    xinc=xinc,
+                    yinc=yinc,
+                    rotation=rotation,
+                    yflip=yflip,
+                    values=np.ma.masked_greater(values, xtgeo.UNDEF_LIMIT),
+                )
+            return cls(meta["gridhash"], npz["onezcornsv"], npz["oneactnumsv"], surfs)
+
+
+def _update_tmpvars(self, force=False):
+    """The self._tmp variables are needed to speed up calculations.
+
+    If they are already created (or an index is attached by set_fence_index()),
+    then no need to recreate. Any geometry change resets self._tmp (see
+    Grid._touch_geometry()), so a kept index is valid. Returns the GridFenceIndex.
+    """
+    if force or "fenceindex" not in self._tmp:
+        self._tmp["fenceindex"] = GridFenceIndex.from_grid(self)
     else:
-        logger.info("Re-use existing onegrid and tmp surfaces for I J")
+        logger.info("Re-use existing fence index (onegrid and tmp surfaces for I J)")
+
+    return self._tmp["fenceindex"]
+
+
+def set_fence_index(self, index):
+    """Attach a fence index (instance or file) to the grid, after validation."""
+    if not isinstance(index, GridFenceIndex):
+        index = GridFenceIndex.from_file(index)
+
+    if not index.is_valid_for(self):
+        raise ValueError(
+            "The fence index is not made for this grid (grid hash differs), "
+            "and cannot be used"
+        )
+    self._tmp["fenceindex"] = index
 
 
-def _get_randomline_fence(self, fencespec, hincrement, atleast, nextend):
+def _get_randomline_fence(self, fencespec, hincrement, atleast, nextend, polyid=None):
     """Compute a resampled fence from a Polygons instance."""
     if hincrement is None:
 
@@ -144,7 +369,11 @@ def _get_randomline_fence(self, fencespec, hincrement, atleast, nextend):
 
     logger.info("Getting fence from a Polygons instance...")
     fspec = fencespec.get_fence(
-        distance=distance, atleast=atleast, nextend=nextend, asnumpy=True
+        distance=distance,
+        atleast=atleast,
+        nextend=nextend,
+        asnumpy=True,
+        polyid=polyid,
     )
     logger.info("Getting fence from a Polygons instance... DONE")
     return fspec
@@ -2,6 +2,9 @@
 
 """Some grid utilities, file scanning etc (methods with no class)"""
 
+from collections import OrderedDict
+import json
+import os
 
 import pandas as pd
 
@@ -12,10 +15,32 @@ xtg = xtgeo.XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
 
-def scan_keywords(pfile, fformat="xecl", maxkeys=100000, dataframe=False, dates=False):
+# In-memory index of scanned keywords (and dates) per file, valid as long as the file
+# path, modification time and size are unchanged. The index may also be stored as a
+# sidecar file next to the data file, to be reused by other processes.
+_SCANCACHE = OrderedDict()
+SCANCACHE_MAXFILES = 16
+SIDECAR_SUFFIX = ".xtgkwindex"
+SIDECAR_VERSION = 1
+
+# dataframe columns for the different scans
+_SCANCOLUMNS = {
+    "xecl": ["KEYWORD", "TYPE", "NITEMS", "BYTESTART"],
+    "xecl+dates": ["KEYWORD", "TYPE", "NITEMS", "BYTESTART", "DATE"],
+    "roff": ["KEYWORD", "TYPE", "NITEMS", "BYTESTARTDATA"],
+    "dates": ["SEQNUM", "DATE"],
+}
+
+
+def scan_keywords(
+    pfile, fformat="xecl", maxkeys=100000, dataframe=False, dates=False, sidecar=False
+):
     """Quick scan of keywords in Eclipse binary restart/init/... file,
     or ROFF binary files.
 
+    The result is cached per file (see _cached_scan), so repeated calls for the
+    same unchanged file do not rescan it.
+
     Cf. grid_properties.py description
     """
 
@@ -23,26 +48,59 @@ def scan_keywords(pfile, fformat="xecl", maxkeys=100000, dataframe=False, dates=
 
     if fformat == "xecl":
         if dates:
-            data = _scan_ecl_keywords_w_dates(
-                pfile, maxkeys=maxkeys, dataframe=dataframe
+            scantype = "xecl+dates"
+            data = _cached_scan(
+                pfile,
+                scantype,
+                maxkeys,
+                lambda: _scan_ecl_keywords_w_dates(pfile, maxkeys=maxkeys),
+                sidecar=sidecar,
             )
         else:
-            data = _scan_ecl_keywords(pfile, maxkeys=maxkeys, dataframe=dataframe)
+            scantype = "xecl"
+            data = _cached_scan(
+                pfile,
+                scantype,
+                maxkeys,
+                lambda: _scan_ecl_keywords(pfile, maxkeys=maxkeys),
+                sidecar=sidecar,
+            )
 
     else:
-        data = _scan_roff_keywords(pfile, maxkeys=maxkeys, dataframe=dataframe)
+        scantype = "roff"
+        data = _cached_scan(
+            pfile,
+            scantype,
+            maxkeys,
+            lambda: _scan_roff_keywords(pfile, maxkeys=maxkeys),
+            sidecar=sidecar,
+        )
 
     pfile.cfclose()
 
+    if dataframe:
+        return pd.DataFrame.from_records(data, columns=_SCANCOLUMNS[scantype])
+
     return data
 
 
-def scan_dates(pfile, maxdates=1000, dataframe=False):
+def scan_dates(pfile, maxdates=1000, dataframe=False, sidecar=False):
     """Quick scan dates in a simulation restart file.
 
     Cf. grid_properties.py description
     """
+    zdates = _cached_scan(
+        pfile, "dates", maxdates, lambda: _scan_dates(pfile, maxdates), sidecar=sidecar
+    )
 
+    if dataframe:
+        return pd.DataFrame.from_records(zdates, columns=_SCANCOLUMNS["dates"])
+
+    return zdates
+
+
+def _scan_dates(pfile, maxdates):
+    """Scan dates as list of (seqnum, date) tuples, not using the cache."""
     seq = _cxtgeo.new_intarray(maxdates)
     day = _cxtgeo.new_intarray(maxdates)
     mon = _cxtgeo.new_intarray(maxdates)
@@ -67,14 +125,102 @@ def scan_dates(pfile, maxdates=1000, dataframe=False):
     for item in [seq, day, mon, yer]:
         _cxtgeo.delete_intarray(item)
 
-    zdates = list(zip(sq, da))  # list for PY3
+    return list(zip(sq, da))  # list for PY3
 
-    if dataframe:
-        cols = ["SEQNUM", "DATE"]
-        df = pd.DataFrame.from_records(zdates, columns=cols)
-        return df
 
-    return zdates
+def _file_signature(pfile):
+    """Return (path, mtime_ns, size) for a file, or None for memory streams."""
+    if pfile.memstream:
+        return None
+
+    stat = os.stat(pfile.file)
+    return (pfile.name, stat.st_mtime_ns, stat.st_size)
+
+
+def _cached_scan(pfile, scantype, maxitems, scanfunc, sidecar=False):
+    """Return the result of scanfunc() for a file, using the cached index if valid.
+
+    The cache is checked first in memory, then in a sidecar file (if present).
+    A result is reused if it is complete (fewer items than its maxitems), or was
+    made with the same maxitems. If sidecar is True, the index is also written
+    to a sidecar file, if not there already.
+    """
+    signature = _file_signature(pfile)
+    if signature is None:
+        return scanfunc()
+
+    path = signature[0]
+    index = _SCANCACHE.get(path)
+    if index is None or index["signature"] != signature:
+        index = {"signature": signature, "scans": _read_sidecar(path, signature)}
+        index["insidecar"] = set(index["scans"])
+        _SCANCACHE[path] = index
+        if len(_SCANCACHE) > SCANCACHE_MAXFILES:
+            _SCANCACHE.popitem(last=False)
+    else:
+        _SCANCACHE.move_to_end(path)
+
+    cached = index["scans"].get(scantype)
+    if cached is not None and (len(cached[1]) < cached[0] or cached[0] == maxitems):
+        logger.info("Use keyword index for %s (%s)", path, scantype)
+        result = cached[1][:maxitems]
+    else:
+        result = scanfunc()
+        index["scans"][scantype] = (maxitems, result)
+
+    if sidecar and scantype not in index["insidecar"]:
+        _write_sidecar(path, index)
+
+    return list(result)
+
+
+def _read_sidecar(path, signature):
+    """Return scans stored in a sidecar file, or an empty dict if none or outdated."""
+    sfile = path + SIDECAR_SUFFIX
+    if not os.path.isfile(sfile):
+        return {}
+
+    try:
+        with open(sfile, "r") as stream:
+            meta = json.load(stream)
+    except (OSError, ValueError) as err:
+        logger.warning("Cannot read keyword index file %s: %s", sfile, err)
+        return {}
+
+    if (
+        meta.get("version") != SIDECAR_VERSION
+        or meta.get("mtime_ns") != signature[1]
+        or meta.get("size") != signature[2]
+    ):
+        logger.info("Keyword index file %s is outdated, not used", sfile)
+        return {}
+
+    return {
+        scantype: (scan["maxitems"], [tuple(item) for item in scan["result"]])
+        for scantype, scan in meta["scans"].items()
+    }
+
+
+def _write_sidecar(path, index):
+    """Write the keyword index of a file to a sidecar file, if possible."""
+    sfile = path + SIDECAR_SUFFIX
+    meta = {
+        "version": SIDECAR_VERSION,
+        "mtime_ns": index["signature"][1],
+        "size": index["signature"][2],
+        "scans": {
+            scantype: {"maxitems": maxitems, "result": result}
+            for scantype, (maxitems, result) in index["scans"].items()
+        },
+    }
+    try:
+        with open(sfile, "w") as stream:
+            json.dump(meta, stream)
+    except OSError as err:
+        logger.warning("Cannot write keyword index file %s: %s", sfile, err)
+        return
+
+    index["insidecar"] = set(index["scans"])
 
 
 def _scan_ecl_keywords(pfile, maxkeys=100000, dataframe=False):
@@ -135,9 +281,9 @@ def _scan_ecl_keywords_w_dates(pfile, maxkeys=100000, dataframe=False):
     """Add a date column to the keyword"""
 
     logger.info("Scan keywords with dates...")
-    xkeys = _scan_ecl_keywords(pfile, maxkeys=maxkeys, dataframe=False)
+    xkeys = scan_keywords(pfile, fformat="xecl", maxkeys=maxkeys)
 
-    xdates = scan_dates(pfile, maxdates=maxkeys, dataframe=False)
+    xdates = scan_dates(pfile, maxdates=maxkeys)
 
     result = []
     # now merge these two:
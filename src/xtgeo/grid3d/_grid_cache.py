@@ -0,0 +1,96 @@
+"""Private module, cache of grid properties derived from the geometry only.
+
+Properties such as dZ, cell centers and bulk volumes depend only on the grid
+geometry and the arguments, so they are kept in an LRU cache in the grid's _tmp
+dict, which is reset at any grid change (see Grid._touch_geometry). The entries
+are in addition tagged with the geometry version. The cache keeps copies, and a
+cache hit returns a new copy, so the caller may modify the result freely. The
+cache is opt-in per grid, see Grid.set_geometry_cache.
+"""
+from collections import OrderedDict
+
+from xtgeo.common import XTGeoDialog
+
+xtg = XTGeoDialog()
+
+logger = xtg.functionlogger(__name__)
+
+# pylint: disable=protected-access
+
+# default memory cap for the cached property values in one grid, when enabled
+DEFAULT_MAXBYTES = 512 * 1024 * 1024
+
+
+def cached_derived(self, method, args, compute):
+    """Return the result of compute() for method and args, from cache if valid.
+
+    Args:
+        self (Grid): Grid instance
+        method (str): Name of the method, part of the cache key
+        args (tuple): Hashable arguments, part of the cache key
+        compute (callable): Returns a GridProperty, or a tuple of them
+
+    Returns:
+        A GridProperty or a tuple of GridProperty instances.
+    """
+    maxbytes = self._derived_cache_maxbytes
+    if not maxbytes:
+        return compute()
+
+    cache = self._tmp.setdefault("derived", OrderedDict())
+    key = (method,) + tuple(args)
+
+    entry = cache.get(key)
+    if entry is not None and entry[0] == self._geometry_version:
+        cache.move_to_end(key)
+        self._derived_cache_stats["hits"] += 1
+        logger.info("Geometry cache hit for %s", key)
+        return _copy_result(entry[1])
+
+    self._derived_cache_stats["misses"] += 1
+    logger.info("Geometry cache miss for %s", key)
+
+    result = compute()
+
+    nbytes = _result_nbytes(result)
+    if nbytes <= maxbytes:
+        cache[key] = (self._geometry_version, _copy_result(result), nbytes)
+        _evict(self, cache, maxbytes)
+
+    return result
+
+
+def cache_info(self):
+    """Return a dict with the current state and hit/miss statistics of the cache."""
+    cache = self._tmp.get("derived", {})
+    return {
+        "hits": self._derived_cache_stats["hits"],
+        "misses": self._derived_cache_stats["misses"],
+        "evictions": self._derived_cache_stats["evictions"],
+        "entries": len(cache),
+        "nbytes": sum(entry[2] for entry in cache.values()),
+        "maxbytes": self._derived_cache_maxbytes,
+    }
+
+
+def _evict(self, cache, maxbytes):
+    """Remove least recently used entries until the total size is within maxbytes."""
+    total = sum(entry[2] for entry in cache.values())
+    while total > maxbytes and cache:
+        key, entry = cache.popitem(last=False)
+        total -= entry[2]
+        self._derived_cache_stats["evictions"] += 1
+        logger.info("Geometry cache evicted %s", key)
+
+
+def _copy_result(result):
+    """Copy a GridProperty or a tuple of GridProperty instances."""
+    if isinstance(result, tuple):
+        return tuple(prop.copy() for prop in result)
+    return result.copy()
+
+
+def _result_nbytes(result):
+    """Return number of bytes used for values in a (tuple of) GridProperty."""
+    props = result if isinstance(result, tuple) else (result,)
+    return sum(prop.values.nbytes for prop in props)
@@ -68,3 +68,71 @@ def eclbin_record(gfile, kwname, kwlen, kwtype, kwbyte):
         logger.warning("Unknown kwtype %s, return None", kwtype)
 
     return npuse
+
+
+# numpy dtypes for the Eclipse binary record types, big endian as in file
+ECLBIN_DTYPES = {"INTE": ">i4", "REAL": ">f4", "DOUB": ">f8", "LOGI": ">i4"}
+
+
+def eclbin_buffer(gfile):
+    """Return the ecl binary file as a read only numpy uint8 buffer.
+
+    A file on disk is memory mapped, so only the pages that are used are read.
+    """
+    if gfile.memstream:
+        return np.frombuffer(gfile.file.getbuffer(), dtype=np.uint8)
+    return np.memmap(gfile.file, dtype=np.uint8, mode="r")
+
+
+def eclbin_record_buffer(buffer, kwname, kwlen, kwtype, kwbyte):
+    """Read ecl binary record from a numpy uint8 buffer (cf. eclbin_buffer()).
+
+    The record data starts after the 24 bytes header at kwbyte, and is split in
+    Fortran blocks with a 4 bytes length marker at both ends. The blocks are sliced
+    as numpy views, with one copy into the native result array. The result is as
+    for eclbin_record().
+    """
+    if kwtype not in ECLBIN_DTYPES:
+        raise ValueError(
+            "Wrong type of kwtype {} for {}, must be INTE, REAL "
+            "DOUB or LOGI".format(kwtype, kwname)
+        )
+
+    dtype = np.dtype(ECLBIN_DTYPES[kwtype])
+    values = np.empty(kwlen, dtype=dtype.newbyteorder("="))
+    if kwlen == 0:
+        return values
+
+    pos = int(kwbyte) + 24
+
+    # all blocks but the last have the same length; given by the first marker
+    blockbytes = int(buffer[pos : pos + 4].view(">i4")[0])
+    blockitems = blockbytes // dtype.itemsize
+    nfull, nrest = divmod(kwlen, blockitems)
+    stride = blockbytes + 8
+
+    # pairs of (markers, expected value) for the consistency check
+    markers = []
+    if nfull > 0:
+        blocks = buffer[pos : pos + nfull * stride].reshape((nfull, stride))
+        markers.append((np.ascontiguousarray(blocks[:, :4]).view(">i4"), blockbytes))
+        markers.append((np.ascontiguousarray(blocks[:, -4:]).view(">i4"), blockbytes))
+        values[: nfull * blockitems] = (
+            np.ascontiguousarray(blocks[:, 4:-4]).view(dtype).ravel()
+        )
+    if nrest > 0:
+        rpos = pos + nfull * stride
+        rbytes = nrest * dtype.itemsize
+        rend = rpos + 4 + rbytes
+        markers.append((buffer[rpos : rpos + 4].view(">i4"), rbytes))
+        markers.append((buffer[rend : rend + 4].view(">i4"), rbytes))
+        values[nfull * blockitems :] = buffer[rpos + 4 : rpos + 4 + rbytes].view(dtype)
+
+    for mark, expected in markers:
+        if not np.all(mark == expected):
+            raise ValueError(f"Corrupt Fortran block markers for record {kwname}")
+
+    if kwtype == "LOGI":
+        values *= -1  # LOGI is stored as INTE, 0 for False and -1 for True
+
+    return values
@@ -2,7 +2,7 @@
 
 from copy import deepcopy
 from math import atan2, degrees
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 
 import numpy as np
 import numpy.ma as ma
@@ -25,6 +25,10 @@ logger = xtg.functionlogger(__name__)
 
 # Note that "self" is the grid instance
 
+# Instrumentation: number of geometry layout conversions made, as "1to2" and "2to1".
+# The counter is for profiling and tests, and may be reset at any time.
+XTGFORMAT_CONVERSIONS = Counter()
+
 
 def create_box(
     self,
@@ -368,7 +372,8 @@ def get_ijk_from_points(
     if not activeonly:
         actnumoption = 0
 
-    _update_tmpvars(self, force=True)
+    # the lookup index is made once, and reused while the geometry is unchanged
+    fidx = _update_tmpvars(self)
 
     arrsize = points.dataframe[points.xname].values.size
 
@@ -383,25 +388,25 @@ def get_ijk_from_points(
         points.dataframe[points.xname].values,
         points.dataframe[points.yname].values,
         points.dataframe[points.zname].values,
-        self._tmp["topd"].ncol,
-        self._tmp["topd"].nrow,
-        self._tmp["topd"].xori,
-        self._tmp["topd"].yori,
-        self._tmp["topd"].xinc,
-        self._tmp["topd"].yinc,
-        self._tmp["topd"].rotation,
-        self._tmp["topd"].yflip,
-        self._tmp["topi_carr"],
-        self._tmp["topj_carr"],
-        self._tmp["basi_carr"],
-        self._tmp["basj_carr"],
+        fidx.topd.ncol,
+        fidx.topd.nrow,
+        fidx.topd.xori,
+        fidx.topd.yori,
+        fidx.topd.xinc,
+        fidx.topd.yinc,
+        fidx.topd.rotation,
+        fidx.topd.yflip,
+        fidx.carrays["topi_carr"],
+        fidx.carrays["topj_carr"],
+        fidx.carrays["basi_carr"],
+        fidx.carrays["basj_carr"],
         self.ncol,
         self.nrow,
         self.nlay,
         self._coordsv,
         self._zcornsv,
         self._actnumsv,
-        self._tmp["onegrid"]._zcornsv,
+        fidx.onezcornsv,
         actnumoption,
         arrsize,
         arrsize,
@@ -898,6 +903,7 @@ def inactivate_by_dz(self, threshold):
         threshold,
         nflip,
     )
+    self._touch_geometry()
 
 
 def make_zconsistent(self, zsep):
@@ -917,6 +923,7 @@ def make_zconsistent(self, zsep):
         self._zcornsv,
         zsep,
     )
+    self._touch_geometry()
 
 
 def inactivate_inside(self, poly, layer_range=None, inside=True, force_close=False):
@@ -960,6 +967,7 @@ def inactivate_inside(self, poly, layer_range=None, inside=True, force_close=Fal
         iforce,
         method,
     )
+    self._touch_geometry()
 
     if ier == 1:
         raise RuntimeError("Problems with one or more polygons. " "Not closed?")
@@ -972,6 +980,7 @@ def collapse_inactive_cells(self):
     _cxtgeo.grd3d_collapse_inact(
         self.ncol, self.nrow, self.nlay, self._zcornsv, self._actnumsv
     )
+    self._touch_geometry()
 
 
 def copy(self):
@@ -1004,6 +1013,12 @@ def copy(self):
         other._filesrc = self._filesrc
 
     other._xtgformat = self._xtgformat
+    other._keep_both_xtgformats = self._keep_both_xtgformats
+    other._derived_cache_maxbytes = self._derived_cache_maxbytes
+
+    # the fence index depends on geometry only, and is never modified; hence share
+    if "fenceindex" in self._tmp:
+        other._tmp["fenceindex"] = self._tmp["fenceindex"]
 
     return other
 
@@ -1083,6 +1098,7 @@ def crop(self, spec, props=None):  # pylint: disable=too-many-locals
     self._ncol = nncol
     self._nrow = nnrow
     self._nlay = nnlay
+    self._touch_geometry()
 
     if isinstance(self.subgrids, dict):
         newsub = OrderedDict()
@@ -1155,6 +1171,7 @@ def reduce_to_one_layer(self):
     self._actnumsv = new_actnum
     self._props = None
     self._subgrids = None
+    self._touch_geometry()
 
 
 def translate_coordinates(self, translate=(0, 0, 0), flip=(1, 1, 1)):
@@ -1177,6 +1194,7 @@ def translate_coordinates(self, translate=(0, 0, 0), flip=(1, 1, 1)):
         self._coordsv,
         self._zcornsv,
     )
+    self._touch_geometry()
     if ier != 0:
         raise RuntimeError("Something went wrong in translate, code: {}".format(ier))
 
@@ -1198,6 +1216,7 @@ def reverse_row_axis(self, ijk_handedness=None):
         self._zcornsv,
         self._actnumsv,
     )
+    self._touch_geometry()
 
     if ier != 0:
         raise RuntimeError("Something went wrong in jswapping, code: {}".format(ier))
@@ -1342,32 +1361,39 @@ def _convert_xtgformat2to1(self):
         logger.info("No conversion, format is already xtgformat == 1 or unset")
         return
 
-    logger.info("Convert grid from new xtgformat to legacy format...")
+    current = (self._coordsv, self._zcornsv, self._actnumsv)
+    arrays = _cached_xtgformat(self, 1)
 
-    newcoordsv = np.zeros(((self._ncol + 1) * (self._nrow + 1) * 6), dtype=np.float64)
-    newzcornsv = np.zeros(
-        (self._ncol * self._nrow * (self._nlay + 1) * 4), dtype=np.float64
-    )
-    newactnumsv = np.zeros((self._ncol * self._nrow * self._nlay), dtype=np.int32)
+    if arrays is None:
+        logger.info("Convert grid from new xtgformat to legacy format...")
 
-    _cxtgeo.grd3cp3d_xtgformat2to1_geom(
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        newcoordsv,
-        self._coordsv,
-        newzcornsv,
-        self._zcornsv,
-        newactnumsv,
-        self._actnumsv,
-    )
+        newcoordsv = np.zeros(
+            ((self._ncol + 1) * (self._nrow + 1) * 6), dtype=np.float64
+        )
+        newzcornsv = np.zeros(
+            (self._ncol * self._nrow * (self._nlay + 1) * 4), dtype=np.float64
+        )
+        newactnumsv = np.zeros((self._ncol * self._nrow * self._nlay), dtype=np.int32)
 
-    self._coordsv = newcoordsv
-    self._zcornsv = newzcornsv
-    self._actnumsv = newactnumsv
-    self._xtgformat = 1
+        _cxtgeo.grd3cp3d_xtgformat2to1_geom(
+            self._ncol,
+            self._nrow,
+            self._nlay,
+            newcoordsv,
+            self._coordsv,
+            newzcornsv,
+            self._zcornsv,
+            newactnumsv,
+            self._actnumsv,
+        )
+        arrays = (newcoordsv, newzcornsv, newactnumsv)
+        XTGFORMAT_CONVERSIONS["2to1"] += 1
 
-    logger.info("Convert grid from new xtgformat to legacy format... done")
+        logger.info("Convert grid from new xtgformat to legacy format... done")
+
+    self._coordsv, self._zcornsv, self._actnumsv = arrays
+    self._xtgformat = 1
+    _keep_xtgformat(self, 2, current)
 
 
 def _convert_xtgformat1to2(self):
@@ -1376,32 +1402,71 @@ def _convert_xtgformat1to2(self):
         logger.info("No conversion, format is already xtgformat == 2 or unset")
         return
 
-    logger.info("Convert grid from legacy xtgformat to new format...")
+    current = (self._coordsv, self._zcornsv, self._actnumsv)
+    arrays = _cached_xtgformat(self, 2)
 
-    newcoordsv = np.zeros((self._ncol + 1, self._nrow + 1, 6), dtype=np.float64)
-    newzcornsv = np.zeros(
-        (self._ncol + 1, self._nrow + 1, self._nlay + 1, 4), dtype=np.float32
-    )
-    newactnumsv = np.zeros((self._ncol, self._nrow, self._nlay), dtype=np.int32)
+    if arrays is None:
+        logger.info("Convert grid from legacy xtgformat to new format...")
 
-    _cxtgeo.grd3cp3d_xtgformat1to2_geom(
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        self._coordsv,
-        newcoordsv,
-        self._zcornsv,
-        newzcornsv,
-        self._actnumsv,
-        newactnumsv,
-    )
+        newcoordsv = np.zeros((self._ncol + 1, self._nrow + 1, 6), dtype=np.float64)
+        newzcornsv = np.zeros(
+            (self._ncol + 1, self._nrow + 1, self._nlay + 1, 4), dtype=np.float32
+        )
+        newactnumsv = np.zeros((self._ncol, self._nrow, self._nlay), dtype=np.int32)
 
-    self._coordsv = newcoordsv
-    self._zcornsv = newzcornsv
-    self._actnumsv = newactnumsv
+        _cxtgeo.grd3cp3d_xtgformat1to2_geom(
+            self._ncol,
+            self._nrow,
+            self._nlay,
+            self._coordsv,
+            newcoordsv,
+            self._zcornsv,
+            newzcornsv,
+            self._actnumsv,
+            newactnumsv,
+        )
+        arrays = (newcoordsv, newzcornsv, newactnumsv)
+        XTGFORMAT_CONVERSIONS["1to2"] += 1
+
+        logger.info("Convert grid from legacy xtgformat to new format... done")
+
+    self._coordsv, self._zcornsv, self._actnumsv = arrays
     self._xtgformat = 2
+    _keep_xtgformat(self, 1, current)
+
+
+def _cached_xtgformat(self, xtgformat):
+    """Return the kept (coordsv, zcornsv, actnumsv) in xtgformat, or None.
+
+    The kept arrays are only valid if the current arrays are the very same objects
+    as when they were kept, and the geometry is not changed in place since (see
+    Grid._touch_geometry()).
+    """
+    kept = self._tmp.get("xtgformat")
+    if kept is None:
+        return None
+
+    keptformat, arrays, source, version = kept
+    current = (self._coordsv, self._zcornsv, self._actnumsv)
+    if (
+        keptformat != xtgformat
+        or version != self._geometry_version
+        or any(arr is not src for arr, src in zip(current, source))
+    ):
+        return None
+
+    logger.info("Use kept geometry arrays for xtgformat %s", xtgformat)
+    return arrays
+
+
+def _keep_xtgformat(self, xtgformat, arrays):
+    """Keep arrays in the other xtgformat after a switch, if the grid shall do so."""
+    if not self._keep_both_xtgformats:
+        self._tmp.pop("xtgformat", None)
+        return
 
-    logger.info("Convert grid from new xtgformat to legacy format... done")
+    current = (self._coordsv, self._zcornsv, self._actnumsv)
+    self._tmp["xtgformat"] = (xtgformat, arrays, current, self._geometry_version)
 
 
 def get_gridquality_properties(self):
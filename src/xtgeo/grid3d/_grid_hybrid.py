@@ -56,3 +56,4 @@ def make_hybridgrid(
     self._nlay = newnlay
     self._zcornsv = hyb_zcornsv
     self._actnumsv = hyb_actnumsv
+    self._touch_geometry()
@@ -3,10 +3,12 @@
 
 import os
 import xtgeo
+import xtgeo.common.calc as xcalc
 from xtgeo.common import XTGeoDialog
 
 from xtgeo.grid3d import _grid_import_roff
 from xtgeo.grid3d import _grid_import_ecl
+from xtgeo.grid3d import _grid_import_xtgcpgeom
 
 
 xtg = XTGeoDialog()
@@ -21,6 +23,8 @@ def from_file(
     initprops=None,
     restartprops=None,
     restartdates=None,
+    ijkrange=None,
+    zerobased=False,
 ):  # pylint: disable=too-many-branches
     """Import grid geometry from file, and makes an instance of this class."""
     if not isinstance(gfile, xtgeo._XTGeoFile):
@@ -88,10 +92,27 @@ def from_file(
     elif fformat == "bgrdecl":
         _grid_import_ecl.import_ecl_bgrdecl(self, gfile)
     elif fformat == "xtgf":
-        self.from_xtgf(gfile)
+        self.from_xtgf(gfile, ijkrange=ijkrange, zerobased=zerobased)
     else:
         raise ValueError("Invalid file format")
 
+    if ijkrange is not None and fformat != "xtgf":
+        _crop_to_ijkrange(self, ijkrange, zerobased)
+
     self.name = gfile.file.stem
 
     return self
+
+
+def _crop_to_ijkrange(self, ijkrange, zerobased):
+    """Crop a grid (and its properties) which is read in full to the ijkrange."""
+    i1, j1, k1, ncol2, nrow2, nlay2 = xcalc.ijkrange_to_box(
+        self.ncol, self.nrow, self.nlay, ijkrange, zerobased
+    )
+    logger.info("Crop grid to ijkrange %s", ijkrange)
+    self.crop(
+        (i1 + 1, i1 + ncol2),
+        (j1 + 1, j1 + nrow2),
+        (k1 + 1, k1 + nlay2),
+        props="all" if self.props else None,
+    )
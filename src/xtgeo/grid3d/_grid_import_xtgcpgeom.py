@@ -8,7 +8,9 @@ import json
 import h5py
 import numpy as np
 
+import xtgeo.common.calc as xcalc
 import xtgeo.common.sys as xsys
+import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 import xtgeo
 
 xtg = xtgeo.common.XTGeoDialog()
@@ -17,9 +19,13 @@ logger = xtg.functionlogger(__name__)
 
 
 def import_xtgcpgeom(
-    self, mfile, mmap
+    self, mfile, mmap=False, ijkrange=None, zerobased=False
 ):  # pylint: disable=too-many-locals, too-many-statements
-    """Using pure python for experimental grid geometry import."""
+    """Using pure python for experimental grid geometry import.
+
+    If ijkrange is given, the arrays are memory mapped and only the sub box is
+    copied to memory.
+    """
     #
     offset = 36
     with open(mfile.file, "rb") as fhandle:
@@ -49,6 +55,9 @@ def import_xtgcpgeom(
     nzcorn = nncol * nnrow * nnlay * 4
     nactnum = ncol * nrow * nlay
 
+    if ijkrange is not None:
+        mmap = True
+
     # read numpy arrays from file
     coordsv = xsys.npfromfile(
         mfile.file, dtype=dtype_coordsv, count=ncoord, offset=offset, mmap=mmap
@@ -63,6 +72,21 @@ def import_xtgcpgeom(
     )
     newoffset += nactnum * actnumfmt
 
+    if ijkrange is not None:
+        # copy only the sub box from the memory mapped arrays
+        coordsv, zcornsv, actnumsv, ncol, nrow, nlay = _partial_slice(
+            coordsv.reshape((nncol, nnrow, 6)),
+            zcornsv.reshape((nncol, nnrow, nnlay, 4)),
+            actnumsv.reshape((ncol, nrow, nlay)),
+            ijkrange,
+            zerobased,
+        )
+        coordsv = coordsv.reshape(-1)
+        zcornsv = zcornsv.reshape(-1)
+        nncol = ncol + 1
+        nnrow = nrow + 1
+        nnlay = nlay + 1
+
     # read metadata which will be at position offet + nfloat*narr +13
     pos = newoffset + 13
 
@@ -106,6 +130,13 @@ def import_xtgcpgeom(
         else:
             setattr(self, "_" + myattr, req[myattr])
 
+    if ijkrange is not None:
+        self._ncol = ncol
+        self._nrow = nrow
+        self._nlay = nlay
+        self._subgrids = None
+        _cxtgeo.grdcp3d_process_edges(ncol, nrow, nlay, self._zcornsv)
+
     self._metadata.required = self
 
 
@@ -130,8 +161,8 @@ def import_hdf5_cpgeom(self, mfile, ijkrange=None, zerobased=False):
         req = meta["_required_"]
 
         if ijkrange is not None:
-            incoord, inzcorn, inactnum, ncol2, nrow2, nlay2 = _partial_read(
-                h5h, req, ijkrange, zerobased
+            incoord, inzcorn, inactnum, ncol2, nrow2, nlay2 = _partial_slice(
+                grp["coord"], grp["zcorn"], grp["actnum"], ijkrange, zerobased
             )
         else:
             incoord = grp["coord"][:, :, :]
@@ -144,15 +175,17 @@ def import_hdf5_cpgeom(self, mfile, ijkrange=None, zerobased=False):
         else:
             setattr(self, "_" + myattr, req[myattr])
 
-    if ijkrange:
-        self._ncol = ncol2
-        self._nrow = nrow2
-        self._nlay = nlay2
-
     self._coordsv = incoord.astype("float64")
     self._zcornsv = inzcorn.astype("float32")
     self._actnumsv = inactnum.astype("float32")
 
+    if ijkrange is not None:
+        self._ncol = ncol2
+        self._nrow = nrow2
+        self._nlay = nlay2
+        self._subgrids = None
+        _cxtgeo.grdcp3d_process_edges(ncol2, nrow2, nlay2, self._zcornsv)
+
     if self._xshift != 0.0 or self._yshift != 0.0 or self._zshift != 0.0:
         self._coordsv[:, :, 0::3] += self._xshift
         self._coordsv[:, :, 1::3] += self._yshift
@@ -165,64 +198,24 @@ def import_hdf5_cpgeom(self, mfile, ijkrange=None, zerobased=False):
     self._metadata.required = self
 
 
-def _partial_read(h5h, req, ijkrange, zerobased):
-    """Read a partial IJ range."""
-    ncol = req["ncol"]
-    nrow = req["nrow"]
-    nlay = req["nlay"]
-
-    if len(ijkrange) != 6:
-        raise ValueError("The ijkrange list must have 6 elements")
-
-    i1, i2, j1, j2, k1, k2 = ijkrange
-
-    if i1 == "min":
-        i1 = 0 if zerobased else 1
-    if j1 == "min":
-        j1 = 0 if zerobased else 1
-    if k1 == "min":
-        k1 = 0 if zerobased else 1
-
-    if i2 == "max":
-        i2 = ncol - 1 if zerobased else ncol
-    if j2 == "max":
-        j2 = nrow - 1 if zerobased else nrow
-    if k2 == "max":
-        k2 = nlay - 1 if zerobased else nlay
-
-    if not zerobased:
-        i1 -= 1
-        i2 -= 1
-        j1 -= 1
-        j2 -= 1
-        k1 -= 1
-        k2 -= 1
-
-    ncol2 = i2 - i1 + 1
-    nrow2 = j2 - j1 + 1
-    nlay2 = k2 - k1 + 1
-
-    if (
-        ncol2 < 1
-        or ncol2 > ncol
-        or nrow2 < 1
-        or nrow2 > nrow
-        or nlay2 < 1
-        or nlay2 > nlay
-    ):
-        raise ValueError("The ijkrange spesification exceeds boundaries.")
+def _partial_slice(coordsv, zcornsv, actnumsv, ijkrange, zerobased):
+    """Read a partial IJK range from xtgformat=2 shaped arrays.
 
-    nncol2 = ncol2 + 1
-    nnrow2 = nrow2 + 1
-    nnlay2 = nrow2 + 1
+    The input arrays may be h5py datasets or (memory mapped) numpy arrays; only the
+    sub box is read and returned as in-memory numpy arrays.
+    """
+    ncol, nrow, nlay = actnumsv.shape
 
-    dset = h5h["CornerPointGeometry/coord"]
-    cv = dset[i1 : i1 + nncol2, j1 : j1 + nnrow2, :]
+    i1, j1, k1, ncol2, nrow2, nlay2 = xcalc.ijkrange_to_box(
+        ncol, nrow, nlay, ijkrange, zerobased
+    )
 
-    dset = h5h["CornerPointGeometry/zcorn"]
-    zv = dset[i1 : i1 + nncol2, j1 : j1 + nnrow2, k1 : k1 + nnlay2, :]
+    nncol2 = ncol2 + 1
+    nnrow2 = nrow2 + 1
+    nnlay2 = nlay2 + 1
 
-    dset = h5h["CornerPointGeometry/actnum"]
-    av = dset[i1 : i1 + ncol2, j1 : j1 + nrow2, k1 : k1 + nlay2]
+    cv = np.array(coordsv[i1 : i1 + nncol2, j1 : j1 + nnrow2, :])
+    zv = np.array(zcornsv[i1 : i1 + nncol2, j1 : j1 + nnrow2, k1 : k1 + nnlay2, :])
+    av = np.array(actnumsv[i1 : i1 + ncol2, j1 : j1 + nrow2, k1 : k1 + nlay2])
 
     return cv, zv, av, ncol2, nrow2, nlay2
@@ -112,6 +112,7 @@ def refine_vertically(self, rfactor, zoneprop=None):
     self._nlay = newnlay
     self._zcornsv = ref_zcornsv
     self._actnumsv = ref_actnumsv
+    self._touch_geometry()
 
     if self.subgrids is None or len(self.subgrids) <= 1:
         self.subgrids = None
@@ -2,6 +2,7 @@
 import os
 
 import xtgeo
+import xtgeo.common.calc as xcalc
 
 from ._gridprop_import_eclrun import import_eclbinary as impeclbin
 from ._gridprop_import_grdecl import import_grdecl_prop, import_bgrdecl_prop
@@ -24,6 +25,7 @@ def from_file(
     _roffapiv=1,
     ijrange=None,
     zerobased=False,
+    ijkrange=None,
 ):  # _roffapiv for devel.
     """Import grid property from file, and makes an instance of this."""
     # it may be that pfile already is an open file; hence a filehandle
@@ -31,6 +33,9 @@ def from_file(
     if not isinstance(pfile, xtgeo._XTGeoFile):
         raise RuntimeError("Internal error, pfile is not a _XTGeoFile instance")
 
+    if ijrange is not None and ijkrange is not None:
+        raise ValueError("Use either ijrange or ijkrange, not both")
+
     fformat = _chk_file(self, pfile.name, fformat)
 
     if fformat == "roff":
@@ -70,12 +75,23 @@ def from_file(
         import_bgrdecl_prop(self, pfile, name=name, grid=grid)
 
     elif fformat.lower() == "xtgcpprop":
-        import_xtgcpprop(self, pfile, ijrange=ijrange, zerobased=zerobased)
+        import_xtgcpprop(
+            self, pfile, ijrange=ijrange, zerobased=zerobased, ijkrange=ijkrange
+        )
 
     else:
         logger.warning("Invalid file format")
         raise ValueError("Invalid file format")
 
+    if ijkrange is not None and fformat.lower() != "xtgcpprop":
+        # no direct access to a sub box in these formats; crop after full read
+        i1, j1, k1, ncol2, nrow2, nlay2 = xcalc.ijkrange_to_box(
+            self.ncol, self.nrow, self.nlay, ijkrange, zerobased
+        )
+        self.crop(
+            ((i1 + 1, i1 + ncol2), (j1 + 1, j1 + nrow2), (k1 + 1, k1 + nlay2))
+        )
+
     # if grid, then append this gridprop to the current grid object
 
     # ###################################TMP skipped""
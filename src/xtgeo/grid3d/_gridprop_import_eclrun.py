@@ -560,11 +560,12 @@ def _import_eclbinary_checks2(kwlist, name, etype, date):
 
 
 def _import_eclbinary_prop(
-    self, grid, pfile, kwname, kwlen, kwtype, kwbyte, name, date, etype
+    self, grid, pfile, kwname, kwlen, kwtype, kwbyte, name, date, etype, values=None
 ):
-    """Import the actual record"""
+    """Import the actual record, or use record values that are already read"""
 
-    values = _eclbin.eclbin_record(pfile, kwname, kwlen, kwtype, kwbyte)
+    if values is None:
+        values = _eclbin.eclbin_record(pfile, kwname, kwlen, kwtype, kwbyte)
 
     self._isdiscrete = False
     use_undef = xtgeo.UNDEF
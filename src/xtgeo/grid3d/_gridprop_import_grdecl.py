@@ -1,15 +1,15 @@
 """Importing grid props from GRDECL, ascii or binary"""
 
 
-import re
+import mmap
 import os
-from tempfile import mkstemp
+import re
+import warnings
 
 import numpy as np
 import numpy.ma as ma
 
 import xtgeo
-import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 
 from . import _grid_eclbin_record as _eclbin
 from . import _grid3d_utils as utils
@@ -83,8 +83,8 @@ def import_bgrdecl_prop(self, pfile, name="unknown", grid=None):
     pfile.cfclose()
 
 
-def import_grdecl_prop(self, pfile, name="unknown", grid=None):
-    """Read a GRDECL ASCII property record"""
+def import_grdecl_prop(self, pfile, name="unknown", grid=None, _values=None):
+    """Read a GRDECL ASCII property record, or use values already read"""
 
     if grid is None:
         raise ValueError("A grid instance is required as argument")
@@ -96,34 +96,163 @@ def import_grdecl_prop(self, pfile, name="unknown", grid=None):
     self._filesrc = pfile
     actnumv = grid.get_actnum().values
 
-    # This requires that the Python part clean up comments
-    # etc, and make a tmp file.
-    fds, tmpfile = mkstemp(prefix="tmpxtgeo")
-    os.close(fds)
-
-    with open(pfile.name, "r") as oldfile, open(tmpfile, "w") as newfile:
-        for line in oldfile:
-            if not (re.search(r"^--", line) or re.search(r"^\s+$", line)):
-                newfile.write(line)
-
-    # now read the property
-    nlen = self._ncol * self._nrow * self._nlay
-    ier, values = _cxtgeo.grd3d_import_grdecl_prop(
-        tmpfile,
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        name,
-        nlen,
-        0,
-    )
+    values = _values
+    if values is None:
+        values = read_grdecl_keywords(pfile, [name])[name]
+
+    if values.size != self._ncol * self._nrow * self._nlay:
+        raise ValueError(
+            "Wrong number of values for {} in {}: {}, expected {}".format(
+                name, pfile.name, values.size, self._ncol * self._nrow * self._nlay
+            )
+        )
+
+    # the property in the file is stored in F order
+    values = values.reshape(self.dimensions, order="F")
+    values = np.ascontiguousarray(values)
+
+    # default values from repeats without value (e.g. 3*) are NaN, and masked
+    self.values = ma.masked_where((actnumv == 0) | np.isnan(values), values)
+
+
+# a keyword is a single word starting with a letter, alone on a line (except comment)
+_GRDECL_KEYWORD = re.compile(
+    rb"^[ \t]*([A-Za-z][A-Za-z0-9_]{0,31})[ \t]*(?:--[^\n]*)?\r?$", re.MULTILINE
+)
+_GRDECL_SLASH_OR_COMMENT = re.compile(rb"/|--")
+_GRDECL_COMMENT = re.compile(rb"--[^\n]*")
+_GRDECL_TOKEN = re.compile(rb"\S*")
+
 
-    os.remove(tmpfile)
+def read_grdecl_keywords(pfile, names):
+    """Read one or more keywords from a GRDECL ASCII file, in one pass.
 
-    if ier != 0:
+    The file is memory mapped, and searched for the requested keywords; no
+    temporary file is made. For each keyword found, only the text up to the
+    terminating slash is parsed, where the repeat syntax ``N*value`` is expanded
+    with numpy. The first occurence of a keyword is used.
+
+    Args:
+        pfile (_XTGeoFile): xtgeo file instance
+        names (list of str): Keyword names
+
+    Returns:
+        A dict with name and 1D numpy float64 array of values, in file order.
+
+    Raises:
+        xtgeo.KeywordNotFoundError: A keyword is not found in the file
+    """
+    wanted = set(names)
+    result = {}
+
+    if pfile.memstream:
+        _read_grdecl_buffer(pfile.file.getvalue(), wanted, result)
+    else:
+        with open(pfile.file, "rb") as stream:
+            if os.fstat(stream.fileno()).st_size > 0:
+                with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    _read_grdecl_buffer(buf, wanted, result)
+
+    missing = [name for name in names if name not in result]
+    if missing:
         raise xtgeo.KeywordNotFoundError(
-            "Cannot import {}, not present in file {}?".format(name, pfile)
+            "Cannot import {}, not present in file {}?".format(missing, pfile.name)
         )
+    return result
+
+
+def _read_grdecl_buffer(buf, wanted, result):
+    """Find keywords in a bytes-like buffer, and add parsed values to result."""
+    pos = 0
+    while len(result) < len(wanted):
+        match = _GRDECL_KEYWORD.search(buf, pos)
+        if match is None:
+            break
+
+        pos = match.end()
+        name = match.group(1).decode()
+        if name not in wanted or name in result:
+            continue
+
+        logger.info("Found keyword %s at byte %s", name, match.start())
+        end = _grdecl_terminator(buf, pos, name)
+        result[name] = _grdecl_values(buf[pos:end])
+        pos = end + 1
+
+
+def _grdecl_terminator(buf, pos, name):
+    """Return the position of the slash ending the record, skipping comments."""
+    while True:
+        match = _GRDECL_SLASH_OR_COMMENT.search(buf, pos)
+        if match is None:
+            raise ValueError(f"No terminating slash found for keyword {name}")
+        if match.group() == b"/":
+            return match.start()
+        pos = buf.find(b"\n", match.end())
+        if pos == -1:
+            raise ValueError(f"No terminating slash found for keyword {name}")
+
+
+def _grdecl_values(text):
+    """Parse the values of a record as float64, expanding repeats as 3*0.25.
+
+    The plain numbers are parsed by numpy in one go; only the repeat tokens are
+    located one by one (from the stars). A repeat without value (e.g. 3*) means
+    default values, which here are NaN.
+    """
+    if b"--" in text:
+        text = _GRDECL_COMMENT.sub(b"", text)
+    if b"D" in text or b"d" in text:
+        # Fortran style exponent, e.g. 1.0D+02
+        text = text.replace(b"D", b"E").replace(b"d", b"e")
+
+    # older numpy versions only warn on tokens that are not numbers
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return _grdecl_parse(text)
+        except DeprecationWarning as err:
+            raise ValueError(f"Cannot parse GRDECL values: {err}") from err
+
+
+def _grdecl_parse(text):
+    """Parse text without comments; the chunks between repeats are parsed by numpy."""
+    if b"*" not in text:
+        return _grdecl_numbers(text)
+
+    chunks = []
+    repvalues = []
+    repcounts = []
+    pos = 0
+    star = text.find(b"*")
+    while star != -1:
+        # the repeat count are the digits before the star, the value follows it
+        start = star
+        while start > pos and text[start - 1 : start].isdigit():
+            start -= 1
+        if start == star or (start > 0 and not text[start - 1 : start].isspace()):
+            raise ValueError(f"Cannot parse GRDECL repeat at byte {star}")
+        end = _GRDECL_TOKEN.match(text, star + 1).end()
+
+        chunks.append(_grdecl_numbers(text[pos:start]))
+        repvalues.append(float(text[star + 1 : end]) if end > star + 1 else np.nan)
+        repcounts.append(int(text[start:star]))
+
+        pos = end
+        star = text.find(b"*", pos)
+    chunks.append(_grdecl_numbers(text[pos:]))
+
+    # each repeat value is inserted after its preceding chunk, then expanded
+    where = np.cumsum([chunk.size for chunk in chunks[:-1]])
+    numbers = np.concatenate(chunks)
+    values = np.insert(numbers, where, repvalues)
+    counts = np.insert(np.ones(numbers.size, dtype=np.int64), where, repcounts)
+    return np.repeat(values, counts)
+
+
+def _grdecl_numbers(text):
+    """Parse whitespace separated numbers (no repeats) as a float64 array."""
+    if not text or text.isspace():
+        return np.zeros(0, dtype=np.float64)
 
-    self.values = values.reshape(self.dimensions)
-    self.values = ma.masked_where(actnumv == 0, self.values)
+    return np.fromstring(text, dtype=np.float64, sep=" ")
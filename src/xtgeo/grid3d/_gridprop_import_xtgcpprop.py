@@ -7,6 +7,7 @@ from collections import OrderedDict
 import numpy as np
 
 import xtgeo
+import xtgeo.common.calc as xcalc
 import xtgeo.common.sys as xsys
 
 xtg = xtgeo.common.XTGeoDialog()
@@ -14,7 +15,7 @@ xtg = xtgeo.common.XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
 
-def import_xtgcpprop(self, mfile, ijrange=None, zerobased=False):
+def import_xtgcpprop(self, mfile, ijrange=None, zerobased=False, ijkrange=None):
     """Using pure python for experimental xtgcpprop import.
 
     Args:
@@ -23,6 +24,9 @@ def import_xtgcpprop(self, mfile, ijrange=None, zerobased=False):
         ijrange (list-like): List or tuple with 4 members [i_from, i_to, j_from, j_to]
             where cell indices are zero based (starts with 0)
         zerobased (bool): If ijrange basis is zero or one.
+        ijkrange (list-like): List or tuple with 6 members (i1, i2, j1, j2, k1, k2),
+            see Grid.from_hdf(). The file is memory mapped and only the sub box is
+            read.
 
     """
     #
@@ -44,9 +48,21 @@ def import_xtgcpprop(self, mfile, ijrange=None, zerobased=False):
     vals = None
     narr = ncol * nrow * nlay
 
-    ncolnew = nrownew = 0
+    ncolnew = nrownew = nlaynew = 0
 
-    if ijrange:
+    if ijkrange is not None:
+        i1, j1, k1, ncolnew, nrownew, nlaynew = xcalc.ijkrange_to_box(
+            ncol, nrow, nlay, ijkrange, zerobased
+        )
+        allvals = xsys.npfromfile(
+            mfile.file, dtype=dtype, count=narr, offset=offset, mmap=True
+        ).reshape(ncol, nrow, nlay)
+        vals = np.array(
+            allvals[i1 : i1 + ncolnew, j1 : j1 + nrownew, k1 : k1 + nlaynew]
+        )
+        del allvals
+
+    elif ijrange:
         vals, ncolnew, nrownew = _import_xtgcpprop_partial(
             mfile, nbyte, dtype, offset, ijrange, zerobased, ncol, nrow, nlay
         )
@@ -72,7 +88,11 @@ def import_xtgcpprop(self, mfile, ijrange=None, zerobased=False):
         else:
             setattr(self, "_" + myattr, req[myattr])
 
-    if ijrange:
+    if ijkrange is not None:
+        self._ncol = ncolnew
+        self._nrow = nrownew
+        self._nlay = nlaynew
+    elif ijrange:
         self._ncol = ncolnew
         self._nrow = nrownew
 
@@ -5,8 +5,7 @@ import numpy as np
 
 import xtgeo
 from xtgeo.common import XTGeoDialog
-from xtgeo.grid3d import _gridprop_lowlevel as gl
-import xtgeo.cxtgeo._cxtgeo as _cxtgeo
+from xtgeo.xyz import _xyz_polymask
 
 xtg = XTGeoDialog()
 
@@ -86,44 +85,21 @@ def operation_polygons(self, poly, value, opname="add", inside=True):
     if not isinstance(poly, xtgeo.xyz.Polygons):
         raise ValueError("The poly input is not a Polygons instance")
 
-    # make a copy of the array which is used a "filter" or "proxy"
-    # value will be 1 inside polygons, 0 outside. Undef cells are kept as is
     dtype = self.dtype
 
-    proxy = self.copy()
-    proxy.discrete_to_continuous()
+    # mask for active cells where cell midpoint is inside (or outside) the polygons
+    pmask = _xyz_polymask.PolygonsMask(poly)
+    for id_ in pmask.notclosed:
+        xtg.warn(f"Polygon {id_} is not closed")
 
-    proxy.values *= 0.0
-    cvals = gl.update_carray(proxy)
+    xprop, yprop, _ = grid.get_xyz(asmasked=False)
+    xvals = np.ma.filled(xprop.values, fill_value=np.nan)
+    yvals = np.ma.filled(yprop.values, fill_value=np.nan)
 
-    idgroups = poly.dataframe.groupby(poly.pname)
-
-    for id_, grp in idgroups:
-        xcor = grp[poly.xname].values
-        ycor = grp[poly.yname].values
-
-        ier = _cxtgeo.grd3d_setval_poly(
-            xcor,
-            ycor,
-            self.ncol,
-            self.nrow,
-            self.nlay,
-            grid._coordsv,
-            grid._zcornsv,
-            grid._actnumsv,
-            cvals,
-            1,
-        )
-        if ier == -9:
-            print("## Polygon no {} is not closed".format(id_ + 1))
-
-    gl.update_values_from_carray(proxy, cvals, np.float64, delete=True)
-
-    proxyv = proxy.values.astype(np.int8)
-
-    proxytarget = 1
+    proxyv = pmask.inside_any(xvals.ravel(), yvals.ravel()).reshape(xvals.shape)
     if not inside:
-        proxytarget = 0
+        proxyv = ~proxyv
+    proxyv &= grid.get_actnum().values == 1
 
     if opname == "add":
         tmp = self.values.copy() + value
@@ -155,5 +131,5 @@ def operation_polygons(self, poly, value, opname="add", inside=True):
     # convert tmp back to correct dtype
     tmp = tmp.astype(dtype)
 
-    self.values[proxyv == proxytarget] = tmp[proxyv == proxytarget]
+    self.values[proxyv] = tmp[proxyv]
     del tmp
@@ -5,6 +5,8 @@ from copy import deepcopy
 import xtgeo
 
 from xtgeo.grid3d import _gridprop_import_eclrun
+from xtgeo.grid3d import _gridprop_import_grdecl
+from xtgeo.grid3d import _grid_eclbin_record as _eclbin
 
 from .grid_property import GridProperty
 from . import _grid3d_utils as utils
@@ -14,6 +16,7 @@ xtg = xtgeo.XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
 # self is the GridProperties() instance
+# pylint: disable=protected-access
 
 # On "strict" keyword: Default is (True, False)
 # A strict (False, False) simply means that if keyname, optionally with date is not
@@ -51,6 +54,28 @@ def import_ecl_output(
         )
 
 
+def import_grdecl(self, pfile, names=None, grid=None):
+    """Import several GRDECL ASCII properties, reading the file once"""
+
+    if not grid:
+        raise ValueError("Grid Geometry object is missing")
+
+    if not names or names == "all":
+        raise ValueError("A list of property names is required for grdecl files")
+
+    values = _gridprop_import_grdecl.read_grdecl_keywords(pfile, names)
+
+    props = list()
+    for name in names:
+        prop = GridProperty()
+        _gridprop_import_grdecl.import_grdecl_prop(
+            prop, pfile, name=name, grid=grid, _values=values[name]
+        )
+        props.append(prop)
+
+    self.append_props(props)
+
+
 def _import_ecl_output_v2_init(self, pfile, names, grid, strict):
     """Import INIT parameters"""
 
@@ -150,7 +175,9 @@ def _import_ecl_output_v2_rsta(
             for date in usedates:
                 usenamedatepairs.append((name, date))
 
-    # Do the actual import
+    # Find what to import, then do the actual import
+    entries = list()
+    usenames = list()
     for namedate in usenamedatepairs:
         name, date = namedate
         skipentry = False
@@ -172,13 +199,51 @@ def _import_ecl_output_v2_rsta(
         if skipentry:
             continue
 
-        prop = GridProperty()
-
         usename = name + "_" + str(date)
         if namestyle == 1:
             sdate = str(date)
             usename = name + "--" + sdate[0:4] + "_" + sdate[4:6] + "_" + sdate[6:8]
 
+        entries.append(namedate)
+        usenames.append(usename)
+
+    props = _import_restart_bulk(pfile, entries, grid, kwlist)
+
+    for (_, date), usename, prop in zip(entries, usenames, props):
+        self._names.append(usename)
+        self._props.append(prop)
+
+        self._dates.append(date)
+
+    self._ncol = grid.ncol
+    self._nrow = grid.nrow
+    self._nlay = grid.nlay
+
+
+def _import_restart_bulk(pfile, entries, grid, kwlist):
+    """Import a list of (name, date) RESTART properties, returned in same order.
+
+    Records that exist for the name and date are read in one pass over the file in
+    byte order, from a memory mapped buffer; keywords not asked for are never read.
+    Other entries (e.g. saturations that are derived from other saturations) and
+    dual porosity grids use the general importer, one property at a time.
+    """
+    records = dict()
+    for kwname, kwtype, kwlen, kwbyte, kwdate in kwlist.itertuples(
+        index=False, name=None
+    ):
+        # the first record wins, as in _gridprop_import_eclrun
+        records.setdefault((kwname, str(kwdate)), (kwname, kwlen, kwtype, kwbyte))
+
+    props = [None] * len(entries)
+    bulk = list()
+    for inum, (name, date) in enumerate(entries):
+        record = records.get((name, str(date)))
+        if record and record[2] in _eclbin.ECLBIN_DTYPES and not grid.dualporo:
+            bulk.append((record[3], inum, record))
+            continue
+
+        prop = GridProperty()
         # use a private GridProperty function, since filehandle
         _gridprop_import_eclrun.import_eclbinary(
             prop,
@@ -189,15 +254,36 @@ def _import_ecl_output_v2_rsta(
             etype=5,
             _kwlist=kwlist,
         )
+        props[inum] = prop
 
-        self._names.append(usename)
-        self._props.append(prop)
+    if not bulk:
+        return props
 
-        self._dates.append(date)
+    # metadata and dimension checks are the same for all records in the file
+    template = GridProperty()
+    _gridprop_import_eclrun._import_eclbinary_meta(
+        template, pfile, kwlist, 5, entries[bulk[0][1]][1], grid
+    )
+    _gridprop_import_eclrun._import_eclbinary_checks1(template, grid)
 
-    self._ncol = grid.ncol
-    self._nrow = grid.nrow
-    self._nlay = grid.nlay
+    logger.info("Bulk read of %s records from RESTART...", len(bulk))
+    buffer = _eclbin.eclbin_buffer(pfile)
+    for _, inum, record in sorted(bulk):
+        name, date = entries[inum]
+        values = _eclbin.eclbin_record_buffer(buffer, *record)
+
+        prop = GridProperty()
+        prop._ncol = template._ncol
+        prop._nrow = template._nrow
+        prop._nlay = template._nlay
+        _gridprop_import_eclrun._import_eclbinary_prop(
+            prop, grid, pfile, *record, name, date, 5, values=values
+        )
+        props[inum] = prop
+    del buffer
+    logger.info("Bulk read of %s records from RESTART... done", len(bulk))
+
+    return props
 
 
 def _process_valid_namesdates(kwlist, grid):
@@ -5,7 +5,7 @@ import pathlib
 import json
 import warnings
 from pathlib import Path
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 from typing import Union, Optional, List, Tuple
 
 import numpy as np
@@ -16,6 +16,7 @@ import xtgeo
 from xtgeo.common import XTGDescription
 from ._grid3d import _Grid3D
 
+from . import _grid_cache
 from . import _grid_hybrid
 from . import _grid_import
 from . import _grid_import_xtgcpgeom
@@ -48,7 +49,13 @@ logger = xtg.functionlogger(__name__)
 
 
 def grid_from_file(
-    gfile, fformat=None, initprops=None, restartprops=None, restartdates=None
+    gfile,
+    fformat=None,
+    initprops=None,
+    restartprops=None,
+    restartdates=None,
+    ijkrange=None,
+    zerobased=False,
 ):
     """Read a grid (cornerpoint) from file and an returns a Grid() instance.
 
@@ -59,6 +66,7 @@ def grid_from_file(
         import xtgeo
         mygrid = xtgeo.grid_from_file("reek.roff")
 
+    .. versionchanged:: 2.15 Added ``ijkrange`` and ``zerobased``
     """
     obj = Grid()
 
@@ -68,6 +76,8 @@ def grid_from_file(
         restartprops=restartprops,
         restartdates=restartdates,
         fformat=fformat,
+        ijkrange=ijkrange,
+        zerobased=zerobased,
     )
 
     return obj
@@ -173,7 +183,8 @@ class Grid(_Grid3D):
             restartdates: List of restart dates as YYYYMMDD (Eclipse based ``eclrun``
                 import).
             ijkrange: Tuple of 6 integers defining (imin, imax, jmin, jmax, kmin, kmax)
-                when import from ``hdf`` files. Ranges are implicit at both ends.
+                for reading a sub box only, see :meth:`from_file`. Ranges are
+                inclusive at both ends.
             zerobased: Whether `ijkrange` uses 1 (default) or 0 as base.
 
         Example::
@@ -231,17 +242,30 @@ class Grid(_Grid3D):
         # See _grid3d_fence for instance; note! reset this if any kind of grid change!
         self._tmp = {}
 
+        # counter for in place geometry changes, see _touch_geometry()
+        self._geometry_version = 0
+
+        # keep the arrays in the other xtgformat when switching, see keep_both_layouts
+        self._keep_both_xtgformats = False
+
+        # cache of geometry derived properties, see set_geometry_cache
+        self._derived_cache_maxbytes = 0  # opt-in, see set_geometry_cache()
+        self._derived_cache_stats = Counter()
+
         if gfile is not None:
             gfile = pathlib.Path(gfile)
-            if gfile.suffix == "hdf":
+            if gfile.suffix in (".hdf", ".h5", ".hdf5"):
                 self.from_hdf(gfile, ijkrange, zerobased)
-            self.from_file(
-                gfile,
-                fformat=fformat,
-                initprops=initprops,
-                restartprops=restartprops,
-                restartdates=restartdates,
-            )
+            else:
+                self.from_file(
+                    gfile,
+                    fformat=fformat,
+                    initprops=initprops,
+                    restartprops=restartprops,
+                    restartdates=restartdates,
+                    ijkrange=ijkrange,
+                    zerobased=zerobased,
+                )
         else:
             # make a simple empty box grid (from version 2.13)
             self.create_box((self._ncol, self._nrow, self._nlay))
@@ -540,24 +564,28 @@ class Grid(_Grid3D):
     def generate_hash(self, hashmethod="md5"):
         """Return a unique hash ID for current instance.
 
-        See :meth:`~xtgeo.common.sys.generic_hash()` for documentation.
+        The geometry arrays are hashed from their raw data. See
+        :meth:`~xtgeo.common.sys.generic_hash()` for documentation of hashmethod.
+
+        The hash is memoized until the geometry is changed, so it can be used as
+        a cache key. As for the arrays kept in the other xtgformat, the memo is
+        invalidated by :meth:`_touch_geometry`, which grid methods call when they
+        change the geometry; code editing the private geometry arrays in place
+        must call it as well.
 
         .. versionadded:: 2.14
+        .. versionchanged:: 2.15 Hash the full array data, memoized until changed
         """
-        required = (
-            "ncol",
-            "nrow",
-            "nlay",
-            "coordsv",
-            "zcornsv",
-            "actnumsv",
-        )
-
-        gid = ""
-        for req in required:
-            gid += f"{getattr(self, '_' + req)}"
+        key = (hashmethod, self._xtgformat, self._geometry_version)
+        memo = self._tmp.setdefault("hash", {})
+        if key not in memo:
+            scalars = (self._ncol, self._nrow, self._nlay)
+            arrays = (self._coordsv, self._zcornsv, self._actnumsv)
+            memo[key] = xtgeo.common.sys.generic_hash_arrays(
+                scalars, arrays, hashmethod=hashmethod
+            )
 
-        return xtgeo.common.sys.generic_hash(gid, hashmethod=hashmethod)
+        return memo[key]
 
     # ==================================================================================
     # Create/import/export
@@ -720,7 +748,14 @@ class Grid(_Grid3D):
         )
 
     def from_file(
-        self, gfile, fformat=None, initprops=None, restartprops=None, restartdates=None
+        self,
+        gfile,
+        fformat=None,
+        initprops=None,
+        restartprops=None,
+        restartdates=None,
+        ijkrange=None,
+        zerobased=False,
     ):
         """Import grid geometry from file, and makes an instance of this class.
 
@@ -728,6 +763,13 @@ class Grid(_Grid3D):
         key, e.g. fformat egrid will be guessed if ".EGRID". The "eclipserun"
         will try to input INIT and UNRST file in addition the grid in "one go".
 
+        With ``ijkrange`` only a sub box of the grid is kept, e.g. for cutting out
+        a sector model. For the xtgcpgeom (xtgf) format the arrays are memory mapped
+        and only the sub box is read. Other formats (e.g. ROFF) are read in full
+        and then cropped, as the file layout does not allow direct access to a sub
+        box; any properties read together with the grid ("eclipserun") are cropped
+        as well.
+
         Arguments:
             gfile (str or Path): File name to be imported. If fformat="eclipse_run"
                 then a fileroot name shall be input here, see example below.
@@ -738,6 +780,10 @@ class Grid(_Grid3D):
                 special value "all" can be get all properties found in the INIT file
             restartprops (str list): Optional, see initprops
             restartdates (int list): Optional, required if restartprops
+            ijkrange (list-like): Read a sub box only, e.g. (1, 20, 1, 30, 1, 3) as
+                (i1, i2, j1, j2, k1, k2), inclusive for both ends. Existing
+                boundaries can be given by "min" and "max". See :meth:`from_hdf`.
+            zerobased (bool): If True index in ijkrange is zero based.
 
         Example::
 
@@ -753,8 +799,16 @@ class Grid(_Grid3D):
             >>> xg = Grid()
             >>> xg.from_file(mycase, fformat="eclipserun", initprops="all")
 
+        Example reading a sector only::
+
+            >>> xg = Grid()
+            >>> xg.from_file("big.xtgf", ijkrange=(100, 180, 40, 120, "min", "max"))
+
         Raises:
             OSError: if file is not found etc
+            ValueError: The ijkrange spesification exceeds boundaries.
+
+        .. versionchanged:: 2.15 Added ``ijkrange`` and ``zerobased``
         """
         gfile = xtgeo._XTGeoFile(gfile, mode="rb")
 
@@ -765,6 +819,8 @@ class Grid(_Grid3D):
             initprops=initprops,
             restartprops=restartprops,
             restartdates=restartdates,
+            ijkrange=ijkrange,
+            zerobased=zerobased,
         )
         self._tmp = {}
         self._metadata.required = self
@@ -796,21 +852,31 @@ class Grid(_Grid3D):
         _grid_import_xtgcpgeom.import_hdf5_cpgeom(
             self, gfile, ijkrange=ijkrange, zerobased=zerobased
         )
+        self._tmp = {}
 
-    def from_xtgf(self, gfile, mmap=False):
+    def from_xtgf(self, gfile, mmap=False, ijkrange=None, zerobased=False):
         """Import grid geometry from native xtgeo file format (experimental!).
 
         Args:
             gfile (str): Name of output file
             mmap (bool): If true, reading with memory mapping is active
+            ijkrange (list-like): Partial read, see :meth:`from_hdf`. The file
+                is then memory mapped and only the sub box is read.
+            zerobased (bool): If True index in ijkrange is zero based.
 
         Example::
 
             xg.from_xtgf("myfile_grid.xtg")
+            xg.from_xtgf("myfile_grid.xtg", ijkrange=(1, 10, 10, 15, 1, 4))
+
+        .. versionchanged:: 2.15 Added ``ijkrange`` and ``zerobased``
         """
         gfile = xtgeo._XTGeoFile(gfile, mode="wb", obj=self)
 
-        _grid_import_xtgcpgeom.import_xtgcpgeom(self, gfile, mmap)
+        _grid_import_xtgcpgeom.import_xtgcpgeom(
+            self, gfile, mmap=mmap, ijkrange=ijkrange, zerobased=zerobased
+        )
+        self._tmp = {}
 
     def from_roxar(
         self, projectname, gname, realisation=0, dimensions_only=False, info=False
@@ -862,6 +928,64 @@ class Grid(_Grid3D):
         other = _grid_etc1.copy(self)
         return other
 
+    def keep_both_layouts(self, keep=True):
+        """Keep the geometry arrays in both internal layouts, to avoid conversions.
+
+        Some grid methods work on a legacy internal layout of the geometry arrays,
+        while others work on the current layout, and the arrays are converted when
+        switching. With ``keep=True`` the arrays in the previous layout are kept at
+        each switch, and reused as long as the geometry is unchanged, so a workflow
+        mixing e.g. :meth:`get_dz` and :meth:`get_bulk_volume` converts only once.
+        This uses about twice the memory for the geometry.
+
+        Args:
+            keep (bool): If True, keep both layouts; if False, release the kept
+                arrays (default behaviour).
+
+        .. versionadded:: 2.15
+        """
+        self._keep_both_xtgformats = keep
+        if not keep:
+            self._tmp.pop("xtgformat", None)
+
+    def set_geometry_cache(self, maxbytes=_grid_cache.DEFAULT_MAXBYTES):
+        """Set the memory cap for the cache of geometry derived properties.
+
+        The properties from :meth:`get_dz`, :meth:`get_dxdy`, :meth:`get_xyz`,
+        :meth:`get_bulk_volume` and :meth:`get_ijk` depend only on the geometry,
+        and can be cached per set of arguments until the grid is changed. The
+        cache is off by default. The least recently used entries are removed when
+        the cap is exceeded. A cache hit returns a copy, so the results can be
+        modified freely; hence the cache pays off for properties that are costly to
+        compute, such as :meth:`get_bulk_volume` and :meth:`get_xyz`.
+
+        Args:
+            maxbytes (int): Memory cap for the cached values, in bytes. Use 0 to
+                disable (and clear) the cache. Default is 512 MiB.
+
+        Example::
+
+            grd = xtgeo.grid_from_file("mygrid.roff")
+            grd.set_geometry_cache()  # enable, with default cap
+
+        .. versionadded:: 2.15
+        """
+        self._derived_cache_maxbytes = int(maxbytes)
+        if not maxbytes:
+            self._tmp.pop("derived", None)
+        else:
+            _grid_cache._evict(self, self._tmp.get("derived", {}), maxbytes)
+
+    def geometry_cache_info(self):
+        """Return a dict with statistics of the geometry derived properties cache.
+
+        The keys are "hits", "misses", "evictions", "entries", "nbytes" and
+        "maxbytes", see :meth:`set_geometry_cache`.
+
+        .. versionadded:: 2.15
+        """
+        return _grid_cache.cache_info(self)
+
     def describe(self, details=False, flush=True):
         """Describe an instance by printing to stdout."""
         logger.info("Print a description...")
@@ -1274,6 +1398,8 @@ class Grid(_Grid3D):
         else:
             self._actnumsv = np.ma.filled(actnum.values, fill_value=0).astype(np.int32)
 
+        self._touch_geometry()
+
     def get_dz(self, name="dZ", flip=True, asmasked=True, mask=None):
         """Return the dZ as GridProperty object.
 
@@ -1293,7 +1419,12 @@ class Grid(_Grid3D):
         if mask is not None:
             asmasked = self._evaluate_mask(mask)
 
-        deltaz = _grid_etc1.get_dz(self, name=name, flip=flip, asmasked=asmasked)
+        deltaz = _grid_cache.cached_derived(
+            self,
+            "get_dz",
+            (name, flip, asmasked),
+            lambda: _grid_etc1.get_dz(self, name=name, flip=flip, asmasked=asmasked),
+        )
 
         return deltaz
 
@@ -1310,7 +1441,12 @@ class Grid(_Grid3D):
         Returns:
             Two XTGeo GridProperty objects (dx, dy).
         """
-        deltax, deltay = _grid_etc1.get_dxdy(self, names=names, asmasked=asmasked)
+        deltax, deltay = _grid_cache.cached_derived(
+            self,
+            "get_dxdy",
+            (tuple(names), asmasked),
+            lambda: _grid_etc1.get_dxdy(self, names=names, asmasked=asmasked),
+        )
 
         # return the property objects
         return deltax, deltay
@@ -1385,8 +1521,13 @@ class Grid(_Grid3D):
         .. versionadded:: 2.13 (as experimental)
 
         """
-        return _grid_etc1.get_bulk_volume(
-            self, name=name, asmasked=asmasked, precision=precision
+        return _grid_cache.cached_derived(
+            self,
+            "get_bulk_volume",
+            (name, asmasked, precision),
+            lambda: _grid_etc1.get_bulk_volume(
+                self, name=name, asmasked=asmasked, precision=precision
+            ),
         )
 
     def get_indices(self, names=("I", "J", "K")):
@@ -1422,8 +1563,13 @@ class Grid(_Grid3D):
         if mask is not None:
             asmasked = self._evaluate_mask(mask)
 
-        ixc, jyc, kzc = _grid_etc1.get_ijk(
-            self, names=names, asmasked=asmasked, zerobased=zerobased
+        ixc, jyc, kzc = _grid_cache.cached_derived(
+            self,
+            "get_ijk",
+            (tuple(names), asmasked, zerobased),
+            lambda: _grid_etc1.get_ijk(
+                self, names=names, asmasked=asmasked, zerobased=zerobased
+            ),
         )
 
         # return the objects
@@ -1457,6 +1603,8 @@ class Grid(_Grid3D):
 
         .. versionadded:: 2.6
         .. versionchanged:: 2.8 Added keywords `columnnames`, `fmt`, `undef`
+        .. versionchanged:: 2.15 The lookup index is reused while the geometry is
+           unchanged, see :meth:`get_fence_index`
         """
         ijklist = _grid_etc1.get_ijk_from_points(
             self,
@@ -1490,8 +1638,11 @@ class Grid(_Grid3D):
         if mask is not None:
             asmasked = self._evaluate_mask(mask)
 
-        xcoord, ycoord, zcoord = _grid_etc1.get_xyz(
-            self, names=names, asmasked=asmasked
+        xcoord, ycoord, zcoord = _grid_cache.cached_derived(
+            self,
+            "get_xyz",
+            (tuple(names), asmasked),
+            lambda: _grid_etc1.get_xyz(self, names=names, asmasked=asmasked),
         )
 
         # return the objects
@@ -1712,7 +1863,7 @@ class Grid(_Grid3D):
         if self._xtgformat == 1:
             self._actnumsv = self._actnumsv.flatten()
 
-        self._tmp = {}
+        self._touch_geometry()
 
     def inactivate_by_dz(self, threshold):
         """Inactivate cells thinner than a given threshold."""
@@ -2146,6 +2297,112 @@ class Grid(_Grid3D):
         logger.info("Getting randomline... DONE")
         return res
 
+    def get_randomlines(
+        self,
+        fencespecs,
+        prop,
+        zmin=None,
+        zmax=None,
+        zincrement=1.0,
+        hincrement=None,
+        atleast=5,
+        nextend=2,
+        nthreads=None,
+    ):
+        """Get several sampled randomlines in one call.
+
+        This is as :meth:`get_randomline`, but for a list of fence specifications,
+        or a Polygons instance with several polylines (one fence per POLY_ID). The
+        fence index (see :meth:`get_fence_index`) and the property values are
+        prepared once and shared, and the fences are sampled in a pool of threads.
+
+        Polygons are always resampled to a fence here; a hincrement of False is
+        treated as None.
+
+        Args:
+            fencespecs (list or :class:`~xtgeo.xyz.polygons.Polygons`): A list of
+                2D numpy arrays and/or Polygons instances, or a single Polygons
+                instance with one or more polylines.
+            prop (GridProperty or str): The grid property object, or name, which shall
+                be sampled.
+            zmin (float): Minimum Z (default is Grid Z minima/origin)
+            zmax (float): Maximum Z (default is Grid Z maximum)
+            zincrement (float): Sampling vertically, default is 1.0
+            hincrement (float): Resampling horizontally of Polygons. If None
+                (default), the distance will be deduced automatically.
+            atleast (int): Minimum number of horizontal samples (Polygons only)
+            nextend (int): Extend with nextend * hincrement in both ends
+                (Polygons only)
+            nthreads (int): Number of threads; default (None) is decided by Python's
+                ThreadPoolExecutor.
+
+        Returns:
+            A list of tuples (hmin, hmax, vmin, vmax, ndarray2d), in the same order
+            as the fences.
+
+        Example::
+
+            poly = xtgeo.Polygons("some_fences.pol")  # several POLY_ID's
+            for hmin, hmax, vmin, vmax, arr in mygrid.get_randomlines(poly, poro):
+                plt.imshow(arr, cmap="rainbow", extent=(hmin, hmax, vmax, vmin))
+
+        .. versionadded:: 2.15
+        """
+        logger.info("Getting randomlines...")
+
+        res = _grid3d_fence.get_randomlines(
+            self,
+            fencespecs,
+            prop,
+            zmin=zmin,
+            zmax=zmax,
+            zincrement=zincrement,
+            hincrement=hincrement if hincrement else None,
+            atleast=atleast,
+            nextend=nextend,
+            nthreads=nthreads,
+        )
+        logger.info("Getting randomlines... DONE")
+        return res
+
+    def get_fence_index(self):
+        """Return the lookup index used for randomlines and IJK from points.
+
+        The index (a :class:`~xtgeo.grid3d.GridFenceIndex`) is made on first use
+        and kept with the grid instance (also for copies). It can be stored to
+        file with its ``to_file()`` method, and attached to the same grid in another
+        process with :meth:`set_fence_index`, which avoids the warm-up cost of
+        making it.
+
+        Example::
+
+            grd = xtgeo.grid_from_file("mygrid.roff")
+            grd.get_fence_index().to_file("mygrid.fenceindex.npz")
+
+            # e.g. in a service worker:
+            grd = xtgeo.grid_from_file("mygrid.roff")
+            grd.set_fence_index("mygrid.fenceindex.npz")
+            hmin, hmax, vmin, vmax, arr = grd.get_randomline(fence, "PORO")
+
+        .. versionadded:: 2.15
+        """
+        return _grid3d_fence._update_tmpvars(self)
+
+    def set_fence_index(self, index):
+        """Attach a fence index, as instance or file, to the grid.
+
+        Args:
+            index (GridFenceIndex, str or Path): Index instance or file made by
+                ``GridFenceIndex.to_file()``.
+
+        Raises:
+            ValueError: If the index is not made for this grid geometry, as
+                checked by :meth:`generate_hash`.
+
+        .. versionadded:: 2.15
+        """
+        _grid3d_fence.set_fence_index(self, index)
+
     # ----------------------------------------------------------------------------------
     # Special private functions; these may only live for while
     # ----------------------------------------------------------------------------------
@@ -2158,6 +2415,15 @@ class Grid(_Grid3D):
         """Convert arrays from old structure xtgformat=1 to new xtgformat=2."""
         _grid_etc1._convert_xtgformat1to2(self)
 
+    def _touch_geometry(self):
+        """Mark that the geometry arrays are changed, e.g. in place by C routines.
+
+        Cached data derived from the geometry (such as arrays kept in the other
+        xtgformat) are then no longer used.
+        """
+        self._geometry_version += 1
+        self._tmp = {}
+
     def _xtgformat1(self):
         """Shortform... arrays from new structure xtgformat=2 to legacy xtgformat=1."""
         self._convert_xtgformat2to1()
@@ -367,8 +367,9 @@ class GridProperties(_Grid3D):
 
         Args:
             pfile (str or Path): Name of file with properties
-            fformat (str): roff/init/unrst
-            names: list of property names, e.g. ['PORO', 'PERMX'] or 'all'
+            fformat (str): roff/init/unrst/grdecl
+            names: list of property names, e.g. ['PORO', 'PERMX'] or 'all' (not
+                for grdecl, where the file is read once for all names)
             dates: list of dates on YYYYMMDD format, for restart files, or 'all'
             grid (obj): The grid geometry object (optional if ROFF)
             namestyle (int): 0 (default) for style SWAT_20110223,
@@ -394,6 +395,7 @@ class GridProperties(_Grid3D):
             KeywordFoundDateNotFoundError: The keyword but not date found
 
         .. versionadded:: 2.13 Added strict key
+        .. versionchanged:: 2.15 Added grdecl format
         """
         pfile = xtgeo._XTGeoFile(pfile, mode="rb")
 
@@ -423,6 +425,9 @@ class GridProperties(_Grid3D):
                 lst.append(GridProperty(pfile, fformat="roff", name=name))
             self.append_props(lst)
 
+        elif fformat.lower() == "grdecl":
+            _gridprops_io.import_grdecl(self, pfile, names=names, grid=grid)
+
         elif fformat.lower() in ("init", "unrst"):
             _gridprops_io.import_ecl_output(
                 self,
@@ -496,7 +501,12 @@ class GridProperties(_Grid3D):
 
     @staticmethod
     def scan_keywords(
-        pfile, fformat="xecl", maxkeys=100000, dataframe=False, dates=False
+        pfile,
+        fformat="xecl",
+        maxkeys=100000,
+        dataframe=False,
+        dates=False,
+        sidecar=False,
     ):
         """Quick scan of keywords in Eclipse binary files, or ROFF binary files.
 
@@ -521,19 +531,33 @@ class GridProperties(_Grid3D):
             dataframe (bool): If True, return a Pandas dataframe instead
             dates (bool): if True, the date is the last column (only
                 menaingful for restart files). Default is False.
+            sidecar (bool): If True, the keyword index is also stored in a file
+                next to pfile (with suffix ``.xtgkwindex``), which is reused by later
+                scans and imports, also in other processes, as long as pfile is
+                unchanged.
 
         Return:
             A list of tuples or dataframe with keyword info
 
+        The keyword index of a file is kept in memory, and reused as long as the
+        file has the same modification time and size. Hence importing many
+        properties from the same file will only scan it once.
+
         Example::
             >>> props = GridProperties()
             >>> dlist = props.scan_keywords('ECL.UNRST')
 
+        .. versionchanged:: 2.15 The index is cached, and added `sidecar`
         """
         pfile = xtgeo._XTGeoFile(pfile)
 
         dlist = utils.scan_keywords(
-            pfile, fformat=fformat, maxkeys=maxkeys, dataframe=dataframe, dates=dates
+            pfile,
+            fformat=fformat,
+            maxkeys=maxkeys,
+            dataframe=dataframe,
+            dates=dates,
+            sidecar=sidecar,
         )
 
         return dlist
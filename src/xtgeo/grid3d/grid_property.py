@@ -4,7 +4,6 @@
 
 import copy
 import numbers
-import hashlib
 import pathlib
 from types import FunctionType
 from typing import Optional, Union, Any
@@ -540,27 +539,22 @@ class GridProperty(_Grid3D):
     # Class and special methods
     # ==================================================================================
 
-    def generate_hash(self):
+    def generate_hash(self, hashmethod="sha256"):
         """str: Return a unique hash ID for current grid; can e.g. be used to compare
         two gridproperty instances with same source.
 
+        The values are hashed from their raw data. See
+        :meth:`~xtgeo.common.sys.generic_hash()` for documentation of hashmethod.
+
         .. versionadded:: 2.10
+        .. versionchanged:: 2.15 Hash the full values, added ``hashmethod``
         """
+        scalars = (self._filesrc, self._ncol, self._nrow, self._nlay)
 
-        mhash = hashlib.sha256()
-        gid = "{}{}{}{}{}{}{}".format(
-            self._filesrc,
-            self._ncol,
-            self._nrow,
-            self._nlay,
-            self._values.mean(),
-            self._values.min(),
-            self._values.max(),
+        return xtgeo.common.sys.generic_hash_arrays(
+            scalars, (self._values,), hashmethod=hashmethod
         )
 
-        mhash.update(gid.encode())
-        return mhash.hexdigest()
-
     @classmethod
     def methods(cls):
         """Returns the names of the methods in the class.
@@ -647,6 +641,7 @@ class GridProperty(_Grid3D):
         _roffapiv=1,
         ijrange=None,
         zerobased=False,
+        ijkrange=None,
     ):  # _roffapiv for devel.
         """
         Import grid property from file, and makes an instance of this class.
@@ -675,7 +670,14 @@ class GridProperty(_Grid3D):
             ijrange (list-like): A list of 4 number: (i1, i2, j1, j2) for subrange
                 of cells to read. Only applicable for xtgcpprop format.
             zerobased (bool): Input if cells counts are zero- or one-based in
-                ijrange. Only applicable for xtgcpprop format.
+                ijrange or ijkrange.
+            ijkrange (list-like): A list of 6 numbers (i1, i2, j1, j2, k1, k2) for
+                a sub box of cells to read, inclusive for both ends, where "min" and
+                "max" can be used for existing boundaries (as for
+                :meth:`Grid.from_file`). For xtgcpprop format only the sub box is
+                read from file; other formats are read in full and then cropped.
+                Note that a ``grid`` given for checks must then be the full grid,
+                and no grid link is made.
 
         Examples::
 
@@ -691,6 +693,7 @@ class GridProperty(_Grid3D):
            True if success, otherwise False
 
         .. versionchanged:: 2.8 Added gridlink option, default is True
+        .. versionchanged:: 2.15 Added ijkrange option
         """
         pfile = xtgeo._XTGeoFile(pfile, mode="rb")
 
@@ -705,9 +708,11 @@ class GridProperty(_Grid3D):
             _roffapiv=_roffapiv,
             ijrange=ijrange,
             zerobased=zerobased,
+            ijkrange=ijkrange,
         )
 
-        if grid and gridlink:
+        # a sub box property does not match the (full) grid it is checked against
+        if grid and gridlink and ijkrange is None:
             grid.append_prop(self)
 
         return obj
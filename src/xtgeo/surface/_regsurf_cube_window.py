@@ -12,6 +12,9 @@ xtg = XTGeoDialog()
 
 logger = xtg.functionlogger(__name__)
 
+# max number of stacked samples per block in _attvalues_fused, to bound temporaries
+MAXSAMPLES_BLOCK = 4000000
+
 
 ALLATTRS = [
     "max",
@@ -255,10 +258,8 @@ def _slice_constant_window(
     stacked = ma.dstack(npcollect)
     del npcollect
 
-    attvalues = dict()
-    for attr in attrlist:
-        logger.info("Running attribute %s", attr)
-        attvalues[attr] = _attvalues(attr, stacked)
+    logger.info("Running attributes %s", attrlist)
+    attvalues = _attvalues_fused(attrlist, stacked)
 
     progress.finished()
     return attvalues  # this is dict with numpies, one per attribute
@@ -323,10 +324,9 @@ def _slice_between_surfaces(
     # for cases with erosion, the two surfaces are equal
     isovalues = mul * (other.values - this.values)
 
-    attvalues = dict()
+    attvalues = _attvalues_fused(attrlist, stacked)
     for attr in attrlist:
-        attvaluestmp = _attvalues(attr, stacked)
-        attvalues[attr] = ma.masked_where(isovalues < mthreshold, attvaluestmp)
+        attvalues[attr] = ma.masked_where(isovalues < mthreshold, attvalues[attr])
 
     progress.finished()
 
@@ -380,3 +380,108 @@ def _attvalues(attribute, stacked):  # pylint: disable=too-many-branches
         attvalues = ma.array(attvalues, mask=mask, order="C")
 
     return attvalues
+
+
+def _attvalues_fused(attrlist, stacked):
+    """All requested attribute values from a numpy.ma stack, in one pass.
+
+    Same result as _attvalues() per attribute, but the stack is traversed in blocks
+    of map columns, and the sums and counts that several attributes share are
+    computed once per block, and only when a requested attribute needs them. The
+    temporary arrays are hence bounded by MAXSAMPLES_BLOCK samples, not by the
+    stack size times number of attributes.
+    """
+    for attr in attrlist:
+        if attr not in ALLATTRS:
+            raise ValueError("Invalid attribute applied: {}".format(attr))
+
+    ncol, nrow, nsamples = stacked.shape
+    data = ma.getdata(stacked)
+    mask = ma.getmaskarray(stacked)
+
+    results = {attr: np.zeros((ncol, nrow), dtype=np.float64) for attr in attrlist}
+    resmask = {attr: np.zeros((ncol, nrow), dtype=bool) for attr in attrlist}
+
+    # the shared quantities are only computed if a requested attribute needs them
+    wanted = set(attrlist)
+    usepos = bool(wanted & {"maxpos", "sumpos", "meanpos"})
+    useneg = bool(wanted & {"maxneg", "sumneg", "meanneg"})
+    usezvals = bool(wanted & {"rms", "var", "mean", "maxabs", "sumabs", "meanabs"})
+    usemean = bool(wanted & {"var", "mean"})
+    useabssum = bool(wanted & {"sumabs", "meanabs"})
+    usepossum = bool(wanted & {"sumpos", "meanpos"})
+    usenegsum = bool(wanted & {"sumneg", "meanneg"})
+
+    pos = neg = zvals = npos = nneg = mean = abssum = possum = negsum = None
+
+    step = max(1, MAXSAMPLES_BLOCK // max(1, nrow * nsamples))
+    for icol in range(0, ncol, step):
+        block = slice(icol, icol + step)
+        vals = data[block].astype(np.float64)
+        valid = ~mask[block]
+        count = valid.sum(axis=2)
+
+        if usepos:
+            pos = valid & (vals >= 0.0)
+            npos = pos.sum(axis=2)
+        if useneg:
+            neg = valid & (vals < 0.0)
+            nneg = neg.sum(axis=2)
+        if usezvals:
+            zvals = np.where(valid, vals, 0.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if usemean:
+                mean = zvals.sum(axis=2) / count
+            if useabssum:
+                abssum = np.abs(zvals).sum(axis=2)
+            if usepossum:
+                possum = np.where(pos, vals, 0.0).sum(axis=2)
+            if usenegsum:
+                negsum = np.where(neg, vals, 0.0).sum(axis=2)
+
+            blockres = {}
+            for attr in attrlist:
+                nused = count
+                if attr == "max":
+                    value = np.where(valid, vals, -np.inf).max(axis=2)
+                elif attr == "min":
+                    value = np.where(valid, vals, np.inf).min(axis=2)
+                elif attr == "rms":
+                    value = np.sqrt(np.square(zvals).sum(axis=2) / count)
+                elif attr == "var":
+                    dev = np.where(valid, vals - mean[:, :, np.newaxis], 0.0)
+                    value = np.square(dev).sum(axis=2) / count
+                elif attr == "mean":
+                    value = mean
+                elif attr == "maxpos":
+                    value = np.where(pos, vals, -np.inf).max(axis=2)
+                    nused = npos
+                elif attr == "maxneg":
+                    value = np.where(neg, vals, np.inf).min(axis=2)
+                    nused = nneg
+                elif attr == "maxabs":
+                    value = np.abs(zvals).max(axis=2)
+                elif attr == "sumpos":
+                    value = possum
+                    nused = npos
+                elif attr == "sumneg":
+                    value = negsum
+                    nused = nneg
+                elif attr == "sumabs":
+                    value = abssum
+                elif attr == "meanabs":
+                    value = abssum / count
+                elif attr == "meanpos":
+                    value = possum / npos
+                    nused = npos
+                else:  # meanneg
+                    value = negsum / nneg
+                    nused = nneg
+                blockres[attr] = (value, nused == 0)
+
+        for attr, (value, nomask) in blockres.items():
+            results[attr][block] = np.where(nomask, 0.0, value)
+            resmask[attr][block] = nomask
+
+    return {attr: ma.array(results[attr], mask=resmask[attr]) for attr in attrlist}
@@ -3,6 +3,7 @@
 
 
 import numpy as np
+import numpy.ma as ma
 import xtgeo
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.common import XTGeoDialog
@@ -11,6 +12,10 @@ xtg = XTGeoDialog()
 
 logger = xtg.functionlogger(__name__)
 
+# max number of window samples (per map node times stack size) per C call, which
+# bounds the memory of the sample stack in C
+MAXSAMPLES_BLOCK = 8000000
+
 
 ALLATTRS = [
     "min",
@@ -214,42 +219,56 @@ def _attributes_betw_surfaces(
     maskthreshold,
     optsum,
 ):
-    """This is the actual lowlevel engine communicating with C code"""
+    """This is the actual lowlevel engine communicating with C code.
+
+    All attributes are computed in one C call per block of cube columns, where
+    the block size bounds the memory of the stack of window samples in C.
+    """
 
     logger.info("Attributes between surfaces")
 
-    results = np.zeros((len(ALLATTRS) * self.ncol * self.nrow), dtype=np.float64)
+    nnodes = self.ncol * self.nrow
+    results = np.zeros((len(ALLATTRS), nnodes), dtype=np.float64)
 
     optnearest = 0
     if sampling in ["nearest", "cube"]:
         optnearest = 1
 
-    _cxtgeo.surf_cube_attr_intv(
-        cube.ncol,
-        cube.nrow,
-        cube.nlay,
-        cube.zori,
-        cube.zinc,
-        cube.values,
-        surf1.values.data,
-        surf2.values.data,
-        surf1.values.mask,
-        surf2.values.mask,
-        zrinc,
-        ndiv,
-        ndivdisc,
-        results,
-        optnearest,
-        maskopt,
-        optprogress,
-        maskthreshold,
-        optsum,
-    )
+    nstack = max(ndiv, ndivdisc) + 1
+    step = max(1, MAXSAMPLES_BLOCK // max(1, cube.nrow * nstack))
+
+    for icol in range(0, cube.ncol, step):
+        block = slice(icol, min(icol + step, cube.ncol))
+        ncolblock = block.stop - block.start
+        bresults = np.zeros((len(ALLATTRS) * ncolblock * cube.nrow), dtype=np.float64)
+
+        _cxtgeo.surf_cube_attr_intv(
+            ncolblock,
+            cube.nrow,
+            cube.nlay,
+            cube.zori,
+            cube.zinc,
+            cube.values[block],
+            surf1.values.data[block],
+            surf2.values.data[block],
+            ma.getmaskarray(surf1.values)[block],
+            ma.getmaskarray(surf2.values)[block],
+            zrinc,
+            ndiv,
+            ndivdisc,
+            bresults,
+            optnearest,
+            maskopt,
+            optprogress,
+            maskthreshold,
+            optsum,
+        )
+        results[:, block.start * cube.nrow : block.stop * cube.nrow] = (
+            bresults.reshape((len(ALLATTRS), ncolblock * cube.nrow))
+        )
 
     logger.info("Results updated, with size %s", results.shape)
 
-    results = results.reshape((len(ALLATTRS), self.ncol * self.nrow), order="C")
-
     return results
 
 
@@ -581,6 +581,7 @@ def import_xtg(self, mfile, values=True, **kwargs):
     else:
         self._values = None
 
+    self._isloaded = values
     self._metadata.required = self
 
 
@@ -616,4 +617,5 @@ def import_hdf5_regsurf(self, mfile, values=True):
     else:
         self._values = None
 
+    self._isloaded = values
     self._metadata.required = self
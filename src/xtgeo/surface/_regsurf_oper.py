@@ -1,19 +1,27 @@
 # coding: utf-8
 """Various operations"""
 
+from concurrent.futures import ThreadPoolExecutor
 import numbers
+import os
 import numpy as np
 import numpy.ma as ma
 
 import xtgeo
 from xtgeo.xyz import Polygons
+from xtgeo.xyz import _xyz_polymask
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo  # type: ignore
 from xtgeo.common import XTGeoDialog
 
+from . import _regsurf_utils
+
 xtg = XTGeoDialog()
 
 logger = xtg.functionlogger(__name__)
 
+# minimum number of points per chunk when sampling arrays of XY points in threads
+CHUNK_XYV = 100000
+
 VALID_OPER = (
     "add",
     "iadd",
@@ -65,29 +73,32 @@ def operations_two(self, other, oper="add"):  # pylint: disable=too-many-branche
     elif oper == "sub":
         self.values = self.values - useother.values
     elif oper == "isub":
+        self._touch_values()
         self._values -= useother._values
     elif oper == "mul":
         self.values = self.values * useother.values
     elif oper == "imul":
+        self._touch_values()
         self._values *= useother._values
     elif oper == "div":
         self.values = self.values / useother.values
     elif oper == "idiv":
+        self._touch_values()
         self._values /= useother._values
 
     # comparisons:
     elif oper == "lt":
-        retvalue = self.values < other.values
+        retvalue = self._values < other._values
     elif oper == "gt":
-        retvalue = self.values > other.values
+        retvalue = self._values > other._values
     elif oper == "le":
-        retvalue = self.values <= other.values
+        retvalue = self._values <= other._values
     elif oper == "ge":
-        retvalue = self.values >= other.values
+        retvalue = self._values >= other._values
     elif oper == "eq":
-        retvalue = self.values == other.values
+        retvalue = self._values == other._values
     elif oper == "ne":
-        retvalue = self.values != other.values
+        retvalue = self._values != other._values
 
     if useother is not other:
         del useother
@@ -184,13 +195,16 @@ def distance_from_point(self, point=(0, 0), azimuth=0.0):
     self.set_values1d(svalues)
 
 
-def get_value_from_xy(self, point=(0.0, 0.0), sampling="bilinear"):
-    """Find surface value for point X Y."""
+def get_value_from_xy(self, point=(0.0, 0.0), sampling="bilinear", nthreads=None):
+    """Find surface value for point X Y, or for arrays of X Y points."""
 
     xcoord, ycoord = point
 
     option = 0 if sampling == "bilinear" else 2
 
+    if np.ndim(xcoord) > 0 or np.ndim(ycoord) > 0:
+        return _get_values_from_xyv(self, xcoord, ycoord, option, nthreads)
+
     zcoord = _cxtgeo.surf_get_z_from_xy(
         float(xcoord),
         float(ycoord),
@@ -202,7 +216,7 @@ def get_value_from_xy(self, point=(0.0, 0.0), sampling="bilinear"):
         self.yinc,
         self.yflip,
         self.rotation,
-        self.get_values1d(),
+        _regsurf_utils.values1d_buffer(self, "get_value_from_xy"),
         option,
     )
 
@@ -212,11 +226,58 @@ def get_value_from_xy(self, point=(0.0, 0.0), sampling="bilinear"):
     return zcoord
 
 
+def _get_values_from_xyv(self, xvalues, yvalues, option, nthreads):
+    """Vector version; outside points and undefined map nodes give NaN.
+
+    The map values are filled once, and the points are sampled in chunks by the C
+    routine, which releases the GIL so chunks (or callers) may run in threads.
+    """
+    xvalues, yvalues = np.broadcast_arrays(
+        np.asarray(xvalues, dtype=np.float64), np.asarray(yvalues, dtype=np.float64)
+    )
+    shape = xvalues.shape
+    xvalues = np.ascontiguousarray(xvalues.ravel())
+    yvalues = np.ascontiguousarray(yvalues.ravel())
+    zvalues = np.zeros(xvalues.size, dtype=np.float64)
+
+    mapvalues = _regsurf_utils.values1d_buffer(self, "get_value_from_xy")
+
+    def _sample(start, stop):
+        ier = _cxtgeo.surf_get_zv_from_xyv(
+            xvalues[start:stop],
+            yvalues[start:stop],
+            zvalues[start:stop],
+            self.ncol,
+            self.nrow,
+            self.xori,
+            self.yori,
+            self.xinc,
+            self.yinc,
+            self.yflip,
+            self.rotation,
+            mapvalues,
+            option,
+        )
+        if ier != 0:
+            raise RuntimeError(f"Error code from surf_get_zv_from_xyv is {ier}")
+
+    if nthreads is None or nthreads > 1:
+        chunk = max(CHUNK_XYV, -(-xvalues.size // (nthreads or os.cpu_count() or 1)))
+        starts = range(0, xvalues.size, chunk)
+        with ThreadPoolExecutor(max_workers=nthreads) as executor:
+            list(executor.map(lambda start: _sample(start, start + chunk), starts))
+    else:
+        _sample(0, xvalues.size)
+
+    zvalues[zvalues > xtgeo.UNDEF_LIMIT] = np.nan
+    return zvalues.reshape(shape)
+
+
 def get_xy_value_from_ij(self, iloc, jloc, zvalues=None):
     """Find X Y value from I J index"""
 
     if zvalues is None:
-        zvalues = self.get_values1d()
+        zvalues = _regsurf_utils.values1d_buffer(self, "get_xy_value_from_ij")
 
     if 1 <= iloc <= self.ncol and 1 <= jloc <= self.nrow:
 
@@ -377,7 +438,7 @@ def get_fence(self, xyfence, sampling="bilinear"):
         self.yinc,
         self.yflip,
         self.rotation,
-        self.get_values1d(),
+        _regsurf_utils.values1d_buffer(self, "get_fence"),
         sampleoptions.get(sampling, 0),
     )
 
@@ -424,7 +485,7 @@ def get_randomline(
         self.yinc,
         self.yflip,
         self.rotation,
-        self.get_values1d(),
+        _regsurf_utils.values1d_buffer(self, "get_randomline"),
         sampleoptions.get(sampling, 0),
     )
 
@@ -463,62 +524,35 @@ def operation_polygons(self, poly, value, opname="add", inside=True):
     if opname not in VALID_OPER_POLYS:
         raise ValueError(f"Operation key opname has invalid value: {opname}")
 
-    # make a copy of the RegularSurface which is used a "filter" or "proxy"
-    # value will be 1 inside polygons, 0 outside. Undef cells are kept as is
-
-    proxy = self.copy()
-    proxy.values *= 0.0
-    vals = proxy.get_values1d(fill_value=xtgeo.UNDEF)
-
     # value could be a scalar or another surface; if another surface,
     # must ensure same topology
 
     if isinstance(value, type(self)):
         if not self.compare_topology(value):
             raise ValueError("Input is RegularSurface, but not same map " "topology")
-        value = value.values.copy()
+        value = value._values.copy()
     else:
         # turn scalar value into numpy array
-        value = self.values.copy() * 0 + value
-
-    idgroups = poly.dataframe.groupby(poly.pname)
-
-    for _, grp in idgroups:
-        xcor = grp[poly.xname].values
-        ycor = grp[poly.yname].values
-
-        ier = _cxtgeo.surf_setval_poly(
-            proxy.xori,
-            proxy.xinc,
-            proxy.yori,
-            proxy.yinc,
-            proxy.ncol,
-            proxy.nrow,
-            proxy.yflip,
-            proxy.rotation,
-            vals,
-            xcor,
-            ycor,
-            1.0,
-            0,
-        )
-        if ier == -9:
-            xtg.warn("Polygon is not closed")
+        value = self._values.copy() * 0 + value
 
-    proxy.set_values1d(vals)
-    proxyv = proxy.values.astype(np.int8)
+    # mask for defined nodes inside (or outside) the polygons; undef nodes are kept
+    pmask = _xyz_polymask.PolygonsMask(poly)
+    for id_ in pmask.notclosed:
+        xtg.warn(f"Polygon {id_} is not closed")
 
-    proxytarget = 1
+    xvals, yvals = self.get_xy_values(asmasked=False)
+    proxyv = pmask.inside_any(xvals.ravel(), yvals.ravel()).reshape(xvals.shape)
     if not inside:
-        proxytarget = 0
+        proxyv = ~proxyv
+    proxyv &= ~ma.getmaskarray(self._values)
 
     tmp = None
     if opname == "add":
-        tmp = self.values.copy() + value
+        tmp = self._values.copy() + value
     elif opname == "sub":
-        tmp = self.values.copy() - value
+        tmp = self._values.copy() - value
     elif opname == "mul":
-        tmp = self.values.copy() * value
+        tmp = self._values.copy() * value
     elif opname == "div":
         # Dividing a map of zero is always a hazzle; try to obtain 0.0
         # as result in these cases
@@ -529,9 +563,9 @@ def operation_polygons(self, poly, value, opname="add", inside=True):
                 "achieve zero values as result!"
             )
         with np.errstate(divide="ignore", invalid="ignore"):
-            this = ma.filled(self.values, fill_value=1.0)
+            this = ma.filled(self._values, fill_value=1.0)
             that = ma.filled(value, fill_value=1.0)
-            mask = ma.getmaskarray(self.values)
+            mask = ma.getmaskarray(self._values)
             tmp = np.true_divide(this, that)
             tmp = np.where(np.isinf(tmp), 0, tmp)
             tmp = np.nan_to_num(tmp)
@@ -543,5 +577,5 @@ def operation_polygons(self, poly, value, opname="add", inside=True):
         tmp = value * 0 + xtgeo.UNDEF
         tmp = ma.masked_greater(tmp, xtgeo.UNDEF_LIMIT)
 
-    self.values[proxyv == proxytarget] = tmp[proxyv == proxytarget]
+    self.values[proxyv] = tmp[proxyv]
     del tmp
@@ -1,7 +1,10 @@
 """RegularSurface utilities"""
 
+from collections import Counter
+import weakref
 
 import numpy as np
+import numpy.ma as ma
 
 import xtgeo
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
@@ -12,6 +15,65 @@ xtg = XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 # pylint: disable=protected-access
 
+# Instrumentation: number of full copies of map values made, per operation. The
+# counter is for profiling and tests, and may be reset at any time.
+VALUES_COPIES = Counter()
+
+
+def count_values_copy(operation):
+    """Count one full copy of map values made by the given operation (str)."""
+    VALUES_COPIES[operation] += 1
+
+
+def values1d_buffer(self, operation="values1d_buffer"):
+    """Return the map values as a cached read-only 1D C order float64 array.
+
+    Undefined nodes are xtgeo.UNDEF, as expected by the C routines. The buffer is
+    reused as long as the values array and its mask are the same objects, so
+    routines sampling a map many times avoid making a new filled copy per call.
+
+    While the buffer is cached, the values array and its mask are made read only,
+    so an in place edit through a reference obtained earlier fails, instead of
+    leaving the buffer outdated. The values property drops the buffer and returns
+    a writable array again, see RegularSurface._touch_values.
+    """
+    vals = self._values
+    mask = ma.getmask(vals)
+
+    cache = self._values1d_cache
+    if cache is not None and cache[0]() is vals and cache[1] is mask:
+        return cache[2]
+
+    # release an outdated buffer, and restore write access to the arrays it froze
+    self._touch_values()
+
+    buffer = np.where(ma.getmaskarray(vals), xtgeo.UNDEF, ma.getdata(vals))
+    buffer = buffer.astype(np.float64, copy=False).ravel()
+    buffer.flags.writeable = False
+    count_values_copy(operation)
+
+    frozen = []
+    for arr in (vals, mask):
+        if isinstance(arr, np.ndarray) and arr.flags.writeable:
+            arr.flags.writeable = False
+            frozen.append(weakref.ref(arr))
+
+    self._values1d_cache = (weakref.ref(vals), mask, buffer, frozen)
+    return buffer
+
+
+def release_values1d_buffer(self):
+    """Drop the cached buffer, and make the arrays it froze writable again."""
+    cache = self._values1d_cache
+    self._values1d_cache = None
+    if cache is None:
+        return
+
+    for ref in cache[3]:
+        arr = ref()
+        if arr is not None:
+            arr.flags.writeable = True
+
 
 def swapaxes(self):
     """Swap the axes columns vs rows, keep origin. Will change yflip."""
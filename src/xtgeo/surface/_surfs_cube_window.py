@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Surfaces vs Cubes, slice cube windows for many surface/cube pairs in one batch"""
+
+import copy
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import xtgeo
+from xtgeo.common import XTGeoDialog
+
+xtg = XTGeoDialog()
+
+logger = xtg.functionlogger(__name__)
+
+# pylint: disable=protected-access
+
+# max number of cube values (float32) copied per block when sharing a cube
+MAXVALUES_COPY_BLOCK = 16000000
+
+# cubes in a worker process, keyed as the input cubes; set once by _init_worker(),
+# and only used in worker processes
+_WORKERCUBES = {}
+
+
+def slice_cube_window_batch(self, cubes, jobs=None, nprocesses=None, **kwargs):
+    """Run slice_cube_window for (surface index, cube key) jobs.
+
+    Returns a dict keyed by job, where each item is a dict of attribute surfaces.
+    """
+    if isinstance(cubes, xtgeo.Cube):
+        cubes = {0: cubes}
+    elif isinstance(cubes, (list, tuple)):
+        cubes = dict(enumerate(cubes))
+    elif not isinstance(cubes, dict):
+        raise ValueError("The cubes input must be a Cube, a list or a dict of cubes")
+
+    if jobs is None:
+        jobs = [(isurf, ckey) for isurf in range(len(self.surfaces)) for ckey in cubes]
+
+    for isurf, ckey in jobs:
+        if ckey not in cubes:
+            raise KeyError(f"No cube with key {ckey} for job ({isurf}, {ckey})")
+
+    # a single attribute given as str would update the surface and return None
+    attribute = kwargs.get("attribute", "max")
+    if isinstance(attribute, str) and attribute != "all":
+        kwargs["attribute"] = [attribute]
+
+    tasks = [
+        ((isurf, ckey), self.surfaces[isurf], ckey, kwargs) for isurf, ckey in jobs
+    ]
+
+    if nprocesses is None or nprocesses <= 1 or len(tasks) < 2:
+        return dict(_slice_one(task, cubes) for task in tasks)
+
+    logger.info("Slice %s cube windows using %s processes", len(tasks), nprocesses)
+
+    usedkeys = {ckey for _, ckey in jobs}
+    with tempfile.TemporaryDirectory(prefix="xtgeo_cubes_") as tmpdir:
+        shells = {}
+        sources = {}
+        for num, ckey in enumerate(usedkeys):
+            shells[ckey], sources[ckey] = _share_cube(
+                cubes[ckey], os.path.join(tmpdir, f"cube_{num}.npy")
+            )
+
+        chunksize = max(1, len(tasks) // (4 * nprocesses))
+        with ProcessPoolExecutor(
+            max_workers=nprocesses,
+            initializer=_init_worker,
+            initargs=(shells, sources),
+        ) as executor:
+            result = dict(executor.map(_slice_one, tasks, chunksize=chunksize))
+
+    return result
+
+
+def _mapped_file(values):
+    """Return (filename, offset) if the values are a memory map of a native file.
+
+    This is the case for a cube read from xtgregcube with mmap=True. Only a map of
+    the file as it is, i.e. native float32 in C order from the start of the map,
+    is accepted; otherwise (and for anonymous scratch maps) None is returned.
+    """
+    if not isinstance(values, np.memmap) or values.filename is None:
+        return None
+
+    root = values
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+
+    if (
+        values.dtype != np.float32
+        or not values.flags.c_contiguous
+        or values.ctypes.data != root.ctypes.data
+    ):
+        return None
+
+    return values.filename, root.offset
+
+
+def _share_cube(cube, path):
+    """Make the cube values available for the workers to map.
+
+    A cube that is a memory map of a native file is mapped from that file in the
+    workers. Other cubes are written to a npy file at path, which hence needs
+    temporary disk space of the cube size. The values are copied in blocks of
+    columns, so a memory mapped cube is never fully loaded. Returns a copy of the
+    cube without values, and the (filename, offset) to map, where offset is None
+    for a npy file.
+    """
+    values = cube.values
+
+    shell = copy.copy(cube)
+    shell._values = None
+
+    source = _mapped_file(values)
+    if source is not None:
+        logger.info("Workers map the cube values from %s", source[0])
+        return shell, source
+
+    shared = np.lib.format.open_memmap(
+        path, mode="w+", dtype=np.float32, shape=values.shape
+    )
+    step = max(1, MAXVALUES_COPY_BLOCK // max(1, cube.nrow * cube.nlay))
+    for icol in range(0, cube.ncol, step):
+        shared[icol : icol + step] = values[icol : icol + step]
+    shared.flush()
+    del shared
+
+    return shell, (path, None)
+
+
+def _init_worker(shells, sources):
+    """Map the shared cube values in a worker process, once per worker.
+
+    The values are mapped copy-on-write, as dead traces are temporarily edited
+    when slicing; the pages are otherwise shared between the processes.
+    """
+    for ckey, shell in shells.items():
+        path, offset = sources[ckey]
+        if offset is None:
+            shell._values = np.load(path, mmap_mode="c")
+        else:
+            shell._values = np.memmap(
+                path,
+                dtype=np.float32,
+                mode="c",
+                offset=offset,
+                shape=(shell.ncol, shell.nrow, shell.nlay),
+            )
+        _WORKERCUBES[ckey] = shell
+
+
+def _slice_one(task, cubes=None):
+    """Slice one surface vs one cube; returns (job, dict of attribute surfaces).
+
+    The cubes are given directly when run serially, while in a worker process the
+    cubes mapped by _init_worker() are used. This is a module level function so it
+    can be pickled to a worker process.
+    """
+    if cubes is None:
+        cubes = _WORKERCUBES
+
+    job, surf, ckey, kwargs = task
+    attrs = surf.slice_cube_window(cubes[ckey], **kwargs)
+    return job, attrs
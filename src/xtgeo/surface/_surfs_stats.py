@@ -0,0 +1,167 @@
+"""Streaming (out-of-core) and tiled statistics for a collection of surfaces."""
+# pylint: disable=protected-access
+
+from concurrent.futures import ThreadPoolExecutor
+import warnings
+
+import numpy as np
+
+from xtgeo.common import XTGeoDialog
+
+xtg = XTGeoDialog()
+
+logger = xtg.functionlogger(__name__)
+
+# default upper limit of bytes used for the stack of samples in one percentile pass
+MAXBYTES_PERCENTILE_PASS = 512 * 1024 * 1024
+
+# default upper limit of bytes used for the stack of samples in one tile in apply
+MAXBYTES_APPLY_TILE = 32 * 1024 * 1024
+
+
+def _iter_values(self, template, start=0, stop=None):
+    """Yield each surface values as 1D float64 with NaN, loading one at a time.
+
+    Surfaces that are not loaded (lazy, metadata only) are read here, and unloaded
+    again after use so only one value array is kept in memory at any time.
+    """
+    for surf in self.surfaces:
+        if not template.compare_topology(surf, strict=False):
+            raise ValueError("Cannot do statistics, surfaces differ in topology")
+
+        unload = False
+        if not surf._isloaded:
+            surf.load_values()
+            unload = True
+
+        vals = np.ma.filled(surf._values, fill_value=np.nan).ravel()[start:stop]
+        yield vals.astype(np.float64)
+
+        if unload:
+            surf._values = None
+            surf._isloaded = False
+
+
+def statistics_streaming(self, percentiles=None, chunksize=None):
+    """Compute statistics with bounded memory, reading one surface at a time.
+
+    Mean and standard deviation (ddof=1) are computed in one pass using Welford
+    updates. Percentiles are exact, computed by one pass over the surfaces per chunk
+    of map nodes, where the chunk size limits the memory of the stacked samples.
+    """
+    logger.info("Compute surfaces statistics in streaming mode...")
+
+    first = self.surfaces[0]
+    if first._isloaded:
+        template = first.copy()
+    else:
+        first.load_values()
+        template = first.copy()
+        first._values = None
+        first._isloaded = False
+
+    nsurf = len(self.surfaces)
+    nnodes = template.ncol * template.nrow
+
+    count = np.zeros(nnodes, dtype=np.int64)
+    mean = np.zeros(nnodes, dtype=np.float64)
+    msq = np.zeros(nnodes, dtype=np.float64)
+
+    for vals in _iter_values(self, template):
+        valid = np.isfinite(vals)
+        count += valid
+        delta = np.where(valid, vals - mean, 0.0)
+        mean += np.divide(delta, count, out=np.zeros_like(mean), where=count > 0)
+        msq += np.where(valid, delta * (vals - mean), 0.0)
+
+    result = {}
+    template.values = np.where(count > 0, mean, np.nan)
+    result["mean"] = template.copy()
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.sqrt(msq / (count - 1))
+    template.values = np.where(count > 1, std, np.nan)
+    result["std"] = template.copy()
+
+    if percentiles is None:
+        logger.info("Compute surfaces statistics in streaming mode... done")
+        return result
+
+    if chunksize is None:
+        chunksize = max(1, MAXBYTES_PERCENTILE_PASS // (8 * nsurf))
+    chunksize = min(int(chunksize), nnodes)
+
+    res = np.zeros((len(percentiles), nnodes), dtype=np.float64)
+    for start in range(0, nnodes, chunksize):
+        stop = min(start + chunksize, nnodes)
+        logger.debug("Percentiles for map nodes %s to %s", start, stop)
+        stack = np.zeros((nsurf, stop - start), dtype=np.float64)
+        for inum, vals in enumerate(_iter_values(self, template, start, stop)):
+            stack[inum, :] = vals
+
+        # nan on a axis tends to give warnings that are not a worry; suppress:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", r"All-NaN (slice|axis) encountered")
+            res[:, start:stop] = np.nanpercentile(stack, percentiles, axis=0)
+
+    for slice_, prc in enumerate(percentiles):
+        template.values = res[slice_, :]
+        result["p" + str(prc)] = template.copy()
+        if prc == 50:
+            result["median"] = result["p50"]
+
+    logger.info("Compute surfaces statistics in streaming mode... done")
+    return result
+
+
+def apply_tiled(self, func, args, kwargs, nthreads=None, tilesize=None):
+    """Apply a function on blocks of map columns (tiles), in a pool of threads.
+
+    Each tile stacks only its own part of all surfaces, shaped
+    (nsurf, ncols_in_tile, nrow), so memory is bounded by the tile size. NumPy
+    functions such as nanmean and nanpercentile release the GIL, so the tiles are
+    computed in parallel. Lazy loaded surfaces are loaded first, as in statistics().
+    """
+    for surf in self.surfaces:
+        surf.load_values()
+
+    template = self.surfaces[0].copy()
+    for surf in self.surfaces:
+        if not template.compare_topology(surf, strict=False):
+            raise ValueError("Cannot do statistics, surfaces differ in topology")
+
+    nsurf = len(self.surfaces)
+    ncol = template.ncol
+    nrow = template.nrow
+
+    if tilesize is None:
+        tilesize = max(1, MAXBYTES_APPLY_TILE // (8 * nsurf * nrow))
+    tilesize = min(int(tilesize), ncol)
+
+    values = [surf._values for surf in self.surfaces]
+    result = np.zeros((ncol, nrow), dtype=np.float64)
+
+    def _tile(start):
+        stop = min(start + tilesize, ncol)
+        stack = np.zeros((nsurf, stop - start, nrow), dtype=np.float64)
+        for inum, vals in enumerate(values):
+            stack[inum] = np.ma.filled(vals[start:stop, :], fill_value=np.nan)
+
+        res = func(stack, *args, **kwargs)
+        if np.shape(res) != (stop - start, nrow):
+            raise ValueError(
+                "The function must reduce along axis 0 in tiled mode, got result "
+                f"shape {np.shape(res)} for a tile of shape {stack.shape[1:]}"
+            )
+        result[start:stop, :] = res
+
+    logger.info("Apply function on tiles of %s map columns...", tilesize)
+    with warnings.catch_warnings():
+        # warnings filters are process wide, hence set here and not in the threads
+        warnings.filterwarnings("ignore", r"All-NaN (slice|axis) encountered")
+        with ThreadPoolExecutor(max_workers=nthreads) as executor:
+            list(executor.map(_tile, range(0, ncol, tilesize)))
+
+    template.values = result
+    logger.info("Apply function on tiles of %s map columns... done", tilesize)
+    return template
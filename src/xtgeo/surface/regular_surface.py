@@ -34,7 +34,6 @@ or::
 
 # pylint: disable=too-many-public-methods
 
-import sys
 import pathlib
 import io
 from typing import Tuple, Union, Optional, List, Any
@@ -270,6 +269,7 @@ class RegularSurface:
         self._yflip = 1
 
         self._values = None
+        self._values1d_cache = None  # cf. _regsurf_utils.values1d_buffer
         self._fformat = None  # current fileformat, useful for load()
         self._isloaded = True  # assume True unless explicitly set
         self._metadata = xtgeo.MetaDataRegularSurface()
@@ -374,7 +374,7 @@ class RegularSurface:
             "yflip={0._yflip!r}, masked={0._masked!r}, "
             "filesrc={0._filesrc!r}, name={0._name!r}, "
             "ilines={0.ilines.shape!r}, xlines={0.xlines.shape!r}, "
-            "values={0.values.shape!r}) ID={1}.".format(self, id(self))
+            "values={0._values.shape!r}) ID={1}.".format(self, id(self))
         )
         return myrp
 
@@ -382,6 +382,12 @@ class RegularSurface:
         """Magic method __str__ for user friendly print."""
         return self.describe(flush=False)
 
+    def __getstate__(self):
+        """Magic method for pickling; the cached values buffer is not pickled."""
+        state = self.__dict__.copy()
+        state["_values1d_cache"] = None
+        return state
+
     def __getitem__(self, index):
         """Magic method."""
         col, row = index
@@ -724,6 +730,9 @@ class RegularSurface:
             newvalues[2] = srf.undef
             srf.values = newvalues  # here, entry 2 will be undefined
         """
+        # the returned array may be edited in place by the caller; internal code
+        # that only reads the values shall use _values, to keep the cached buffer
+        self._touch_values()
         return self._values
 
     @values.setter
@@ -792,9 +801,11 @@ class RegularSurface:
     def generate_hash(self, hashmethod="md5"):
         """Return a unique hash ID for current instance.
 
-        See :meth:`~xtgeo.common.sys.generic_hash()` for documentation.
+        The values are hashed from their raw data. See
+        :meth:`~xtgeo.common.sys.generic_hash()` for documentation of hashmethod.
 
         .. versionadded:: 2.14
+        .. versionchanged:: 2.15 Hash the raw values
         """
         required = (
             "ncol",
@@ -805,17 +816,12 @@ class RegularSurface:
             "yinc",
             "yflip",
             "rotation",
-            "values",
         )
-        opt = np.get_printoptions()
-        np.set_printoptions(threshold=sys.maxsize)
-        gid = ""
-        for req in required:
-            gid += f"{getattr(self, '_' + req)}"
+        scalars = tuple(getattr(self, "_" + req) for req in required)
 
-        np.set_printoptions(**opt)
-        hash_ = xtgeosys.generic_hash(gid, hashmethod=hashmethod)
-        return hash_
+        return xtgeosys.generic_hash_arrays(
+            scalars, (self._values,), hashmethod=hashmethod
+        )
 
     def describe(self, flush=True):
         """Describe an instance by printing to stdout."""
@@ -838,12 +844,12 @@ class RegularSurface:
             dsc.txt("Values", self._values.reshape(-1), self._values.dtype)
             dsc.txt(
                 "Values: mean, stdev, minimum, maximum",
-                self.values.mean(),
-                self.values.std(),
-                self.values.min(),
-                self.values.max(),
+                self._values.mean(),
+                self._values.std(),
+                self._values.min(),
+                self._values.max(),
             )
-            msize = float(self.values.size * 8) / (1024 * 1024 * 1024)
+            msize = float(self._values.size * 8) / (1024 * 1024 * 1024)
             dsc.txt("Minimum memory usage of array (GB)", msize)
         else:
             dsc.txt("Values:", "Not loaded")
@@ -1376,7 +1382,8 @@ class RegularSurface:
             A numpy 1D array or MaskedArray
 
         """
-        val = self.values.copy()
+        val = self._values.copy()
+        _regsurf_utils.count_values_copy("get_values1d")
 
         if order == "F":
             val = ma.filled(val, fill_value=np.nan)
@@ -1573,24 +1580,35 @@ class RegularSurface:
 
         return ((xc0, yc0), (xc1, yc1), (xc2, yc2), (xc3, yc3))
 
-    def get_value_from_xy(self, point=(0.0, 0.0), sampling="bilinear"):
-        """Return the map value given a X Y point.
+    def get_value_from_xy(self, point=(0.0, 0.0), sampling="bilinear", nthreads=None):
+        """Return the map value given a X Y point, or arrays of X Y points.
 
         Args:
-            point (float tuple): Position of X and Y coordinate
+            point (float tuple): Position of X and Y coordinate. The X and Y may
+                also be array-likes of equal shape, for sampling many points in one
+                call.
             sampling (str): Sampling method, either "bilinear" for bilinear
                 interpolation, or "nearest" for nearest node sampling (e.g. facies maps)
+            nthreads (int): For arrays of points only; number of threads to sample
+                chunks of points in. Default (None) is decided by Python's
+                ThreadPoolExecutor, while 1 samples in the calling thread.
 
         Returns:
-            The map value (interpolated). None if XY is outside defined map
+            The map value (interpolated). None if XY is outside defined map. For
+            arrays of points, a numpy array of the same shape is returned, with NaN
+            where points are outside the map or at undefined map nodes.
 
         Example::
             mvalue = map.get_value_from_xy(point=(539291.12, 6788228.2))
+            zvalues = map.get_value_from_xy(point=(xarray, yarray))
 
 
         .. versionchanged:: 2.14 Added keyword option `sampling`
+        .. versionchanged:: 2.15 Accept arrays of X Y points, added `nthreads`
         """
-        zcoord = _regsurf_oper.get_value_from_xy(self, point=point, sampling=sampling)
+        zcoord = _regsurf_oper.get_value_from_xy(
+            self, point=point, sampling=sampling, nthreads=nthreads
+        )
 
         return zcoord
 
@@ -1764,7 +1782,7 @@ class RegularSurface:
         xylist = []
         valuelist = []
 
-        zvalues = self.get_values1d()
+        zvalues = _regsurf_utils.values1d_buffer(self, "get_xy_value_lists")
 
         if lformat != "webportal":
             raise ValueError("Unsupported lformat")
@@ -2693,7 +2711,7 @@ class RegularSurface:
         # This is using the more versatile Map class in XTGeo. Most kwargs
         # is just passed as is. Prefer using Map() directly in apps?
 
-        ncount = self.values.count()
+        ncount = self._values.count()
         if ncount < 5:
             xtg.warn(
                 "None or too few map nodes for plotting. Skip "
@@ -2767,6 +2785,14 @@ class RegularSurface:
     # Private
     # ==================================================================================
 
+    def _touch_values(self):
+        """Mark the values as (possibly) changed; invalidates the cached 1D buffer.
+
+        Must be called before the values array is edited in place, as the array is
+        read only while a buffer is cached.
+        """
+        _regsurf_utils.release_values1d_buffer(self)
+
     def _ensure_correct_values(
         self, values
     ):  # pylint: disable=too-many-branches, too-many-statements
@@ -2784,6 +2810,8 @@ class RegularSurface:
         if not self._isloaded:
             return
 
+        self._touch_values()
+
         if values is None or values is False:
             self._values = None
             return
@@ -6,11 +6,15 @@ import warnings
 import numpy as np
 
 import xtgeo
+from . import _surfs_cube_window
 from . import _surfs_import
+from . import _surfs_stats
 
 xtg = xtgeo.common.XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
+# pylint: disable=protected-access
+
 
 class Surfaces(object):
     """Class for a collection of Surface objects, for operations that involves
@@ -26,6 +30,8 @@ class Surfaces(object):
         input (list, optional): A list of XTGeo objects and/or file names)
         subtype (str): "tops", "isochores", or None (default)
         order (str): Assummed order: "same", "stratigraphic", None(default)
+        lazy (bool): If True, surfaces given as files are read with metadata only,
+            and values are loaded on demand. See :meth:`append`.
 
     .. seealso::
        Class :class:`~xtgeo.surface.regular_surface.RegularSurface` class.
@@ -40,7 +46,7 @@ class Surfaces(object):
         self._order = None  # could be "same", "stratigraphic" or None
 
         if args:
-            self.append(args[0])
+            self.append(args[0], lazy=kwargs.get("lazy", False))
             self._subtype = kwargs.get("subtype", None)
             self._order = kwargs.get("order", None)
 
@@ -60,15 +66,27 @@ class Surfaces(object):
 
         self._surfaces = slist
 
-    def append(self, slist):
+    def append(self, slist, lazy=False):
         """Append surfaces from either a list of RegularSurface objects,
-        a list of files, or a mix."""
+        a list of files, or a mix.
+
+        Args:
+            slist (list): List of RegularSurface objects and/or file names
+            lazy (bool): If True, only metadata are read for files, and values
+                are loaded on demand. This is effective for Irap binary, xtgregsurf
+                and hdf formats, and makes it possible to use
+                :meth:`statistics` with ``streaming=True`` on large ensembles.
+
+        .. versionchanged:: 2.15 Added `lazy`
+        """
         for item in slist:
             if isinstance(item, xtgeo.RegularSurface):
                 self._surfaces.append(item)
             else:
                 try:
-                    sobj = xtgeo.surface_from_file(item, fformat="guess")
+                    sobj = xtgeo.surface_from_file(
+                        item, fformat="guess", values=not lazy
+                    )
                     self._surfaces.append(sobj)
                 except OSError:
                     xtg.warnuser("Cannot read as file, skip: {}".format(item))
@@ -116,7 +134,7 @@ class Surfaces(object):
         """Derive surfaces from a 3D grid"""
         _surfs_import.from_grid3d(self, grid, subgrids, rfactor)
 
-    def apply(self, func, *args, **kwargs):
+    def apply(self, func, *args, tiled=False, nthreads=None, tilesize=None, **kwargs):
         """Apply a function to the Surfaces array.
 
         The return value of the function (numpy nan comptatible) will be a
@@ -124,22 +142,45 @@ class Surfaces(object):
 
         E.g. surfs.apply(np.nanmean, axis=0) will return the mean surface.
 
+        With ``tiled=True`` the map is split in blocks of ``tilesize`` columns
+        (along the first axis), and the function is applied to each block in a pool of
+        threads. Only one block of all surfaces is stacked at a time for each
+        thread, and NumPy reductions such as ``np.nanmean`` and ``np.nanpercentile``
+        release the GIL, so this is both faster and uses less memory for large
+        collections. In tiled mode the function must reduce along axis 0, e.g.
+        ``surfs.apply(np.nanmean, axis=0, tiled=True)``.
+
         Args:
             func: Function to apply, e.g. np.nanmean
             args: The function arguments
+            tiled (bool): If True, use the tiled, thread parallel mode.
+            nthreads (int): Number of threads in tiled mode; default (None) is
+                decided by Python's ThreadPoolExecutor.
+            tilesize (int): Number of map columns per tile in tiled mode. Default is
+                estimated so that each tile stack use about 32 MB.
             kwargs: The function keyword arguments
 
         Raises:
             ValueError: If surfaces differ in topology.
+            ValueError: If the function does not reduce along axis 0 in tiled mode.
 
+        .. versionchanged:: 2.15 Added `tiled`, `nthreads` and `tilesize`
         """
+        if tiled:
+            return _surfs_stats.apply_tiled(
+                self, func, args, kwargs, nthreads=nthreads, tilesize=tilesize
+            )
+
+        for surf in self.surfaces:
+            surf.load_values()
+
         template = self.surfaces[0].copy()
         slist = []
         for surf in self.surfaces:
             status = template.compare_topology(surf, strict=False)
             if not status:
                 raise ValueError("Cannot do statistics, surfaces differ in topology")
-            slist.append(np.ma.filled(surf.values, fill_value=np.nan))
+            slist.append(np.ma.filled(surf._values, fill_value=np.nan))
 
         xlist = np.array(slist)
 
@@ -149,7 +190,57 @@ class Surfaces(object):
 
         return template
 
-    def statistics(self, percentiles=None):
+    def slice_cube_window(self, cubes, jobs=None, nprocesses=None, **kwargs):
+        """Slice cube windows for the surfaces vs one or more cubes, as a batch.
+
+        This runs :meth:`~xtgeo.surface.RegularSurface.slice_cube_window` for each
+        job, i.e. a pair of a surface (index in this instance) and a cube. By
+        default, all surfaces are combined with all cubes, e.g. 100 realisations x
+        20 horizons as surfaces and 3 vintages as cubes.
+
+        With ``nprocesses`` > 1 the jobs are run in a pool of processes. Each cube
+        is then written once to a temporary file which is memory mapped by the
+        worker processes, so the cube is neither read from its source nor copied
+        to every worker. This needs temporary disk space of the size of the cubes.
+        A cube read from xtgregcube with ``mmap=True`` is instead mapped from its
+        file by the workers, so values edited in place in such a copy-on-write map
+        are not seen there. A memory mapped cube (see :meth:`Cube.from_file`) is
+        never loaded in full.
+
+        Args:
+            cubes: A Cube instance, or a list or dict of cubes.
+            jobs (list): Optional list of (surface index, cube key) tuples, where
+                the cube key is the list index or dict key of the cube.
+            nprocesses (int): Number of processes. Default is None, which (as 1)
+                runs the jobs in the current process.
+            kwargs: Keyword arguments to
+                :meth:`~xtgeo.surface.RegularSurface.slice_cube_window`, e.g.
+                ``zrange`` and ``attribute``.
+
+        Returns:
+            A dict keyed by job (surface index, cube key), where each item is a dict
+            of attribute name to RegularSurface, also if ``attribute`` is a single
+            name. The surfaces in this instance are not changed.
+
+        Raises:
+            KeyError: If a job refers to a cube that is not given.
+
+        Example::
+
+            surfs = xtgeo.Surfaces(["top.gri", "base.gri"])
+            cubes = {"base": cube1, "monitor": cube2}
+            attrs = surfs.slice_cube_window(
+                cubes, zrange=10, attribute=["rms", "max"], nprocesses=8
+            )
+            attrs[(1, "monitor")]["rms"].to_file("base_monitor_rms.gri")
+
+        .. versionadded:: 2.15
+        """
+        return _surfs_cube_window.slice_cube_window_batch(
+            self, cubes, jobs=jobs, nprocesses=nprocesses, **kwargs
+        )
+
+    def statistics(self, percentiles=None, streaming=False, chunksize=None):
         """Return statistical measures from the surfaces.
 
         The statistics returned is:
@@ -160,9 +251,19 @@ class Surfaces(object):
         Currently this function expects that the surfaces all have the same
         shape/topology.
 
+        With ``streaming=True`` the surfaces are processed one at a time, so the
+        full ensemble is never stacked in memory. Combined with a lazy loaded
+        instance (e.g. ``Surfaces(filelist, lazy=True)``) only one surface array is
+        kept in memory at a time. Mean and std are computed in a single pass,
+        while percentiles are computed exactly in a number of passes over the
+        surfaces, each pass covering ``chunksize`` map nodes.
+
         Args:
             percentiles (list of float): If defined, a list of perecentiles to evaluate
                 e.g. [10, 50, 90] for p10, p50, p90
+            streaming (bool): If True, use bounded memory streaming mode.
+            chunksize (int): Number of map nodes per percentile pass in streaming
+                mode. Default is estimated so that each pass use about 512 MB.
 
         Returns:
             dict: A dictionary of statistical measures, see list above
@@ -178,9 +279,18 @@ class Surfaces(object):
             stats["mean"].to_file("mymean.gri")
 
         .. versionchanged:: 2.13 Added `percentile`
+        .. versionchanged:: 2.15 Added `streaming` and `chunksize`
         """
+        if streaming:
+            return _surfs_stats.statistics_streaming(
+                self, percentiles=percentiles, chunksize=chunksize
+            )
+
         result = {}
 
+        for surf in self.surfaces:
+            surf.load_values()
+
         template = self.surfaces[0].copy()
 
         slist = []
@@ -188,7 +298,7 @@ class Surfaces(object):
             status = template.compare_topology(surf, strict=False)
             if not status:
                 raise ValueError("Cannot do statistics, surfaces differ in topology")
-            slist.append(np.ma.filled(surf.values, fill_value=np.nan).ravel())
+            slist.append(np.ma.filled(surf._values, fill_value=np.nan).ravel())
 
         xlist = np.array(slist)
 
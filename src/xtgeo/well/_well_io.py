@@ -121,6 +121,143 @@ def import_rms_ascii(
     # df.fillna(Well.UNDEF, inplace=True)
 
     dfr = _trim_on_lognames(dfr, lognames, lognames_strict, wname)
+    _finalize_rms_ascii(
+        self,
+        dfr,
+        (wname, xpos, ypos, rkb),
+        wlogtype,
+        wlogrecords,
+        mdlogname,
+        zonelogname,
+        strict,
+    )
+
+
+def import_rms_ascii_fast(
+    self,
+    wfile,
+    mdlogname=None,
+    zonelogname=None,
+    strict=False,
+    lognames="all",
+    lognames_strict=False,
+):
+    """Import RMS ascii table well, reading header in one pass and data in bulk.
+
+    The header block is read at once, and the numerical block is parsed by a single
+    call to the pandas C parser, where only the requested logs are converted.
+    The result is identical to :func:`import_rms_ascii`.
+    """
+    wlogtype = dict()
+    wlogrecords = dict()
+
+    with open(wfile, "r") as fwell:
+        header = [fwell.readline() for _ in range(4)]
+        nlogs = int(header[3])
+        logheader = [fwell.readline().split() for _ in range(nlogs)]
+
+    wname, xpos, ypos, rkb = _parse_rms_ascii_wellhead(header[2])
+
+    xlognames_all = ["X_UTME", "Y_UTMN", "Z_TVDSS"]
+    for row in logheader:
+        lname = row[0]
+        # if i_index etc, make uppercase to I_INDEX
+        if "_index" in lname:
+            lname = lname.upper()
+
+        ltype = row[1].upper()
+        rxv = row[2:]
+        xlognames_all.append(lname)
+        wlogtype[lname] = ltype
+
+        if ltype == "DISC":
+            wlogrecords[lname] = {
+                int(rxv[i]): rxv[i + 1] for i in range(0, len(rxv), 2)
+            }
+        else:
+            wlogrecords[lname] = rxv
+
+    uselnames = _get_lognames_to_use(xlognames_all, lognames, lognames_strict, wname)
+
+    dfr = pd.read_csv(
+        wfile,
+        delim_whitespace=True,
+        skiprows=4 + nlogs,
+        header=None,
+        names=xlognames_all,
+        usecols=uselnames,
+        dtype=np.float64,
+        na_values=-999,
+        engine="c",
+    )
+    dfr = dfr[uselnames]
+
+    _finalize_rms_ascii(
+        self,
+        dfr,
+        (wname, xpos, ypos, rkb),
+        wlogtype,
+        wlogrecords,
+        mdlogname,
+        zonelogname,
+        strict,
+    )
+
+
+def _parse_rms_ascii_wellhead(line):
+    """Parse the RMS ascii well head line; wellname xpos ypos [rkb].
+
+    Usually 4 fields, but last (rkb) can be missing. The well name may have spaces,
+    so rkb is assumed present if the three last fields are numbers and the last is
+    less than 1000, which is the same guess as in :func:`import_rms_ascii`.
+    """
+    row = line.strip().split()
+
+    assume_rkb = False
+    if len(row) > 3:
+        try:
+            lastthree = [float(item) for item in row[-3:]]
+            assume_rkb = lastthree[-1] < 1000.0
+        except ValueError:
+            assume_rkb = False
+
+    rkb = float(row.pop()) if assume_rkb else None
+    ypos = float(row.pop())
+    xpos = float(row.pop())
+    wname = " ".join(row)
+    return wname, xpos, ypos, rkb
+
+
+def _get_lognames_to_use(xlognames_all, lognames, lognames_strict, wname):
+    """Return the lognames to keep, coordinates first, and each name once."""
+    if lognames == "all":
+        return list(xlognames_all)
+
+    uselnames = ["X_UTME", "Y_UTMN", "Z_TVDSS"]
+    if isinstance(lognames, str):
+        uselnames.append(lognames)
+    elif isinstance(lognames, list):
+        uselnames.extend(lognames)
+
+    result = []
+    for lname in uselnames:
+        if lname in xlognames_all:
+            if lname not in result:
+                result.append(lname)
+        elif lognames_strict:
+            msg = "Logname <{0}> is not present for <{1}>".format(lname, wname)
+            msg += " (required log under condition lognames_strict=True)"
+            raise ValueError(msg)
+
+    return result
+
+
+def _finalize_rms_ascii(
+    self, dfr, wellhead, wlogtype, wlogrecords, mdlogname, zonelogname, strict
+):
+    """Check special logs and set instance attributes after RMS ascii import."""
+    wname, xpos, ypos, rkb = wellhead
+
     mdlogname, zonelogname = _check_special_logs(
         dfr, mdlogname, zonelogname, strict, wname
     )
@@ -141,23 +278,8 @@ def _trim_on_lognames(dfr, lognames, lognames_strict, wname):
     if lognames == "all":
         return dfr
 
-    uselnames = ["X_UTME", "Y_UTMN", "Z_TVDSS"]
-    if isinstance(lognames, str):
-        uselnames.append(lognames)
-    elif isinstance(lognames, list):
-        uselnames.extend(lognames)
-
-    newdf = pd.DataFrame()
-    for lname in uselnames:
-        if lname in dfr.columns:
-            newdf[lname] = dfr[lname]
-        else:
-            if lognames_strict:
-                msg = "Logname <{0}> is not present for <{1}>".format(lname, wname)
-                msg += " (required log under condition lognames_strict=True)"
-                raise ValueError(msg)
-
-    return newdf
+    uselnames = _get_lognames_to_use(dfr.columns, lognames, lognames_strict, wname)
+    return dfr[uselnames].copy()
 
 
 def _check_special_logs(dfr, mdlogname, zonelogname, strict, wname):
@@ -1,7 +1,6 @@
 """Operations along a well, private module."""
 
 import copy
-from distutils.version import StrictVersion
 
 import numpy as np
 import pandas as pd
@@ -49,11 +48,11 @@ def delete_log(self, lname):
 def rescale(self, delta=0.15, tvdrange=None):
     """Rescale by using a new MD increment.
 
-    The rescaling is technically done by interpolation in the Pandas dataframe
+    The rescaling is done per log with numpy, on the MD axis: continuous logs are
+    interpolated linearly, while discrete logs take the value of the nearest
+    sample (the previous sample if equally near). Undefined samples are skipped,
+    and new samples outside the defined range of a log are undefined.
     """
-    pdrows = pd.options.display.max_rows
-    pd.options.display.max_rows = 999
-
     dfrcolumns0 = self._df.columns
 
     if self.mdlogname is None:
@@ -62,62 +61,90 @@ def rescale(self, delta=0.15, tvdrange=None):
     dfrcolumns1 = self._df.columns
     columnsadded = list(set(dfrcolumns1) - set(dfrcolumns0))  # new tmp columns, if any
 
-    dfr = self._df.copy().set_index(self.mdlogname)
-
-    logger.debug("Initial dataframe\n %s", dfr)
+    mdlogname = self.mdlogname
+    mdv = self._df[mdlogname].values.astype(np.float64)
 
-    start = dfr.index[0]
-    stop = dfr.index[-1]
-    startt = start
-    stopt = stop
+    # rows [0, istart] and [istop, end] are kept as is, when a tvdrange is given
+    istart = 0
+    istop = mdv.size - 1
 
     if tvdrange and isinstance(tvdrange, tuple) and len(tvdrange) == 2:
         tvd1, tvd2 = tvdrange
+        zvals = self._df["Z_TVDSS"].values
 
-        try:
-            startt = dfr.index[dfr["Z_TVDSS"] >= tvd1][0]
-        except IndexError:
-            startt = start
+        below = np.flatnonzero(zvals >= tvd1)
+        if below.size > 0:
+            istart = below[0]
 
-        try:
-            stopt = dfr.index[dfr["Z_TVDSS"] >= tvd2][0]
-        except IndexError:
-            stopt = stop
+        below = np.flatnonzero(zvals >= tvd2)
+        if below.size > 0:
+            istop = below[0]
 
-    dfr1 = dfr[start:startt]
-    dfr2 = dfr[stopt:stop]
+    startt = mdv[istart]
+    stopt = mdv[istop]
 
     nentry = int(round((stopt - startt) / delta))
+    newmd = np.linspace(startt, stopt, num=nentry)
 
-    dfr = dfr.reindex(dfr.index.union(np.linspace(startt, stopt, num=nentry)))
-    dfr = dfr.interpolate("index", limit_area="inside").loc[
-        np.linspace(startt, stopt, num=nentry)
-    ]
-
-    if StrictVersion(pd.__version__) > StrictVersion("0.23.0"):
-        dfr = pd.concat([dfr1, dfr, dfr2], sort=False)
-    else:
-        dfr = pd.concat([dfr1, dfr, dfr2])
+    columns = [col for col in self._df.columns if col != mdlogname] + [mdlogname]
 
+    newdata = {}
+    for lname in columns:
+        if lname == mdlogname:
+            resampled = newmd
+        else:
+            resampled = _resample_log(
+                mdv,
+                self._df[lname].values.astype(np.float64),
+                newmd,
+                discrete=self._wlogtypes.get(lname) == "DISC",
+            )
+        oldvalues = self._df[lname].values.astype(np.float64)
+        newdata[lname] = np.concatenate(
+            [oldvalues[: istart + 1], resampled, oldvalues[istop:]]
+        )
+
+    dfr = pd.DataFrame(newdata, columns=columns)
     dfr.drop_duplicates(inplace=True)
-    dfr[self.mdlogname] = dfr.index
     dfr.reset_index(inplace=True, drop=True)
 
-    for lname in dfr.columns:
-        if lname in self._wlogtypes:
-            ltype = self._wlogtypes[lname]
-            if ltype == "DISC":
-                dfr = dfr.round({lname: 0})
-
     logger.debug("Updated dataframe:\n%s", dfr)
 
-    pd.options.display.max_rows = pdrows  # reset
-
     self._df = dfr
     if columnsadded:
         self.delete_log(columnsadded)
 
 
+def _resample_log(mdv, values, newmd, discrete=False):
+    """Resample one log from MD positions mdv to newmd, as numpy array.
+
+    Continuous logs are linearly interpolated, discrete logs use the nearest
+    sample. Only defined (not NaN) samples are used, and the result is NaN outside
+    the MD range of the defined samples.
+    """
+    valid = ~np.isnan(values)
+    mdvalid = mdv[valid]
+    vvalid = values[valid]
+
+    result = np.full(newmd.size, np.nan, dtype=np.float64)
+    if mdvalid.size == 0:
+        return result
+
+    inside = (newmd >= mdvalid[0]) & (newmd <= mdvalid[-1])
+    mdinside = newmd[inside]
+
+    if not discrete:
+        result[inside] = np.interp(mdinside, mdvalid, vvalid)
+        return result
+
+    # nearest sample, the previous one if equally near
+    nxt = np.clip(np.searchsorted(mdvalid, mdinside, side="right"), 0, mdvalid.size - 1)
+    prv = np.clip(nxt - 1, 0, mdvalid.size - 1)
+    usenext = (mdvalid[nxt] - mdinside) < (mdinside - mdvalid[prv])
+    result[inside] = np.where(usenext, vvalid[nxt], vvalid[prv])
+    return result
+
+
 def make_zone_qual_log(self, zqname):
     """Make a flag log based on stratigraphic relations."""
     if zqname in self.dataframe:
@@ -294,12 +321,19 @@ def _make_ijk_from_grid_v2(self, grid, grid_id="", activeonly=True):
         undef=np.nan,
     )
 
-    # The resulting df shall have same length as the well's dataframe,
+    add_ijk_logs(self, df)
+
+
+def add_ijk_logs(self, df):
+    """Add the I J K columns in df (one row per well sample) to the well."""
+    # The df shall have same length as the well's dataframe,
     # but the well index may not start from one. So first ignore index, then
     # re-establish
     wellindex = self.dataframe.index
 
-    newdf = pd.concat([self.dataframe.reset_index(drop=True), df], axis=1)
+    newdf = pd.concat(
+        [self.dataframe.reset_index(drop=True), df.reset_index(drop=True)], axis=1
+    )
     newdf.index = wellindex
 
     self.dataframe = newdf
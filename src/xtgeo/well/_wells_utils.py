@@ -3,22 +3,337 @@
 
 
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 import shapely.geometry as sg
 
+import xtgeo
 from xtgeo.common import XTGeoDialog
 from xtgeo.common import XTGShowProgress
 
+from . import _well_oper
+
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 xtg = XTGeoDialog()
 
 
+def _import_one_well(args):
+    """Import a single well; return a tuple (well or None, error message or None).
+
+    This is a module level function so it can be pickled to a worker process.
+    """
+    wfile, fformat, mdlogname, zonelogname, strict = args
+    try:
+        wll = xtgeo.Well(
+            wfile,
+            fformat=fformat,
+            mdlogname=mdlogname,
+            zonelogname=zonelogname,
+            strict=strict,
+        )
+    except ValueError as err:
+        return None, str(err)
+    return wll, None
+
+
+def import_wells(filelist, fformat, mdlogname, zonelogname, strict, nprocesses=None):
+    """Import a list of well files, optionally in a pool of processes.
+
+    The result is a list of (well, errormessage) tuples in the same order as the
+    input files, where well is None if import failed with a ValueError.
+    """
+    jobs = [(wfile, fformat, mdlogname, zonelogname, strict) for wfile in filelist]
+
+    if nprocesses is None or nprocesses <= 1 or len(jobs) < 2:
+        return [_import_one_well(job) for job in jobs]
+
+    logger.info("Import %s wells using %s processes", len(jobs), nprocesses)
+    chunksize = max(1, len(jobs) // (4 * nprocesses))
+    with ProcessPoolExecutor(max_workers=nprocesses) as executor:
+        result = list(executor.map(_import_one_well, jobs, chunksize=chunksize))
+
+    return result
+
+
+def rescale_wells(wells, delta=0.15, tvdrange=None, nthreads=None):
+    """Rescale all wells in place, optionally in a pool of threads.
+
+    Each well is rescaled independently, and the numpy resampling mostly runs
+    outside the GIL, so threads avoid copying the wells to worker processes.
+    """
+    if nthreads is None or nthreads <= 1 or len(wells) < 2:
+        for well in wells:
+            well.rescale(delta=delta, tvdrange=tvdrange)
+        return
+
+    logger.info("Rescale %s wells using %s threads", len(wells), nthreads)
+    with ThreadPoolExecutor(max_workers=nthreads) as executor:
+        # list() to raise any exception from the workers
+        list(
+            executor.map(
+                lambda well: well.rescale(delta=delta, tvdrange=tvdrange), wells
+            )
+        )
+
+
+def make_ijk_from_grid_wells(wells, grid, grid_id="", algorithm=2, activeonly=True):
+    """Add grid I J K logs to all wells, with one lookup for all trajectories.
+
+    With algorithm 2, the grid lookup index is made (or reused) once, and the
+    trajectories of all wells are looked up as one set of points in one C call;
+    the result is then split and added per well. Other algorithms are per well.
+    """
+    if not wells:
+        return
+
+    if algorithm != 2:
+        for well in wells:
+            well.make_ijk_from_grid(
+                grid, grid_id=grid_id, algorithm=algorithm, activeonly=activeonly
+            )
+        return
+
+    nrows = [well.dataframe.shape[0] for well in wells]
+    logger.info(
+        "Make IJK for %s wells (%s points) in one lookup", len(wells), sum(nrows)
+    )
+
+    wpoints = xtgeo.Points()
+    wpoints.dataframe = pd.concat(
+        [well.dataframe.loc[:, ["X_UTME", "Y_UTMN", "Z_TVDSS"]] for well in wells],
+        ignore_index=True,
+    )
+
+    cna = ("ICELL" + grid_id, "JCELL" + grid_id, "KCELL" + grid_id)
+    dfr = grid.get_ijk_from_points(
+        wpoints,
+        activeonly=activeonly,
+        zerobased=False,
+        dataframe=True,
+        includepoints=False,
+        columnnames=cna,
+        fmt="float",
+        undef=np.nan,
+    )
+
+    start = 0
+    for well, nrow in zip(wells, nrows):
+        _well_oper.add_ijk_logs(well, dfr.iloc[start : start + nrow])
+        start += nrow
+
+
+def _segment_buckets(xcor, ycor, xmin, ymin, cellsize):
+    """Return unique bucket keys covered by the bounding boxes of all segments."""
+    isok = np.isfinite(xcor) & np.isfinite(ycor)
+    ix = np.floor((np.where(isok, xcor, xmin) - xmin) / cellsize).astype(np.int64)
+    iy = np.floor((np.where(isok, ycor, ymin) - ymin) / cellsize).astype(np.int64)
+
+    # skip segments with undefined end points
+    segok = isok[:-1] & isok[1:]
+    ix0 = np.minimum(ix[:-1], ix[1:])[segok]
+    ix1 = np.maximum(ix[:-1], ix[1:])[segok]
+    iy0 = np.minimum(iy[:-1], iy[1:])[segok]
+    iy1 = np.maximum(iy[:-1], iy[1:])[segok]
+
+    # a segment may cover more than one bucket; expand to all covered buckets
+    nyb = iy1 - iy0 + 1
+    ncells = (ix1 - ix0 + 1) * nyb
+    seg = np.repeat(np.arange(ncells.size), ncells)
+    offset = np.arange(seg.size) - np.repeat(np.cumsum(ncells) - ncells, ncells)
+
+    bx = ix0[seg] + offset // nyb[seg]
+    by = iy0[seg] + offset % nyb[seg]
+
+    return np.unique(bx * (2 ** 31) + by)
+
+
+def segment_index_candidates(wells, cellsize=None):
+    """Find candidate crossing well pairs from a uniform XY bucket grid of segments.
+
+    Each trajectory segment is put in all buckets that its bounding box covers. Two
+    segments that intersect will always share a bucket, hence wells that share no
+    bucket cannot cross in XY.
+
+    Returns:
+        List (one entry per well) of sets of indices for wells that may cross.
+    """
+    xys = []
+    for well in wells:
+        if well.dataframe is None or well.nrow < 2:
+            xys.append(None)
+            continue
+        xys.append(
+            (well.dataframe["X_UTME"].values, well.dataframe["Y_UTMN"].values)
+        )
+
+    candidates = [set() for _ in wells]
+    valid = [xy for xy in xys if xy is not None]
+    if not valid:
+        return candidates
+
+    xmin = min(np.nanmin(xy[0]) for xy in valid)
+    ymin = min(np.nanmin(xy[1]) for xy in valid)
+
+    if cellsize is None:
+        # use a typical segment length, but limit the total number of buckets
+        lengths = np.concatenate(
+            [np.hypot(np.diff(xy[0]), np.diff(xy[1])) for xy in valid]
+        )
+        lengths = lengths[np.isfinite(lengths)]
+        xmax = max(np.nanmax(xy[0]) for xy in valid)
+        ymax = max(np.nanmax(xy[1]) for xy in valid)
+        extent = max(xmax - xmin, ymax - ymin)
+        typical = np.median(lengths) * 4.0 if lengths.size > 0 else 0.0
+        cellsize = max(typical, extent / 1024.0, 1.0e-6)
+
+    keys = []
+    owners = []
+    for iwell, xy in enumerate(xys):
+        if xy is None:
+            continue
+        wkeys = _segment_buckets(xy[0], xy[1], xmin, ymin, cellsize)
+        keys.append(wkeys)
+        owners.append(np.full(wkeys.size, iwell, dtype=np.int64))
+
+    keys = np.concatenate(keys)
+    owners = np.concatenate(owners)
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    owners = owners[order]
+
+    # group wells by bucket; only buckets shared by more than one well are of interest
+    bounds = np.flatnonzero(np.diff(keys)) + 1
+    for group in np.split(owners, bounds):
+        if group.size < 2:
+            continue
+        members = set(group.tolist())
+        for iwell in members:
+            candidates[iwell].update(members)
+
+    for iwell, cand in enumerate(candidates):
+        cand.discard(iwell)
+
+    logger.info("Candidate crossing pairs: %s", sum(len(cnd) for cnd in candidates))
+    return candidates
+
+
+def _well_lines(well):
+    """Return the 2D and the X,Y,MD line for a well, or None if too few points."""
+    welldfr = well.dataframe
+
+    xcor = welldfr["X_UTME"].values
+    ycor = welldfr["Y_UTMN"].values
+    mcor = welldfr[well.mdlogname].values
+    logger.info("The mdlogname property is: %s", well.mdlogname)
+
+    if xcor.size < 2:
+        return None
+
+    thisline1 = sg.LineString(np.stack([xcor, ycor], axis=1))
+    thisline2 = sg.LineString(np.stack([xcor, ycor, mcor], axis=1))
+    return thisline1, thisline2
+
+
+def _pair_intersections(well, lines, other, wfilter):
+    """Find where other crosses well.
+
+    Returns:
+        A tuple (status, points) where status is "skip" if other has too few points
+        after truncation, "nox" if no crossing, or "cross", and points is a list of
+        [WELL, MDEPTH, CWELL, X_UTME, Y_UTMN, Z_TVDSS] entries.
+    """
+    thisline1, thisline2 = lines
+    xpoints = []
+
+    # truncate away the paralell part on a copy
+    owell = other.copy()
+
+    # wfilter = None
+    if wfilter is not None and "parallel" in wfilter:
+        xtol = wfilter["parallel"].get("xtol")
+        ytol = wfilter["parallel"].get("ytol")
+        ztol = wfilter["parallel"].get("ztol")
+        itol = wfilter["parallel"].get("itol")
+        atol = wfilter["parallel"].get("atol")
+        owell.truncate_parallel_path(
+            well, xtol=xtol, ytol=ytol, ztol=ztol, itol=itol, atol=atol
+        )
+
+    xcorc = owell.dataframe["X_UTME"].values
+    ycorc = owell.dataframe["Y_UTMN"].values
+    zcorc = owell.dataframe["Z_TVDSS"].values
+
+    if xcorc.size < 2:
+        return "skip", xpoints
+
+    otherline = sg.LineString(np.stack([xcorc, ycorc, zcorc], axis=1))
+
+    if not thisline1.crosses(otherline):
+        return "nox", xpoints
+
+    ixx = thisline1.intersection(otherline)
+
+    if ixx.is_empty:
+        return "nox", xpoints
+
+    # need this trick to get mdepth
+    other2 = sg.LineString(np.stack([xcorc, ycorc], axis=1))
+    ixx2 = thisline2.intersection(other2)
+
+    logger.debug("==> Intersects with %s", other.name)
+
+    if isinstance(ixx, sg.Point):
+        xcor, ycor, zcor = ixx.coords[0]
+        _x, _y, mcor = ixx2.coords[0]
+        xpoints.append([well.name, mcor, other.name, xcor, ycor, zcor])
+
+    elif isinstance(ixx, sg.MultiPoint):
+        pxx2 = list(ixx2)
+        for ino, pxx in enumerate(list(ixx)):
+            xcor, ycor, zcor = pxx.coords[0]
+            _x, _y, mcor = pxx2[ino].coords[0]
+            xpoints.append([well.name, mcor, other.name, xcor, ycor, zcor])
+
+    elif isinstance(ixx, sg.GeometryCollection):
+        gxx2 = list(ixx2)
+        for ino, gxx in enumerate(list(ixx)):
+            if isinstance(gxx, sg.Point):
+                xcor, ycor, zcor = gxx.coords[0]
+                _x, _y, mcor = gxx2[ino].coords[0]
+                xpoints.append([well.name, mcor, other.name, xcor, ycor, zcor])
+
+    return "cross", xpoints
+
+
+# wells shared with worker processes, set once per worker by the pool initializer
+_POOL_WELLS = None
+
+
+def _init_pool_wells(wells):
+    global _POOL_WELLS  # pylint: disable=global-statement
+    _POOL_WELLS = wells
+
+
+def _well_all_intersections(args):
+    """Compute intersections between one well and all its candidates (worker)."""
+    iwell, others, wfilter = args
+    well = _POOL_WELLS[iwell]
+    lines = _well_lines(well)
+    if lines is None:
+        return iwell, {}
+    return iwell, {
+        jwell: _pair_intersections(well, lines, _POOL_WELLS[jwell], wfilter)
+        for jwell in others
+    }
+
+
 def wellintersections(
-    self, wfilter=None, showprogress=False
-):  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
+    self, wfilter=None, showprogress=False, nprocesses=None, useindex=True
+):  # pylint: disable=too-many-locals, too-many-branches
     """Get intersections between wells, return as dataframe table.
 
     This routine is using "shapely" functions!
@@ -26,50 +341,82 @@ def wellintersections(
     Some actions are done in order to filter away the part of the trajectories
     that are paralell.
 
+    Candidate well pairs are found from a segment bucket index (see
+    :func:`segment_index_candidates`) which is built once for all wells. If
+    nprocesses > 1, each well is processed against its candidates in a pool of
+    processes, and the result is merged in the same order as the serial loop.
+    The ``useindex`` key is for testing only (False will use all well pairs).
     """
+    wells = self.wells
+    wlen = len(wells)
+
+    if useindex:
+        candidates = segment_index_candidates(wells)
+    else:
+        candidates = [set(range(wlen)) - {iwell} for iwell in range(wlen)]
+
+    parallel = nprocesses is not None and nprocesses > 1 and wlen > 1
+
+    gstatus = [None] * wlen
+    precomputed = {}
+    if parallel:
+        # geometrics are needed in advance (they are computed in order in serial mode)
+        for iwell, well in enumerate(wells):
+            gstatus[iwell] = well.geometrics()
+
+        jobs = []
+        for iwell, well in enumerate(wells):
+            if not gstatus[iwell]:
+                continue
+            others = [
+                jwell
+                for jwell in sorted(candidates[iwell])
+                if wells[jwell].name != well.name and well.may_overlap(wells[jwell])
+            ]
+            jobs.append((iwell, others, wfilter))
+
+        logger.info("Compute well intersections using %s processes", nprocesses)
+        with ProcessPoolExecutor(
+            max_workers=nprocesses, initializer=_init_pool_wells, initargs=(wells,)
+        ) as executor:
+            for iwell, res in executor.map(_well_all_intersections, jobs):
+                precomputed[iwell] = res
 
     xpoints = []
 
     # make a dict if nocrossings
     nox = {}
 
-    wlen = len(self.wells)
-
     progress = XTGShowProgress(wlen, show=showprogress, leadtext="progress: ", skip=5)
 
-    for iwell, well in enumerate(self.wells):
+    for iwell, well in enumerate(wells):
 
         progress.flush(iwell)
 
-        gstatus = well.geometrics()
+        if not parallel:
+            gstatus[iwell] = well.geometrics()
 
         logger.info("Work with %s", well.name)
-        if not gstatus:
+        if not gstatus[iwell]:
             logger.info("Skip %s (cannot compute geometrics)", well.name)
             continue
 
-        welldfr = well.dataframe.copy()
-
-        xcor = welldfr["X_UTME"].values
-        ycor = welldfr["Y_UTMN"].values
-        zcor = welldfr["Z_TVDSS"].values
-        mcor = welldfr[well.mdlogname].values
-        logger.info("The mdlogname property is: %s", well.mdlogname)
-
-        if xcor.size < 2:
+        lines = None
+        if not parallel:
+            lines = _well_lines(well)
+            if lines is None:
+                continue
+        elif well.dataframe["X_UTME"].values.size < 2:
             continue
 
-        thisline1 = sg.LineString(np.stack([xcor, ycor], axis=1))
-        thisline2 = sg.LineString(np.stack([xcor, ycor, mcor], axis=1))
-
         nox[well.name] = list()
         # loop over other wells
-        for other in self.wells:
+        for jwell, other in enumerate(wells):
 
             if other.name == well.name:
                 continue  # same well
 
-            if not well.may_overlap(other):
+            if jwell not in candidates[iwell] or not well.may_overlap(other):
                 nox[well.name].append(other.name)
                 continue  # a quick check; no chance for overlap
 
@@ -81,64 +428,14 @@ def wellintersections(
             if other.name in nox.keys() and well.name in nox[other.name]:
                 continue
 
-            # truncate away the paralell part on a copy
-            owell = other.copy()
-
-            # wfilter = None
-            if wfilter is not None and "parallel" in wfilter:
-                xtol = wfilter["parallel"].get("xtol")
-                ytol = wfilter["parallel"].get("ytol")
-                ztol = wfilter["parallel"].get("ztol")
-                itol = wfilter["parallel"].get("itol")
-                atol = wfilter["parallel"].get("atol")
-                owell.truncate_parallel_path(
-                    well, xtol=xtol, ytol=ytol, ztol=ztol, itol=itol, atol=atol
-                )
-
-            xcorc = owell.dataframe["X_UTME"].values
-            ycorc = owell.dataframe["Y_UTMN"].values
-            zcorc = owell.dataframe["Z_TVDSS"].values
-
-            if xcorc.size < 2:
-                continue
-
-            otherline = sg.LineString(np.stack([xcorc, ycorc, zcorc], axis=1))
-
-            if not thisline1.crosses(otherline):
-                nox[well.name].append(other.name)
-                continue
-
-            ixx = thisline1.intersection(otherline)
+            if parallel:
+                status, points = precomputed[iwell][jwell]
+            else:
+                status, points = _pair_intersections(well, lines, other, wfilter)
 
-            if ixx.is_empty:
+            if status == "nox":
                 nox[well.name].append(other.name)
-                continue
-
-            # need this trick to get mdepth
-            other2 = sg.LineString(np.stack([xcorc, ycorc], axis=1))
-            ixx2 = thisline2.intersection(other2)
-
-            logger.debug("==> Intersects with %s", other.name)
-
-            if isinstance(ixx, sg.Point):
-                xcor, ycor, zcor = ixx.coords[0]
-                _x, _y, mcor = ixx2.coords[0]
-                xpoints.append([well.name, mcor, other.name, xcor, ycor, zcor])
-
-            elif isinstance(ixx, sg.MultiPoint):
-                pxx2 = list(ixx2)
-                for ino, pxx in enumerate(list(ixx)):
-                    xcor, ycor, zcor = pxx.coords[0]
-                    _x, _y, mcor = pxx2[ino].coords[0]
-                    xpoints.append([well.name, mcor, other.name, xcor, ycor, zcor])
-
-            elif isinstance(ixx, sg.GeometryCollection):
-                gxx2 = list(ixx2)
-                for ino, gxx in enumerate(list(ixx)):
-                    if isinstance(gxx, sg.Point):
-                        xcor, ycor, zcor = gxx.coords[0]
-                        _x, _y, mcor = gxx2[ino].coords[0]
-                        xpoints.append([well.name, mcor, other.name, xcor, ycor, zcor])
+            xpoints.extend(points)
 
     dfr = pd.DataFrame(
         xpoints, columns=["WELL", "MDEPTH", "CWELL", "X_UTME", "Y_UTMN", "Z_TVDSS"]
@@ -35,6 +35,7 @@ class Wells(object):
             mdlogname = kwargs.get("mdlogname", None)
             zonelogname = kwargs.get("zonelogname", None)
             strict = kwargs.get("strict", True)
+            nprocesses = kwargs.get("nprocesses", None)
             self.from_files(
                 wfiles,
                 fformat=fformat,
@@ -42,6 +43,7 @@ class Wells(object):
                 zonelogname=zonelogname,
                 strict=strict,
                 append=False,
+                nprocesses=nprocesses,
             )
 
     @property
@@ -122,6 +124,7 @@ class Wells(object):
         zonelogname=None,
         strict=True,
         append=True,
+        nprocesses=None,
     ):
 
         """Import wells from a list of files (filelist).
@@ -137,31 +140,41 @@ class Wells(object):
                 in wells.
             append (bool): If True, new wells will be added to existing
                 wells.
+            nprocesses (int): If given and larger than 1, the files are parsed
+                in a pool of this many processes. The wells will still be in
+                the same order as in filelist. Default is None (serial).
 
         Example:
             Here the from_file method is used to initiate the object
             directly::
 
             >>> mywells = Wells(['31_2-6.w', '31_2-7.w', '31_2-8.w'])
+
+            Parse many wells using 8 processes::
+
+            >>> mywells = Wells()
+            >>> mywells.from_files(glob.glob("wells/*.w"), nprocesses=8)
+
+        .. versionchanged:: 2.15 Added `nprocesses`
         """
 
         if not append:
             self._wells = []
 
         # file checks are done within the Well() class
-        for wfile in filelist:
-            try:
-                wll = xtgeo.well.Well(
-                    wfile,
-                    fformat=fformat,
-                    mdlogname=mdlogname,
-                    zonelogname=zonelogname,
-                    strict=strict,
-                )
-                self._wells.append(wll)
-            except ValueError as err:
+        result = _wells_utils.import_wells(
+            filelist,
+            fformat,
+            mdlogname,
+            zonelogname,
+            strict,
+            nprocesses=nprocesses,
+        )
+        for wll, err in result:
+            if wll is None:
                 xtg.warn("SKIP this well: {}".format(err))
                 continue
+            self._wells.append(wll)
         if not self._wells:
             xtg.warn("No wells imported!")
 
@@ -263,7 +276,50 @@ class Wells(object):
         for well in self.wells:
             well.downsample(interval=interval, keeplast=keeplast)
 
-    def wellintersections(self, wfilter=None, showprogress=False):
+    def rescale(self, delta=0.15, tvdrange=None, nthreads=None):
+        """Rescale (refine or coarse) all wells by sampling a delta along MD.
+
+        See :meth:`xtgeo.well.Well.rescale`.
+
+        Args:
+            delta (float): Step length
+            tvdrange (tuple of floats): Resampling can be limited to TVD interval
+            nthreads (int): If given and larger than 1, the wells are rescaled in a
+                pool of this many threads.
+
+        .. versionadded:: 2.15
+        """
+        _wells_utils.rescale_wells(
+            self._wells, delta=delta, tvdrange=tvdrange, nthreads=nthreads
+        )
+
+    def make_ijk_from_grid(self, grid, grid_id="", algorithm=2, activeonly=True):
+        """Look through a Grid and add grid I J K as discrete logs to all wells.
+
+        This gives the same result as :meth:`xtgeo.well.Well.make_ijk_from_grid`
+        for each well, but with the default algorithm, the grid lookup index is
+        made only once, and the trajectories of all wells are processed in one
+        lookup. This is much faster for many wells against the same grid.
+
+        Args:
+            grid (Grid): A XTGeo Grid instance
+            grid_id (str): Add a tag (optional) to the current log name
+            algorithm (int): Which internal algorithm to use, default is 2 (expert
+                setting)
+            activeonly (bool): If True, only active cells are applied (algorithm 2
+                only)
+
+        .. versionadded:: 2.15
+        """
+        _wells_utils.make_ijk_from_grid_wells(
+            self._wells,
+            grid,
+            grid_id=grid_id,
+            algorithm=algorithm,
+            activeonly=activeonly,
+        )
+
+    def wellintersections(self, wfilter=None, showprogress=False, nprocesses=None):
         """Get intersections between wells, return as dataframe table.
 
         Notes on wfilter: A wfilter is settings to improve result. In
@@ -281,15 +337,24 @@ class Wells(object):
             wfilter (dict): A dictionrary for filter options, in order to
                 improve result. See example above.
             showprogress (bool): Will show progress to screen if enabled.
+            nprocesses (int): If given and larger than 1, each well is compared
+                with its candidate wells in a pool of this many processes. The
+                result is the same as for the serial version.
 
         Returns:
             A Pandas dataframe object, with columns WELL, CWELL and UTMX UTMY
                 TVD coordinates for CWELL where CWELL crosses WELL,
                 and also MDEPTH for the WELL.
+
+        Candidate well pairs are found from a spatial index of all trajectory
+        segments, built once per call, so wells that are far apart are never
+        compared in detail.
+
+        .. versionchanged:: 2.15 Added `nprocesses` and spatial index of segments
         """
 
         dfr = _wells_utils.wellintersections(
-            self, wfilter=wfilter, showprogress=showprogress
+            self, wfilter=wfilter, showprogress=showprogress, nprocesses=nprocesses
         )
 
         return dfr
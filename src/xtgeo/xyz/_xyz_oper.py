@@ -11,6 +11,7 @@ import shapely.geometry as sg
 import xtgeo
 from xtgeo.common import XTGeoDialog
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
+from xtgeo.xyz import _xyz_polymask
 
 xtg = XTGeoDialog()
 
@@ -35,44 +36,52 @@ def operation_polygons(self, poly, value, opname="add", inside=True, where=True)
 
     logger.warning("Where is not imeplented: %s", where)
 
-    oper = {"set": 1, "add": 2, "sub": 3, "mul": 4, "div": 5, "eli": 11}
-
-    insidevalue = 0
-    if inside:
-        insidevalue = 1
+    if opname not in ("set", "add", "sub", "mul", "div", "eli"):
+        raise ValueError(f"Invalid operation name: {opname}")
 
     logger.info("Operations of points inside polygon(s)...")
     if not isinstance(poly, xtgeo.xyz.Polygons):
         raise ValueError("The poly input is not a Polygons instance")
 
-    idgroups = poly.dataframe.groupby(poly.pname)
+    polymask = _xyz_polymask.PolygonsMask(poly)
+    if polymask.notclosed:
+        raise RuntimeError(f"Polygon {polymask.notclosed[0]} is not closed")
 
     xcor = self._df[self.xname].values
     ycor = self._df[self.yname].values
-    zcor = self._df[self.zname].values
+    zcor = self._df[self.zname].values.astype(np.float64)
 
     usepoly = False
+    pvalues = {}
     if isinstance(value, str) and value == "poly":
         usepoly = True
-
-    for id_, grp in idgroups:
-        pxcor = grp[poly.xname].values
-        pycor = grp[poly.yname].values
-        pvalue = value
-        if usepoly:
-            pvalue = grp[poly.zname].values.mean()
+        pvalues = poly.dataframe.groupby(poly.pname)[poly.zname].mean()
+
+    # the polygons are applied one by one, as points inside (or outside) several
+    # polygons get the operation repeated
+    for id_, indices in polymask.inside_each(xcor, ycor):
+        pvalue = pvalues[id_] if usepoly else value
+
+        if not inside:
+            outside = np.ones(zcor.size, dtype=bool)
+            outside[indices] = False
+            indices = outside
+
+        if opname == "set":
+            zcor[indices] = pvalue
+        elif opname == "add":
+            zcor[indices] += pvalue
+        elif opname == "sub":
+            zcor[indices] -= pvalue
+        elif opname == "mul":
+            zcor[indices] *= pvalue
+        elif opname == "div":
+            if abs(pvalue) < _xyz_polymask.FLOATEPS:
+                zcor[indices] = np.nan
+            else:
+                zcor[indices] /= pvalue
         else:
-            pvalue = value
-
-        logger.info("C function for polygon %s...", id_)
-
-        ies = _cxtgeo.pol_do_points_inside(
-            xcor, ycor, zcor, pxcor, pycor, pvalue, oper[opname], insidevalue
-        )
-        logger.info("C function for polygon %s... done", id_)
-
-        if ies != 0:
-            raise RuntimeError("Something went wrong, code {}".format(ies))
+            zcor[indices] = np.nan
 
     zcor[zcor > xtgeo.UNDEF_LIMIT] = np.nan
     self._df[self.zname] = zcor
@@ -218,6 +227,28 @@ def _rescale_v2(self, distance, addlen, kind="slinear", mode2d=True):
         self.delete_columns([self.hname, self.dhname, self.tname, self.dtname])
 
 
+def split_fencespecs(fencespecs):
+    """Return a list of (fencespec, polyid) from one or more fence specifications.
+
+    The input is a list of 2D numpy arrays and/or Polygons, or a single Polygons
+    instance or numpy. Polygons with several polylines gives one item per POLY_ID,
+    in the order of the dataframe; polyid is None for numpy input.
+    """
+    if isinstance(fencespecs, (np.ndarray, xtgeo.Polygons)):
+        fencespecs = [fencespecs]
+
+    result = []
+    for fspec in fencespecs:
+        if isinstance(fspec, xtgeo.Polygons):
+            for polyid in pd.unique(fspec.dataframe[fspec.pname]):
+                result.append((fspec, int(polyid)))
+        elif isinstance(fspec, np.ndarray):
+            result.append((fspec, None))
+        else:
+            raise ValueError("A fencespec must be a numpy or a Polygons() object")
+    return result
+
+
 def get_fence(
     self, distance=20, atleast=5, nextend=2, name=None, asnumpy=True, polyid=None
 ):
@@ -330,7 +361,7 @@ def snap_surface(self, surf, activeonly=True):
         surf.yinc,
         surf.yflip,
         surf.rotation,
-        surf.get_values1d(),
+        xtgeo.surface._regsurf_utils.values1d_buffer(surf, "snap_surface"),
         0,
     )
 
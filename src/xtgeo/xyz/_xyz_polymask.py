@@ -0,0 +1,133 @@
+# coding: utf-8
+"""Vectorized point in polygons tests, shared by points, surface and grid operations.
+
+The polygons are prepared once (bounding boxes and edge tables), and the points are
+sorted on X once, so the candidate points for each polygon are found by a binary
+search followed by a Y range filter. Only the candidates are tested against the
+polygon edges, in numpy blocks.
+"""
+
+import numpy as np
+
+from xtgeo.common import XTGeoDialog
+
+xtg = XTGeoDialog()
+
+logger = xtg.functionlogger(__name__)
+
+# cf. FLOATEPS in libxtg.h; first and last vertex closer than this is a closed polygon
+FLOATEPS = 1.0e-05
+
+# max number of (point, edge) pairs that are evaluated in one numpy block
+MAXPAIRS = 2000000
+
+
+class PolygonsMask:
+    """Prepared polygons for fast point in polygon tests.
+
+    A point on an edge or a vertex is regarded as inside, as in the C routine
+    pol_chk_point_inside. Polygons that are not closed are not used; their ids are
+    listed in the ``notclosed`` attribute.
+
+    Args:
+        poly: A Polygons instance
+    """
+
+    def __init__(self, poly):
+        self.ids = []
+        self.notclosed = []
+        self._edges = []
+        bboxes = []
+
+        for id_, grp in poly.dataframe.groupby(poly.pname):
+            pxcor = grp[poly.xname].values.astype(np.float64)
+            pycor = grp[poly.yname].values.astype(np.float64)
+
+            if (
+                pxcor.size < 3
+                or abs(pxcor[0] - pxcor[-1]) >= FLOATEPS
+                or abs(pycor[0] - pycor[-1]) >= FLOATEPS
+            ):
+                self.notclosed.append(id_)
+                continue
+
+            # edges from vertex i to i + 1, last vertex is (forced) equal to first
+            pxcor[-1] = pxcor[0]
+            pycor[-1] = pycor[0]
+            self.ids.append(id_)
+            self._edges.append((pxcor[:-1], pycor[:-1], pxcor[1:], pycor[1:]))
+            bboxes.append((pxcor.min(), pxcor.max(), pycor.min(), pycor.max()))
+
+        self._bboxes = np.array(bboxes, dtype=np.float64).reshape((-1, 4))
+
+    def inside_each(self, xcor, ycor):
+        """Yield (polygon id, indices of points inside) for each closed polygon.
+
+        Args:
+            xcor, ycor: 1D numpy arrays with point coordinates
+        """
+        xcor = np.asarray(xcor, dtype=np.float64)
+        ycor = np.asarray(ycor, dtype=np.float64)
+
+        # sort on X once; candidates per polygon are then a slice of the sorted order
+        order = np.argsort(xcor, kind="stable")
+        xsorted = xcor[order]
+        first = np.searchsorted(xsorted, self._bboxes[:, 0], side="left")
+        last = np.searchsorted(xsorted, self._bboxes[:, 1], side="right")
+
+        for inum, id_ in enumerate(self.ids):
+            cand = order[first[inum] : last[inum]]
+            ymin, ymax = self._bboxes[inum, 2:]
+            cand = cand[(ycor[cand] >= ymin) & (ycor[cand] <= ymax)]
+            if cand.size > 0:
+                cand = cand[_inside_edges(xcor[cand], ycor[cand], self._edges[inum])]
+            yield id_, np.sort(cand)
+
+    def inside_count(self, xcor, ycor):
+        """Return number of polygons that each point is inside, as int array."""
+        count = np.zeros(np.size(xcor), dtype=np.int64)
+        for _, indices in self.inside_each(xcor, ycor):
+            count[indices] += 1
+        return count
+
+    def inside_any(self, xcor, ycor):
+        """Return a boolean mask, True for points inside one or more polygons."""
+        mask = np.zeros(np.size(xcor), dtype=bool)
+        for _, indices in self.inside_each(xcor, ycor):
+            mask[indices] = True
+        return mask
+
+
+def _inside_edges(xcor, ycor, edges):
+    """Even-odd rule with on-edge test, for points vs one polygon's edge table."""
+    x1, y1, x2, y2 = edges
+    dxe = x2 - x1
+    dye = y2 - y1
+    # distance tolerance for points on an edge, relative to edge length
+    tol = 1.0e-9 * np.hypot(dxe, dye)
+
+    result = np.zeros(xcor.size, dtype=bool)
+    chunk = max(1, MAXPAIRS // max(1, x1.size))
+
+    for start in range(0, xcor.size, chunk):
+        xpt = xcor[start : start + chunk, np.newaxis]
+        ypt = ycor[start : start + chunk, np.newaxis]
+
+        # crossing of a ray from the point towards +X
+        crossing = (y1 > ypt) != (y2 > ypt)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xint = x1 + (ypt - y1) * dxe / dye
+        ncross = np.count_nonzero(crossing & (xpt < xint), axis=1)
+
+        # points on an edge (or vertex) count as inside
+        onedge = (
+            (np.abs(dxe * (ypt - y1) - dye * (xpt - x1)) <= tol * np.hypot(dxe, dye))
+            & (xpt >= np.minimum(x1, x2) - tol)
+            & (xpt <= np.maximum(x1, x2) + tol)
+            & (ypt >= np.minimum(y1, y2) - tol)
+            & (ypt <= np.maximum(y1, y2) + tol)
+        ).any(axis=1)
+
+        result[start : start + chunk] = (ncross % 2 == 1) | onedge
+
+    return result
@@ -4,6 +4,7 @@ import os
 import pathlib
 import io
 
+import numpy as np
 import pytest
 
 import tests.test_common.test_xtg as tsetup
@@ -52,6 +53,32 @@ def test_generic_hash():
     assert ahash == "fd6639af1cc457b72148d78e90df45df4d344ca3b66fa44598148ce4"
 
 
+def test_generic_hash_arrays():
+    """Testing hashing of arrays from their raw data."""
+    values = np.arange(2000000, dtype=np.float64).reshape(1000, 2000)
+    ahash = xsys.generic_hash_arrays((1, 2.0), (values, None))
+
+    assert xsys.generic_hash_arrays((1, 2.0), (values.copy(), None)) == ahash
+    assert xsys.generic_hash_arrays((1, 2.5), (values, None)) != ahash
+
+    # the print of such arrays elides the middle part, the hash shall not
+    other = values.copy()
+    other[500, 1000] = -1
+    assert xsys.generic_hash_arrays((1, 2.0), (other, None)) != ahash
+
+    # C or F order layout in memory shall not matter
+    fvalues = np.asfortranarray(values)
+    assert xsys.generic_hash_arrays((1, 2.0), (fvalues, None)) == ahash
+
+    # masked entries count as 0
+    mvalues = np.ma.masked_greater(values, 1000)
+    mother = mvalues.copy()
+    mother.data[999, 1999] = 42.0
+    assert xsys.generic_hash_arrays((), (mvalues,)) == xsys.generic_hash_arrays(
+        (), (mother,)
+    )
+
+
 def test_resolve_alias():
     """Testing resolving file alias function."""
     surf = xtgeo.RegularSurface(TESTSURF)
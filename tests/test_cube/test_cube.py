@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 import os
+import shutil
 from os.path import join
 
 import pytest
 import numpy as np
 
 import xtgeo
-from xtgeo.cube import Cube
+from xtgeo.cube import Cube, SegyTraceIndex
 from xtgeo.common import XTGeoDialog
 
 
@@ -335,3 +336,196 @@ def test_cube_randomline():
         plt.axis("tight")
         plt.colorbar()
         plt.show()
+
+
+def test_cube_randomlines_batch():
+    """Compute several randomlines in one call, compare with single randomlines"""
+
+    incube = Cube(SFILE4)
+
+    poly = xtgeo.Polygons()
+    poly.from_list(
+        [
+            [778133, 6737650, 2000, 1],
+            [776880, 6738820, 2000, 1],
+            [778133, 6738820, 2000, 2],
+            [776880, 6737650, 2000, 2],
+        ]
+    )
+    fence = poly.get_fence(distance=10, asnumpy=True, polyid=2)
+
+    t0 = xtg.timer()
+    result = incube.get_randomlines([poly, fence], nthreads=3)
+    print("Batch randomlines: ", xtg.timer(t0))
+
+    assert len(result) == 3
+
+    dist = 0.25 * (incube.xinc + incube.yinc)
+    single = [
+        incube.get_randomline(poly.get_fence(distance=dist, asnumpy=True, polyid=1)),
+        incube.get_randomline(poly.get_fence(distance=dist, asnumpy=True, polyid=2)),
+        incube.get_randomline(fence),
+    ]
+    for res, expected in zip(result, single):
+        assert res[0] == pytest.approx(expected[0])
+        assert res[1] == pytest.approx(expected[1])
+        np.testing.assert_array_equal(res[4], expected[4])
+
+    assert result[0][0] == pytest.approx(-15.7, 0.1)
+    assert np.nanmean(result[0][4]) == pytest.approx(-12.5, 0.1)
+
+
+@pytest.mark.parametrize("fformat", ["segy", "xtgregcube"])
+def test_cube_mmap(loadsfile1, fformat):
+    """Import a cube as memory mapped, and compare operations with in-memory cube"""
+
+    if fformat == "segy":
+        cfile = SFILE1
+    else:
+        cfile = join(TMD, "cube_for_mmap.xtgregcube")
+        loadsfile1.to_file(cfile, fformat="xtgregcube")
+
+    incube = xtgeo.cube_from_file(cfile, fformat=fformat)
+    mcube = xtgeo.cube_from_file(cfile, fformat=fformat, mmap=True)
+
+    assert isinstance(mcube.values, np.memmap)
+    assert mcube.dimensions == incube.dimensions
+    np.testing.assert_array_equal(mcube.values, incube.values)
+
+    poly = xtgeo.Polygons()
+    poly.from_list([[460000, 5935000, 1700, 1], [462500, 5937500, 1700, 1]])
+    rl1 = incube.get_randomline(poly)
+    rl2 = mcube.get_randomline(poly)
+    np.testing.assert_allclose(rl1[4], rl2[4])
+
+    surf1 = xtgeo.surface_from_cube(incube, 1700.0)
+    surf2 = xtgeo.surface_from_cube(mcube, 1700.0)
+    surf1.slice_cube(incube)
+    surf2.slice_cube(mcube)
+    np.testing.assert_allclose(surf1.values, surf2.values)
+
+    incube.do_cropping((2, 13), (10, 22), (30, 0))
+    mcube.do_cropping((2, 13), (10, 22), (30, 0))
+    assert not isinstance(mcube.values, np.memmap)
+    np.testing.assert_array_equal(mcube.values, incube.values)
+    assert mcube.xori == incube.xori
+
+
+def test_cube_hdf5_import_export(loadsfile1):
+    """Export a cube to chunked hdf5 and import it, full and partial."""
+
+    incube = loadsfile1
+    hfile = join(TMD, "cube_chunked.h5")
+    incube.to_file(hfile, fformat="hdf")
+
+    xcube = xtgeo.cube_from_file(hfile)
+    assert xcube.dimensions == incube.dimensions
+    np.testing.assert_array_equal(xcube.values, incube.values)
+    np.testing.assert_array_equal(xcube.ilines, incube.ilines)
+    np.testing.assert_array_equal(xcube.xlines, incube.xlines)
+    assert xcube.xori == pytest.approx(incube.xori)
+    assert xcube.rotation == pytest.approx(incube.rotation)
+
+    # partial read shall be the same as cropping
+    ncol, nrow, nlay = incube.dimensions
+    t0 = xtg.timer()
+    pcube = xtgeo.cube_from_file(
+        hfile, ijkrange=(3, ncol - 13, 11, nrow - 22, 31, "max")
+    )
+    print("Time for partial read of HDF: ", xtg.timer(t0))
+
+    incube.do_cropping((2, 13), (10, 22), (30, 0))
+    assert pcube.dimensions == incube.dimensions
+    np.testing.assert_array_equal(pcube.values, incube.values)
+    np.testing.assert_array_equal(pcube.ilines, incube.ilines)
+    np.testing.assert_array_equal(pcube.traceidcodes, incube.traceidcodes)
+    assert pcube.xori == pytest.approx(incube.xori)
+    assert pcube.yori == pytest.approx(incube.yori)
+    assert pcube.zori == pytest.approx(incube.zori)
+
+    with pytest.raises(ValueError, match="exceeds boundaries"):
+        xtgeo.cube_from_file(hfile, ijkrange=(1, ncol + 1, 1, 2, 1, 2))
+
+    with pytest.raises(ValueError, match="only supported for hdf"):
+        xtgeo.cube_from_file(SFILE1, ijkrange=(1, 2, 1, 2, 1, 2))
+
+
+def test_segy_traceindex(loadsfile1, tmp_path, monkeypatch):
+    """Import SEGY using a persistent trace header index, and compare."""
+
+    incube = loadsfile1
+    sfile = str(tmp_path / "reek_for_index.segy")
+    shutil.copyfile(SFILE1, sfile)
+
+    t0 = xtg.timer()
+    index = Cube.scan_segy_index(sfile)
+    print("Time for scanning trace headers: ", xtg.timer(t0))
+
+    assert isinstance(index, SegyTraceIndex)
+    assert os.path.isfile(sfile + ".xtgtrcindex.npz")
+    assert index.ntraces == incube.ncol * incube.nrow
+    assert index.nsamples == incube.nlay
+    assert len(index.get_dataframe()) == index.ntraces
+
+    # the sidecar file shall now be used, not a new scan
+    def _noscan(*_):
+        raise RuntimeError("Trace headers are scanned again")
+
+    monkeypatch.setattr(SegyTraceIndex, "from_segy", classmethod(_noscan))
+
+    for mmap in (False, True):
+        t0 = xtg.timer()
+        xcube = xtgeo.cube_from_file(sfile, traceindex=True, mmap=mmap)
+        print("Time for import using trace index: ", xtg.timer(t0))
+
+        assert xcube.dimensions == incube.dimensions
+        np.testing.assert_array_equal(xcube.values, incube.values)
+        np.testing.assert_array_equal(xcube.ilines, incube.ilines)
+        np.testing.assert_array_equal(xcube.xlines, incube.xlines)
+        np.testing.assert_array_equal(xcube.traceidcodes, incube.traceidcodes)
+        assert xcube.xori == pytest.approx(incube.xori)
+        assert xcube.yori == pytest.approx(incube.yori)
+        assert xcube.zori == pytest.approx(incube.zori)
+        assert xcube.zinc == pytest.approx(incube.zinc)
+        assert xcube.rotation == pytest.approx(incube.rotation)
+        assert xcube.yflip == incube.yflip
+
+    # a changed SEGY file makes the sidecar outdated
+    os.utime(sfile, ns=(0, 0))
+    assert not SegyTraceIndex.from_file(sfile + ".xtgtrcindex.npz").is_valid_for(
+        sfile
+    )
+    with pytest.raises(RuntimeError, match="scanned again"):
+        xtgeo.cube_from_file(sfile, traceindex=True)
+
+
+def test_segy_subvolume(loadsfile1):
+    """Import a SEGY sub volume by line and z ranges, compare with cropping."""
+
+    incube = loadsfile1
+    ilines = (incube.ilines[2], incube.ilines[-14])
+    xlines = (incube.xlines[10], incube.xlines[-23])
+    zrange = (incube.zori + 30 * incube.zinc, incube.zori + 40 * incube.zinc)
+
+    t0 = xtg.timer()
+    sub = xtgeo.cube_from_file(SFILE1, ilines=ilines, xlines=xlines, zrange=zrange)
+    print("Time for reading SEGY sub volume: ", xtg.timer(t0))
+
+    incube.do_cropping((2, 13), (10, 22), (30, incube.nlay - 41))
+
+    assert sub.dimensions == incube.dimensions
+    np.testing.assert_array_equal(sub.values, incube.values)
+    np.testing.assert_array_equal(sub.ilines, incube.ilines)
+    np.testing.assert_array_equal(sub.xlines, incube.xlines)
+    np.testing.assert_array_equal(sub.traceidcodes, incube.traceidcodes)
+    assert sub.xori == pytest.approx(incube.xori)
+    assert sub.yori == pytest.approx(incube.yori)
+    assert sub.zori == pytest.approx(incube.zori)
+    assert sub.rotation == pytest.approx(incube.rotation)
+    assert sub.yflip == incube.yflip
+
+    with pytest.raises(ValueError, match="No ilines in range"):
+        xtgeo.cube_from_file(SFILE1, ilines=(-10, -1))
+
+    with pytest.raises(ValueError, match="only supported for SEGY"):
+        xtgeo.cube_from_file(SFILE1, fformat="rms_regular", zrange=(1, 2))
@@ -15,6 +15,7 @@ import tests.test_common.test_xtg as tsetup
 import xtgeo
 from xtgeo.grid3d import Grid
 from xtgeo.grid3d import GridProperty
+from xtgeo.grid3d import _grid_etc1
 from xtgeo.common import XTGeoDialog
 
 xtg = XTGeoDialog()
@@ -747,6 +748,25 @@ def test_generate_hash():
 
     assert grd1.generate_hash() == grd2.generate_hash()
 
+    # a change in the middle of the arrays shall give another hash
+    grd2._zcornsv.ravel()[grd2._zcornsv.size // 2] += 0.5
+    grd2._touch_geometry()
+    assert grd1.generate_hash() != grd2.generate_hash()
+
+    t0 = xtg.timer()
+    hash1 = grd1.generate_hash("blake2b")
+    print("Time for hashing grid: ", xtg.timer(t0))
+
+    # the hash is memoized until the geometry changes
+    t0 = xtg.timer()
+    assert grd1.generate_hash("blake2b") == hash1
+    print("Time for memoized hash: ", xtg.timer(t0))
+    assert grd1._tmp["hash"]
+
+    grd1.translate_coordinates(translate=(0, 0, 10))
+    assert "hash" not in grd1._tmp
+    assert grd1.generate_hash("blake2b") != hash1
+
 
 def test_gridquality_properties(xtgshow):
     """Get grid quality props."""
@@ -823,3 +843,95 @@ def test_bulkvol_speed():
     _ = grd.get_bulk_volume()
     ncells = np.prod(dimens)
     print(xtg.timer(t0), ncells)
+
+
+def test_keep_both_layouts():
+    """Mixing legacy and new layout methods shall convert once when kept."""
+    grd = Grid()
+    grd.create_box(dimension=(30, 40, 10))
+    # cache hits would skip the calls, and hence the conversions counted below
+    grd.set_geometry_cache(maxbytes=0)
+    dz1 = grd.get_dz().values.copy()
+    bulk1 = grd.get_bulk_volume().values.copy()
+
+    conversions = _grid_etc1.XTGFORMAT_CONVERSIONS
+    grd.keep_both_layouts()
+    conversions.clear()
+
+    t0 = xtg.timer()
+    for _ in range(5):
+        dz2 = grd.get_dz()
+        bulk2 = grd.get_bulk_volume()
+    print("Time for mixed layout calls: ", xtg.timer(t0))
+
+    assert sum(conversions.values()) == 1
+    np.testing.assert_array_equal(dz2.values, dz1)
+    np.testing.assert_array_equal(bulk2.values, bulk1)
+
+    # a geometry change in place shall invalidate the kept layout
+    grd.translate_coordinates(translate=(0, 0, 100))
+    conversions.clear()
+    grd.get_bulk_volume()
+    assert conversions["1to2"] == 1
+    assert grd.get_dz().values.mean() == pytest.approx(dz1.mean())
+
+    # start from the layout used by get_bulk_volume, so each call below converts
+    grd.keep_both_layouts(False)
+    grd._xtgformat2()
+    conversions.clear()
+    grd.get_dz()
+    grd.get_bulk_volume()
+    grd.get_dz()
+    assert sum(conversions.values()) == 3
+
+
+def test_geometry_cache():
+    """Repeated derived geometry properties shall come from the cache."""
+    grd = Grid()
+    grd.create_box(dimension=(30, 40, 10))
+
+    # the cache is off by default
+    grd.get_bulk_volume()
+    grd.get_bulk_volume()
+    assert grd.geometry_cache_info()["hits"] == 0
+    assert grd.geometry_cache_info()["entries"] == 0
+    grd.set_geometry_cache()
+
+    t0 = xtg.timer()
+    bulk1 = grd.get_bulk_volume()
+    print("Time for bulk volume, computed: ", xtg.timer(t0))
+    t0 = xtg.timer()
+    bulk2 = grd.get_bulk_volume()
+    print("Time for bulk volume, cached: ", xtg.timer(t0))
+
+    info = grd.geometry_cache_info()
+    assert info["hits"] == 1
+    assert info["misses"] == 1
+    assert bulk2 is not bulk1
+    np.testing.assert_array_equal(bulk2.values, bulk1.values)
+
+    # the results are copies, and may be modified
+    bulk2.values += 1.0
+    np.testing.assert_array_equal(grd.get_bulk_volume().values, bulk1.values)
+
+    xyz1 = grd.get_xyz()
+    xyz2 = grd.get_xyz()
+    np.testing.assert_array_equal(xyz2[2].values, xyz1[2].values)
+    assert grd.geometry_cache_info()["entries"] == 2
+
+    # a changed grid shall give new values
+    grd.translate_coordinates(translate=(0, 0, 100))
+    assert grd.geometry_cache_info()["entries"] == 0
+    xyz3 = grd.get_xyz()
+    assert xyz3[2].values.mean() == pytest.approx(xyz1[2].values.mean() + 100)
+
+    # the memory cap evicts the least recently used entries
+    grd.get_dz()
+    grd.set_geometry_cache(maxbytes=xyz3[0].values.nbytes * 3)
+    info = grd.geometry_cache_info()
+    assert info["entries"] == 1
+    assert info["evictions"] == 1
+
+    grd.set_geometry_cache(maxbytes=0)
+    grd.get_dz()
+    assert grd.geometry_cache_info()["entries"] == 0
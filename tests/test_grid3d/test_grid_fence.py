@@ -3,6 +3,9 @@
 
 import os
 
+import numpy as np
+import pytest
+
 import xtgeo
 import tests.test_common.test_xtg as tsetup
 
@@ -115,3 +118,71 @@ def test_randomline_fence_calczminzmax():
         fspec, "PORO", zmin=None, zmax=None
     )
     tsetup.assert_almostequal(vmin, 1548.10098, 0.0001)
+
+
+def test_randomline_fence_index_to_from_file():
+    """Store the fence index to file, and reuse it for a new grid instance."""
+
+    grd = xtgeo.Grid(REEKROOT, fformat="eclipserun", initprops=["PORO"])
+    fence = xtgeo.Polygons(FENCE1)
+    fspec = fence.get_fence(distance=5, nextend=2, asnumpy=True)
+
+    timer1 = xtg.timer()
+    fidx = grd.get_fence_index()
+    print("Make fence index... took {0:5.3f} secs".format(xtg.timer(timer1)))
+    assert fidx.is_valid_for(grd)
+    assert grd.copy().get_fence_index() is fidx
+
+    # the C arrays are made once
+    carrays = fidx.prepare().carrays
+    assert sorted(carrays) == ["basi_carr", "basj_carr", "topi_carr", "topj_carr"]
+    assert fidx.prepare().carrays is carrays
+
+    _, _, vmin1, vmax1, por1 = grd.get_randomline(fspec, "PORO")
+
+    fname = os.path.join(TMPDIR, "reek.fenceindex.npz")
+    fidx.to_file(fname)
+
+    grd2 = xtgeo.Grid(REEKROOT, fformat="eclipserun", initprops=["PORO"])
+    timer1 = xtg.timer()
+    grd2.set_fence_index(fname)
+    print("Load fence index... took {0:5.3f} secs".format(xtg.timer(timer1)))
+
+    _, _, vmin2, vmax2, por2 = grd2.get_randomline(fspec, "PORO")
+    assert vmin1 == vmin2
+    assert vmax1 == vmax2
+    np.testing.assert_allclose(por1, por2)
+
+    # another geometry shall not accept the index
+    grd3 = xtgeo.Grid()
+    with pytest.raises(ValueError, match="not made for this grid"):
+        grd3.set_fence_index(fname)
+
+
+def test_randomlines_batch():
+    """Get several randomlines in one call, and compare with single randomlines."""
+
+    grd = xtgeo.Grid(REEKROOT, fformat="eclipserun", initprops=["PORO"])
+    fence1 = xtgeo.Polygons(FENCE1)
+    fence2 = xtgeo.Polygons(FENCE2)
+
+    fspecs = [
+        fence1.get_fence(distance=5, nextend=2, asnumpy=True),
+        fence2.get_fence(distance=5, nextend=2, asnumpy=True),
+    ]
+
+    timer1 = xtg.timer()
+    result = grd.get_randomlines(
+        fspecs + [fence2], "PORO", zmin=1600, zmax=1750, nthreads=2
+    )
+    print("Batch randomlines... took {0:5.3f} secs".format(xtg.timer(timer1)))
+    assert len(result) == 3
+
+    for fspec, res in zip(fspecs, result):
+        hmin, hmax, _, _, por = grd.get_randomline(fspec, "PORO", zmin=1600, zmax=1750)
+        assert res[0] == pytest.approx(hmin)
+        assert res[1] == pytest.approx(hmax)
+        np.testing.assert_array_equal(res[4], por)
+
+    _, _, _, _, por = grd.get_randomline(fence2, "PORO", zmin=1600, zmax=1750)
+    np.testing.assert_array_equal(result[2][4], por)
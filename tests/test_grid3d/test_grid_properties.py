@@ -2,12 +2,16 @@
 """Testing: test_grid_operations"""
 
 
+import os
+import shutil
 import sys
 import warnings
 
+import numpy as np
 import pytest
 
 from xtgeo.grid3d import Grid
+from xtgeo.grid3d import GridProperty
 from xtgeo.grid3d import GridProperties
 from xtgeo.common import XTGeoDialog
 
@@ -137,6 +141,31 @@ def test_import_restart():
     assert pr.values.mean() == pytest.approx(304.897, abs=0.01), txt
 
 
+def test_import_restart_bulk_vs_single():
+    """Restart properties read in one pass shall equal single property imports."""
+
+    g = Grid()
+    g.from_file(GFILE1, fformat="egrid")
+
+    names = ["PRESSURE", "SWAT", "SGAS", "SOIL"]
+    dates = [19991201, 20010101]
+
+    t0 = xtg.timer()
+    x = GridProperties()
+    x.from_file(RFILE1, fformat="unrst", names=names, dates=dates, grid=g)
+    print("Bulk import of restart: ", xtg.timer(t0))
+
+    assert x.names == [f"{name}_{date}" for name in names for date in dates]
+
+    for name in names:
+        for date in dates:
+            single = GridProperty()
+            single.from_file(RFILE1, fformat="unrst", name=name, date=date, grid=g)
+            prop = x.get_prop_by_name(f"{name}_{date}")
+            assert prop.name == single.name
+            np.testing.assert_array_equal(prop.values, single.values)
+
+
 def test_import_restart_gull():
     """Import Restart Reek"""
 
@@ -224,6 +253,42 @@ def test_scan_keywords():
     assert df.loc[12, "KEYWORD"] == "SWAT"  # pylint: disable=no-member
 
 
+def test_scan_keywords_cached_and_sidecar(tmp_path, monkeypatch):
+    """The keyword index is cached in memory, and optionally in a sidecar file."""
+    import xtgeo.grid3d._grid3d_utils as utils
+
+    rfile = tmp_path / "CACHED.UNRST"
+    shutil.copyfile(RFILE1, rfile)
+
+    t1 = xtg.timer()
+    kw1 = GridProperties.scan_keywords(rfile, dates=True, sidecar=True)
+    print("Keywords scanned in {} seconds".format(xtg.timer(t1)))
+    assert (tmp_path / "CACHED.UNRST.xtgkwindex").is_file()
+
+    t1 = xtg.timer()
+    kw2 = GridProperties.scan_keywords(rfile, dates=True)
+    print("Keywords from cache in {} seconds".format(xtg.timer(t1)))
+    assert kw2 == kw1
+
+    # a new process has no memory cache, but shall use the sidecar, not scan
+    utils._SCANCACHE.clear()
+
+    def _noscan(*_args, **_kwargs):
+        raise AssertionError("File is scanned")
+
+    monkeypatch.setattr(utils, "_scan_ecl_keywords", _noscan)
+    monkeypatch.setattr(utils, "_scan_dates", _noscan)
+    assert GridProperties.scan_keywords(rfile, dates=True) == kw1
+    assert GridProperties.scan_keywords(rfile, maxkeys=10) == [
+        item[0:4] for item in kw1[0:10]
+    ]
+
+    # a changed file (here the modification time) invalidates the index
+    os.utime(rfile, ns=(0, 0))
+    with pytest.raises(AssertionError, match="File is scanned"):
+        GridProperties.scan_keywords(rfile, dates=True)
+
+
 def test_scan_keywords_roff():
     """A static method to scan quickly keywords in a ROFF file"""
     t1 = xtg.timer()
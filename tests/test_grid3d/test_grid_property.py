@@ -472,6 +472,47 @@ def test_grdecl_import_reek():
     tsetup.assert_almostequal(poro.values.mean(), porox.values.mean(), 0.001)
 
 
+def test_grdecl_import_several_repeats():
+    """Import several GRDECL keywords in one pass, with repeat syntax and comments."""
+
+    rgrid = Grid(TESTFILE12A, fformat="grdecl")
+    poro = GridProperty(TESTFILE12B, name="PORO", fformat="grdecl", grid=rgrid)
+
+    exportfile = os.path.join(TMPDIR, "reekporo_and_more.grdecl")
+    poro.to_file(exportfile, fformat="grdecl")
+
+    ntot = rgrid.ntotal
+    with open(exportfile, "a") as stream:
+        stream.write("-- some comment / with slash\n")
+        stream.write("FIPNUM  -- region numbers\n")
+        stream.write(f"{ntot - 3}*3 -- comment\n  1 2*4 /\n")
+        stream.write(f"MULTX\n{ntot - 3}*1.0 3* /\n")
+
+    props = xtgeo.GridProperties()
+    t0 = xtg.timer()
+    props.from_file(
+        exportfile, fformat="grdecl", names=["FIPNUM", "PORO", "MULTX"], grid=rgrid
+    )
+    print("Import GRDECL keywords: ", xtg.timer(t0))
+
+    assert props.names == ["FIPNUM", "PORO", "MULTX"]
+    np.testing.assert_allclose(props.get_prop_by_name("PORO").values, poro.values)
+
+    fipnum = props.get_prop_by_name("FIPNUM").values
+    assert fipnum.mask.sum() == poro.values.mask.sum()
+    vals = fipnum.data.ravel(order="F")
+    assert (vals[: ntot - 3] == 3).all()
+    assert vals.tolist()[-3:] == [1, 4, 4]
+
+    # default values (repeat without value) are masked
+    multx = props.get_prop_by_name("MULTX").values
+    assert multx.mask.ravel(order="F")[-3:].all()
+    assert np.isfinite(multx.compressed()).all()
+
+    with pytest.raises(KeywordNotFoundError):
+        props.from_file(exportfile, fformat="grdecl", names=["XPORO"], grid=rgrid)
+
+
 # def test_export_roff():
 #     """Property import from Eclipse. Then export to roff."""
 
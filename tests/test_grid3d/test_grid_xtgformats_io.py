@@ -199,6 +199,45 @@ def test_grid_export_import_bigcase():
     print("Import bigcase using h5 with compression: ", xtg.timer(t1))
 
 
+@pytest.mark.parametrize("fformat", ["xtgf", "hdf", "roff"])
+def test_grid_partial_read_ijkrange(fformat):
+    """Partial read of grid geometry with ijkrange shall be equal to cropping."""
+    grd1 = xtgeo.Grid(REEKGRID1)
+    ijkrange = (3, 20, 5, 30, 2, 9)
+
+    if fformat == "xtgf":
+        fname = TMPD / "partial.xtgf"
+        grd1.to_xtgf(fname)
+    elif fformat == "hdf":
+        fname = TMPD / "partial.h5"
+        grd1.to_hdf(fname)
+    else:
+        fname = REEKGRID1
+
+    t1 = xtg.timer()
+    grd2 = xtgeo.Grid(fname, ijkrange=ijkrange)
+    print(f"Import partial grid using {fformat}: ", xtg.timer(t1))
+
+    grd1.crop((3, 20), (5, 30), (2, 9))
+
+    assert grd2.dimensions == (18, 26, 8)
+    assert grd2.dimensions == grd1.dimensions
+    grd1._xtgformat2()
+    grd2._xtgformat2()
+    np.testing.assert_allclose(grd2._coordsv, grd1._coordsv)
+    np.testing.assert_allclose(grd2._zcornsv, grd1._zcornsv)
+    np.testing.assert_array_equal(grd2._actnumsv, grd1._actnumsv)
+
+    grd3 = xtgeo.Grid(fname, ijkrange=(2, 19, 4, 29, 1, 8), zerobased=True)
+    assert grd3.dimensions == grd1.dimensions
+
+    grd4 = xtgeo.Grid(fname, ijkrange=("min", 20, 5, "max", 2, 9))
+    assert grd4.dimensions == (20, grd4.nrow, 8)
+
+    with pytest.raises(ValueError, match="exceeds boundaries"):
+        xtgeo.Grid(fname, ijkrange=(1, 500, 1, 2, 1, 2))
+
+
 # ======================================================================================
 # Grid properties:
 
@@ -284,3 +323,24 @@ def test_gridprop_partial_read_bigcase():
 
     logger.info("Timing: speedratio vs gridsizeratio %s %s", readratio, gridratio)
     assert readratio < 0.5
+
+
+@pytest.mark.parametrize("fformat", ["xtgcpprop", "roff"])
+def test_gridprop_partial_read_ijkrange(fformat):
+    """Read a partial property based on ijkrange, compare with cropping."""
+    prop1 = xtgeo.GridProperty(REEKPROP1)
+
+    fname = REEKPROP1
+    if fformat == "xtgcpprop":
+        fname = TMPD / "partial_poro.xtgcpprop"
+        prop1.to_file(fname, fformat=fformat)
+
+    prop2 = xtgeo.GridProperty()
+    prop2.from_file(fname, fformat=fformat, ijkrange=(3, 20, 5, 30, 2, "max"))
+
+    prop1.crop(((3, 20), (5, 30), (2, prop1.nlay)))
+    assert prop2.dimensions == prop1.dimensions
+    np.testing.assert_allclose(prop2.values, prop1.values)
+
+    with pytest.raises(ValueError):
+        prop2.from_file(fname, fformat=fformat, ijrange=(1, 2, 1, 2), ijkrange=(1,) * 6)
@@ -1012,6 +1012,98 @@ def test_value_from_xy():
     assert z is None
 
 
+def test_value_from_xy_arrays():
+    """Get Z values from arrays of XY points, compared with single point calls."""
+
+    x = xtgeo.RegularSurface()
+    x.from_file(TESTSET1, fformat="irap_binary")
+
+    xvals, yvals = x.get_xy_values(asmasked=False)
+    rng = np.random.RandomState(42)
+    xcor = rng.uniform(xvals.min() - 500, xvals.max() + 500, 200000)
+    ycor = rng.uniform(yvals.min() - 500, yvals.max() + 500, 200000)
+    xcor[0], ycor[0] = 460181.036, 5933948.386
+
+    for sampling in ("bilinear", "nearest"):
+        t0 = xtg.timer()
+        zcor = x.get_value_from_xy(point=(xcor, ycor), sampling=sampling)
+        print(f"Sample {xcor.size} points, {sampling}: ", xtg.timer(t0))
+        assert zcor.shape == xcor.shape
+        if sampling == "bilinear":
+            assert_almostequal(zcor[0], 1625.11, 0.01)
+
+        zsingle = np.array(
+            [
+                x.get_value_from_xy(point=(xc, yc), sampling=sampling)
+                for xc, yc in zip(xcor[:2000], ycor[:2000])
+            ],
+            dtype=np.float64,
+        )
+        np.testing.assert_allclose(zcor[:2000], zsingle)
+        assert np.isnan(zcor).any() and not np.isnan(zcor).all()
+
+        zser = x.get_value_from_xy(point=(xcor, ycor), sampling=sampling, nthreads=1)
+        np.testing.assert_array_equal(zcor, zser)
+
+
+def test_values1d_buffer_cached():
+    """The filled 1D values buffer is reused until values are changed."""
+    from xtgeo.surface import _regsurf_utils
+
+    x = xtgeo.RegularSurface()
+    x.from_file(TESTSET1, fformat="irap_binary")
+    point = (460181.036, 5933948.386)
+
+    _regsurf_utils.VALUES_COPIES.clear()
+    t0 = xtg.timer()
+    for _ in range(1000):
+        z = x.get_value_from_xy(point=point)
+    print("Repeated get_value_from_xy: ", xtg.timer(t0))
+    assert _regsurf_utils.VALUES_COPIES["get_value_from_xy"] == 1
+    assert _regsurf_utils.VALUES_COPIES["get_values1d"] == 0
+
+    buffer = _regsurf_utils.values1d_buffer(x)
+    assert not buffer.flags.writeable
+
+    # in place edit through the values property shall be seen
+    x.values += 100.0
+    assert_almostequal(x.get_value_from_xy(point=point), z + 100.0, 0.001)
+    assert _regsurf_utils.VALUES_COPIES["get_value_from_xy"] == 2
+
+    # same for setting new values and in place operators
+    x.values = x.values - 100.0
+    assert_almostequal(x.get_value_from_xy(point=point), z, 0.001)
+    x -= 10.0
+    assert_almostequal(x.get_value_from_xy(point=point), z - 10.0, 0.001)
+    assert _regsurf_utils.VALUES_COPIES["get_value_from_xy"] == 4
+
+    # a reference to the values taken before sampling shall not give a stale
+    # buffer; the values are read only while the buffer is cached
+    vals = x.values
+    zbefore = x.get_value_from_xy(point=point)
+    with pytest.raises(ValueError):
+        vals += 100.0
+    assert_almostequal(x.get_value_from_xy(point=point), zbefore, 0.001)
+
+    # getting the values again gives a writable array, and the edit is seen
+    vals = x.values
+    vals += 100.0
+    assert_almostequal(x.get_value_from_xy(point=point), zbefore + 100.0, 0.001)
+
+    # reading values for describe or statistics keeps the buffer
+    _regsurf_utils.VALUES_COPIES.clear()
+    x.get_value_from_xy(point=point)
+    x.describe(flush=False)
+    x.get_value_from_xy(point=point)
+    assert _regsurf_utils.VALUES_COPIES["get_value_from_xy"] == 1
+
+    # comparisons shall still work after the in place operators
+    y = x.copy()
+    y -= 1.0
+    assert (y < x).all()
+    assert not (y == x).any()
+
+
 def test_fence():
     """Test sampling a fence from a surface."""
 
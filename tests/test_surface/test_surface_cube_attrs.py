@@ -1,8 +1,15 @@
 # -*- coding: utf-8 -*-
 import os
 from os.path import join
+import numpy as np
+import numpy.ma as ma
 import pytest
 import xtgeo
+from xtgeo.surface import (
+    _regsurf_cube_window,
+    _regsurf_cube_window_v2,
+    _surfs_cube_window,
+)
 
 xtg = xtgeo.common.XTGeoDialog()
 logger = xtg.basiclogger(__name__)
@@ -307,3 +314,104 @@ def test_attrs_reek(loadsfile2):
         srf2.to_file(join(TMD, "attr2_" + att + ".gri"))
 
         assert srf1.values.mean() == pytest.approx(srf2.values.mean(), abs=0.005)
+
+
+def test_attrs_reek_batch(loadsfile2):
+    """Slice cube windows for several surfaces and cubes in a process pool."""
+    cube2 = loadsfile2
+    cube3 = cube2.copy()
+    cube3.values *= 2.0
+
+    t2a = xtgeo.RegularSurface(TOP2A)
+    t2b = xtgeo.RegularSurface(TOP2B)
+    surfs = xtgeo.Surfaces([t2a, t2b])
+
+    cubes = {"c2": cube2, "c3": cube3}
+    attlist = ["max", "rms"]
+
+    t0 = xtg.timer()
+    attrs = surfs.slice_cube_window(
+        cubes, zrange=12, attribute=attlist, sampling="trilinear", nprocesses=2
+    )
+    print("Batch slice cube window, 2 processes: ", xtg.timer(t0))
+
+    assert sorted(attrs.keys()) == [(0, "c2"), (0, "c3"), (1, "c2"), (1, "c3")]
+
+    for (isurf, ckey), result in attrs.items():
+        single = surfs.surfaces[isurf].slice_cube_window(
+            cubes[ckey], zrange=12, attribute=attlist, sampling="trilinear"
+        )
+        for att in attlist:
+            assert result[att].values.mean() == pytest.approx(
+                single[att].values.mean(), abs=1e-4
+            )
+
+    assert attrs[(0, "c3")]["max"].values.mean() == pytest.approx(
+        2.0 * attrs[(0, "c2")]["max"].values.mean(), rel=1e-4
+    )
+
+    # a cube memory mapped from xtgregcube is mapped from its file by the workers
+    cfile = join(TMD, "cube_for_batch.xtgregcube")
+    cube2.to_file(cfile, fformat="xtgregcube")
+    mcube = xtgeo.cube_from_file(cfile, fformat="xtgregcube", mmap=True)
+    assert _surfs_cube_window._mapped_file(mcube.values)[0] == os.path.abspath(cfile)
+    assert _surfs_cube_window._mapped_file(cube3.values) is None
+
+    mattrs = surfs.slice_cube_window(
+        {"c2": mcube}, zrange=12, attribute=attlist, sampling="trilinear", nprocesses=2
+    )
+    for (isurf, ckey), result in mattrs.items():
+        for att in attlist:
+            np.testing.assert_allclose(
+                result[att].values, attrs[(isurf, ckey)][att].values, rtol=1e-6
+            )
+
+    # selected jobs, a single attribute and serial run
+    attrs = surfs.slice_cube_window(cubes, jobs=[(1, "c3")], zrange=12, attribute="max")
+    assert list(attrs.keys()) == [(1, "c3")]
+    assert isinstance(attrs[(1, "c3")]["max"], xtgeo.RegularSurface)
+
+
+def test_attvalues_fused_vs_single():
+    """Fused attribute computation vs one pass per attribute (benchmark)."""
+    rng = np.random.RandomState(7)
+    vals = rng.normal(scale=100.0, size=(400, 300, 41))
+    stacked = ma.array(vals, mask=rng.uniform(size=vals.shape) < 0.2)
+    stacked[0, 0, :] = ma.masked
+    attlist = _regsurf_cube_window.ALLATTRS
+
+    t0 = xtg.timer()
+    single = {att: _regsurf_cube_window._attvalues(att, stacked) for att in attlist}
+    print("Attributes, one pass per attribute: ", xtg.timer(t0))
+
+    t0 = xtg.timer()
+    fused = _regsurf_cube_window._attvalues_fused(attlist, stacked)
+    print("Attributes, fused: ", xtg.timer(t0))
+
+    for att in attlist:
+        assert np.array_equal(ma.getmaskarray(single[att]), ma.getmaskarray(fused[att]))
+        np.testing.assert_allclose(
+            ma.filled(single[att], 0.0), ma.filled(fused[att], 0.0), rtol=1e-10
+        )
+
+
+def test_attrs_reek_blocks(loadsfile2, monkeypatch):
+    """Algorithm 2 gives the same result when the C stack is split in blocks."""
+    cube2 = loadsfile2
+    t2a = xtgeo.RegularSurface(TOP2A)
+
+    kwargs = dict(zrange=15, attribute="all", sampling="trilinear", algorithm=2)
+
+    t0 = xtg.timer()
+    attrs1 = t2a.slice_cube_window(cube2, **kwargs)
+    print("All attributes, one block: ", xtg.timer(t0))
+
+    monkeypatch.setattr(_regsurf_cube_window_v2, "MAXSAMPLES_BLOCK", 5000)
+    t0 = xtg.timer()
+    attrs2 = t2a.slice_cube_window(cube2, **kwargs)
+    print("All attributes, small blocks: ", xtg.timer(t0))
+
+    for att, srf in attrs1.items():
+        np.testing.assert_array_equal(
+            ma.filled(srf.values, np.nan), ma.filled(attrs2[att].values, np.nan)
+        )
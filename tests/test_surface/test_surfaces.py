@@ -141,6 +141,52 @@ def test_surfaces_apply():
     assert_almostequal(res.values.mean(), bmean + 10.0, 0.0001)
 
 
+@pytest.mark.parametrize("tilesize", [None, 7])
+def test_surfaces_apply_tiled(tilesize):
+    """Tiled, threaded apply shall give the same result as the stacked version."""
+    base = xtgeo.RegularSurface(TESTSET1A)
+    surfs = []
+    for inum in range(20):
+        tmp = base.copy()
+        tmp.values += float(inum * inum)
+        if inum == 3:
+            tmp.values[10:20, 10:20] = np.ma.masked
+        surfs.append(tmp)
+
+    so = xtgeo.Surfaces(surfs)
+
+    for func, args, kwargs in (
+        (np.nanmean, (), {"axis": 0}),
+        (np.nanpercentile, (10,), {"axis": 0, "interpolation": "nearest"}),
+    ):
+        t0 = xtg.timer()
+        res1 = so.apply(func, *args, **kwargs)
+        print("Apply, stacked: ", xtg.timer(t0))
+        t0 = xtg.timer()
+        res2 = so.apply(func, *args, tiled=True, tilesize=tilesize, **kwargs)
+        print("Apply, tiled: ", xtg.timer(t0))
+
+        np.testing.assert_allclose(
+            res1.values.filled(np.nan), res2.values.filled(np.nan)
+        )
+
+    with pytest.raises(ValueError, match="reduce along axis 0"):
+        so.apply(np.nanmean, tiled=True)
+
+    # lazy loaded surfaces are loaded before the tiles are made
+    flist = []
+    for inum, srf in enumerate(surfs[:5]):
+        fname = join(TMPD, f"surf_tiled_{inum}.gri")
+        srf.to_file(fname)
+        flist.append(fname)
+
+    res1 = xtgeo.Surfaces(flist).apply(np.nanmean, axis=0)
+    res2 = xtgeo.Surfaces(flist, lazy=True).apply(
+        np.nanmean, axis=0, tiled=True, tilesize=tilesize
+    )
+    np.testing.assert_allclose(res1.values.filled(np.nan), res2.values.filled(np.nan))
+
+
 def test_get_surfaces_from_3dgrid():
     """Create surfaces from a 3D grid."""
     mygrid = xtgeo.Grid(TESTSETG1)
@@ -155,3 +201,34 @@ def test_get_surfaces_from_3dgrid():
 
     for srf in surfs.surfaces:
         srf.to_file(join(TMPD, srf.name + ".gri"))
+
+
+@pytest.mark.parametrize("fformat", ["irap_binary", "xtgregsurf", "hdf"])
+def test_statistics_streaming(fformat):
+    """Streaming statistics from lazy loaded files shall match in-memory version."""
+    base = xtgeo.RegularSurface(TESTSET1A)
+    flist = []
+    for inum in range(10):
+        tmp = base.copy()
+        tmp.values += float(inum * inum)
+        if inum == 3:
+            tmp.values[10:20, 10:20] = np.ma.masked
+        fname = join(TMPD, f"surf_stream_{inum}.{fformat}")
+        if fformat == "hdf":
+            tmp.to_hdf(fname)
+        else:
+            tmp.to_file(fname, fformat=fformat)
+        flist.append(fname)
+
+    surfs = xtgeo.Surfaces(flist, lazy=True)
+    assert all(not srf._isloaded for srf in surfs.surfaces)
+
+    res1 = surfs.statistics(percentiles=[10, 50], streaming=True, chunksize=5000)
+    assert all(not srf._isloaded for srf in surfs.surfaces)
+
+    res2 = xtgeo.Surfaces(flist).statistics(percentiles=[10, 50])
+
+    for key in ("mean", "std", "p10", "p50", "median"):
+        np.testing.assert_allclose(
+            res1[key].values.filled(np.nan), res2[key].values.filled(np.nan)
+        )
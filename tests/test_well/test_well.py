@@ -227,6 +227,43 @@ def test_import_as_rms_export_as_hdf_many():
     print("Time for load RMSASC: ", xtg.timer(t0))
 
 
+@pytest.mark.parametrize("lognames", ["all", ["Zonelog", "Poro"], "Poro", ["NOPE"]])
+@pytest.mark.parametrize("wfile", [WFILE, WELL1, WELL4])
+def test_import_engine_fast_vs_python(wfile, lognames):
+    """The fast engine for rms_ascii shall give identical result."""
+    well1 = Well().from_file(wfile, lognames=lognames, engine="python")
+    well2 = Well().from_file(wfile, lognames=lognames, engine="fast")
+
+    pd.testing.assert_frame_equal(well1.dataframe, well2.dataframe)
+    assert well1.name == well2.name
+    assert (well1.xpos, well1.ypos, well1.rkb) == (well2.xpos, well2.ypos, well2.rkb)
+    assert well1.get_wlogs() == well2.get_wlogs()
+
+
+def test_import_engine_fast_many_rows():
+    """Compare timings of rms_ascii engines for a well with many rows."""
+    mywell = Well(WFILE)
+    nrep = 50000 // mywell.nrow + 1
+    mywell.dataframe = pd.concat([mywell.dataframe] * nrep, ignore_index=True)
+    wname = join(TMPD, "many_rows.w")
+    mywell.to_file(wname)
+
+    for lognames in ("all", ["Poro"]):
+        t0 = xtg.timer()
+        well1 = Well().from_file(wname, lognames=lognames, engine="python")
+        print(f"Time for python engine, lognames {lognames}: ", xtg.timer(t0))
+
+        t0 = xtg.timer()
+        well2 = Well().from_file(wname, lognames=lognames, engine="fast")
+        print(f"Time for fast engine, lognames {lognames}: ", xtg.timer(t0))
+
+        assert well2.nrow >= 50000
+        pd.testing.assert_frame_equal(well1.dataframe, well2.dataframe)
+
+    with pytest.raises(ValueError, match="Invalid engine"):
+        Well().from_file(wname, engine="nope")
+
+
 def test_get_carr(loadwell1):
     """Get a C array pointer"""
 
@@ -513,6 +550,35 @@ def test_rescale_well_tvdrange_coarsen_upper():
     tsetup.assert_almostequal(mywell.dataframe.iat[10, 3], 365.8254, 0.1)
 
 
+def test_rescale_well_logs_numpy(loadwell1):
+    """Rescale continuous logs by interpolation, discrete logs by nearest sample."""
+    mywell = loadwell1
+    mywell.geometrics()  # keep the Q_MDEPTH log as MD reference
+    dfr1 = mywell.dataframe.copy()
+
+    t0 = xtg.timer()
+    mywell.rescale(delta=0.15)
+    print("Time for rescaling well: ", xtg.timer(t0))
+
+    dfr2 = mywell.dataframe
+    assert len(dfr2) > len(dfr1)
+
+    # no new discrete codes, such as rounded averages of neighbour codes
+    zones1 = set(dfr1["Zonelog"].dropna().unique())
+    assert set(dfr2["Zonelog"].dropna().unique()) <= zones1
+
+    md1 = dfr1["Q_MDEPTH"].values
+    poro1 = dfr1["Poro"].values
+    valid = ~np.isnan(poro1)
+    md2 = dfr2["Q_MDEPTH"].values
+    inside = (md2 >= md1[valid][0]) & (md2 <= md1[valid][-1])
+    np.testing.assert_allclose(
+        dfr2["Poro"].values[inside],
+        np.interp(md2[inside], md1[valid], poro1[valid]),
+    )
+    assert np.isnan(dfr2["Poro"].values[~inside]).all()
+
+
 def test_fence():
     """Return a resampled fence."""
 
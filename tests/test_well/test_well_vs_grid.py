@@ -6,7 +6,7 @@ from os.path import join
 import pytest
 
 
-from xtgeo.well import Well
+from xtgeo.well import Well, Wells
 from xtgeo.grid3d import Grid, GridProperty
 from xtgeo.common import XTGeoDialog
 
@@ -77,6 +77,31 @@ def test_make_ijk_grid(loadwell1, loadgrid1):
     assert int(df.iloc[4775]["KCELL"]) == 1
 
 
+def test_make_ijk_grid_many_wells(loadwell1, loadgrid1):
+    """Make I J K logs for many wells in one batch, vs one well at the time"""
+
+    mygrid = loadgrid1
+    wells1 = [loadwell1.copy() for _ in range(20)]
+    wells2 = Wells()
+    wells2.wells = [wll.copy() for wll in wells1]
+
+    t0 = xtg.timer()
+    for wll in wells1:
+        wll.make_ijk_from_grid(mygrid)
+    print(f"Make IJK for {len(wells1)} wells one by one: ", xtg.timer(t0))
+
+    t0 = xtg.timer()
+    wells2.make_ijk_from_grid(mygrid)
+    print(f"Make IJK for {len(wells1)} wells in batch: ", xtg.timer(t0))
+
+    for wll1, wll2 in zip(wells1, wells2.wells):
+        assert wll1.dataframe.equals(wll2.dataframe)
+
+    df = wells2.wells[-1].dataframe
+    assert int(df.iloc[4850]["ICELL"]) == 29
+    assert int(df.iloc[4850]["KCELL"]) == 13
+
+
 @tsetup.equinor
 @tsetup.bigtest
 def test_make_ijk_gf_geogrid():
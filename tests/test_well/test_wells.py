@@ -5,8 +5,13 @@ from os.path import join as ojoin
 import glob
 import pytest
 
+import numpy as np
+import pandas as pd
+import shapely.geometry as sg
+
 from xtgeo.well import Well
 from xtgeo.well import Wells
+from xtgeo.well import _wells_utils
 from xtgeo.common import XTGeoDialog
 
 import tests.test_common.test_xtg as tsetup
@@ -141,3 +146,114 @@ def test_wellintersections_tvdrange_wfilter(loadwells1):
     dfr = mywells.wellintersections(wfilter=wfilter)
     dfr.to_csv(ojoin(td, "wells_crossings_filter.csv"))
     print(dfr)
+
+
+@pytest.mark.parametrize("nprocesses", [None, 3])
+def test_wellintersections_index_vs_bruteforce(loadwells1, nprocesses):
+    """Crossings using segment index (optionally parallel) vs all well pairs."""
+    wfilter = {
+        "parallel": {"xtol": 4.0, "ytol": 4.0, "ztol": 2.0, "itol": 10, "atol": 5.0}
+    }
+
+    mywells = Wells()
+    mywells.wells = loadwells1
+    mywells.limit_tvd(1300, 1400)
+    mywells.downsample(interval=6)
+
+    t0 = xtg.timer()
+    dfr1 = _wells_utils.wellintersections(mywells, wfilter=wfilter, useindex=False)
+    print("Time for all well pairs: ", xtg.timer(t0))
+
+    t0 = xtg.timer()
+    dfr2 = mywells.wellintersections(wfilter=wfilter, nprocesses=nprocesses)
+    print(f"Time for index (nprocesses={nprocesses}): ", xtg.timer(t0))
+
+    assert not dfr1.empty
+    pd.testing.assert_frame_equal(dfr1, dfr2)
+
+
+def test_segment_index_candidates():
+    """All well pairs that cross in XY shall be candidates from the segment index."""
+    wells = []
+    for wfile in sorted(glob.glob(WFILES)):
+        wells.append(Well(wfile))
+
+    candidates = _wells_utils.segment_index_candidates(wells)
+    for iwell, cand in enumerate(candidates):
+        assert iwell not in cand
+        for jwell in cand:
+            assert iwell in candidates[jwell]
+
+    # brute force over all pairs
+    lines = [
+        sg.LineString(np.stack([wll.dataframe["X_UTME"], wll.dataframe["Y_UTMN"]], 1))
+        for wll in wells
+    ]
+    crossings = [
+        (iwell, jwell)
+        for iwell in range(len(wells))
+        for jwell in range(iwell + 1, len(wells))
+        if lines[iwell].intersects(lines[jwell])
+    ]
+    assert crossings
+    for iwell, jwell in crossings:
+        assert jwell in candidates[iwell]
+
+
+def test_import_wells_nprocesses():
+    """Import a generated batch of wells, serial vs a process pool (benchmark)."""
+    wfiles = sorted(glob.glob(WFILES))
+    batch = []
+    for inum in range(20):
+        for wfile in wfiles:
+            wll = Well(wfile)
+            wll.name = f"{wll.name}_{inum}"
+            fname = ojoin(td, f"batch_{wll.name}.rmswell")
+            wll.to_file(fname)
+            batch.append(fname)
+
+    t0 = xtg.timer()
+    wells1 = Wells(batch)
+    print(f"Import {len(batch)} wells serial: ", xtg.timer(t0))
+
+    t0 = xtg.timer()
+    wells2 = Wells(batch, nprocesses=4)
+    print(f"Import {len(batch)} wells with 4 processes: ", xtg.timer(t0))
+
+    assert wells1.names == wells2.names
+    for wll1, wll2 in zip(wells1.wells, wells2.wells):
+        assert wll1.dataframe.equals(wll2.dataframe)
+
+
+def test_import_wells_nprocesses_with_errors():
+    """A well that fails in import is skipped, and the order is kept."""
+    wfiles = sorted(glob.glob(WFILES))
+    mywells = Wells()
+    mywells.from_files(
+        wfiles, mdlogname="NOSUCHLOG", strict=False, nprocesses=2, append=False
+    )
+    assert len(mywells.wells) == len(wfiles)
+
+    mywells.from_files(
+        wfiles, mdlogname="NOSUCHLOG", strict=True, nprocesses=2, append=False
+    )
+    assert mywells.wells is None
+
+
+def test_rescale_wells_nthreads(loadwells1):
+    """Rescale many wells, serial vs a thread pool."""
+    wells1 = Wells()
+    wells1.wells = [wll.copy() for wll in loadwells1 for _ in range(10)]
+    wells2 = Wells()
+    wells2.wells = [wll.copy() for wll in wells1.wells]
+
+    t0 = xtg.timer()
+    wells1.rescale(delta=0.15)
+    print(f"Rescale {len(wells1.wells)} wells serial: ", xtg.timer(t0))
+
+    t0 = xtg.timer()
+    wells2.rescale(delta=0.15, nthreads=4)
+    print(f"Rescale {len(wells2.wells)} wells with 4 threads: ", xtg.timer(t0))
+
+    for wll1, wll2 in zip(wells1.wells, wells2.wells):
+        assert wll1.dataframe.equals(wll2.dataframe)
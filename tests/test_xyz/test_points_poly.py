@@ -250,6 +250,57 @@ def test_points_in_polygon():
     assert poi.nrow == 1
 
 
+def test_points_in_several_polygons():
+    """Operations on many points vs overlapping polygons, compared to box tests."""
+
+    # two overlapping squares, the second one rotated 45 degrees as a diamond
+    pol = Polygons(
+        [
+            (0.0, 0.0, 10.0, 0),
+            (100.0, 0.0, 10.0, 0),
+            (100.0, 100.0, 10.0, 0),
+            (0.0, 100.0, 10.0, 0),
+            (0.0, 0.0, 10.0, 0),
+            (100.0, 50.0, 20.0, 1),
+            (150.0, 100.0, 20.0, 1),
+            (100.0, 150.0, 20.0, 1),
+            (50.0, 100.0, 20.0, 1),
+            (100.0, 50.0, 20.0, 1),
+        ]
+    )
+
+    rng = np.random.RandomState(123)
+    xcor = rng.uniform(-50, 200, 200000)
+    ycor = rng.uniform(-50, 200, 200000)
+    # some points exactly on edges and vertices are regarded as inside
+    xcor[:3] = [50.0, 100.0, 125.0]
+    ycor[:3] = [0.0, 100.0, 75.0]
+
+    insq = (xcor >= 0) & (xcor <= 100) & (ycor >= 0) & (ycor <= 100)
+    indi = np.abs(xcor - 100) + np.abs(ycor - 100) <= 50
+    assert insq[:2].all() and indi[1:3].all()
+
+    def _points():
+        return Points(list(zip(xcor, ycor, np.zeros_like(xcor))))
+
+    poi = _points()
+    t0 = xtg.timer()
+    poi.operation_polygons(pol, 1.0, opname="add", inside=True)
+    print("Add inside several polygons: ", xtg.timer(t0))
+    zval = poi.dataframe[poi.zname].values
+    np.testing.assert_array_equal(zval, insq.astype(float) + indi.astype(float))
+
+    poi = _points()
+    poi.operation_polygons(pol, "poly", opname="set", inside=True)
+    zval = poi.dataframe[poi.zname].values
+    expected = np.where(indi, 20.0, np.where(insq, 10.0, 0.0))
+    np.testing.assert_array_equal(zval, expected)
+
+    poi = _points()
+    poi.operation_polygons(pol, 0, opname="eli", inside=False)
+    assert poi.nrow == np.count_nonzero(insq & indi)
+
+
 def test_rescale_polygon():
     """Take a polygons set and rescale/resample"""
 